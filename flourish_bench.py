@@ -0,0 +1,479 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from flourish_maker import (
+    ENGINES,
+    compare_rows,
+    compute_per_second_series,
+    compute_series_batch,
+    np,
+    resolve_engine,
+    trim_csv_passthrough,
+    write_flourish_wide_csv,
+)
+
+
+# Column layout of a FrameView 1.x log (see example_input.csv)
+FRAMEVIEW_HEADER = [
+    "Application",
+    "GPU",
+    "CPU",
+    "Resolution",
+    "Runtime",
+    "AllowsTearing",
+    "ProcessID",
+    "SwapChainAddress",
+    "SyncInterval",
+    "PresentFlags",
+    "PresentMode",
+    "Dropped",
+    "FlipToken",
+    "TimeInSeconds",
+    "MsBetweenSimulationStart",
+    "MsBetweenPresents",
+    "MsBetweenDisplayChange",
+    "MsInPresentAPI",
+    "MsRenderPresentLatency",
+    "MsUntilDisplayed",
+    "Render Queue Depth",
+    "MsPCLatency",
+    "GPU0Clk(MHz)",
+    "GPU0MemClk(MHz)",
+    "GPU0Util(%)",
+    "GPU0Temp(C)",
+    "GPU1Clk(MHz)",
+    "GPU1MemClk(MHz)",
+    "GPU1Util(%)",
+    "GPU1Temp(C)",
+    "PCAT Power Total(W)",
+    "Perf/W Total(F/J) (PCAT)",
+    "Perf/W Total(F/J) (API)",
+    "Perf/W GPUOnly(F/J) (API)",
+    "Perf/W Total-USBC(F/J) (API)",
+    "GPUOnlyPwr(W) (API)",
+    "NV-Total-USBCPwr(W) (API)",
+    "NV Pwr(W) (API)",
+    "AMDPwr(W) (API)",
+    "CPUClk(MHz)",
+    "CPUUtil(%)",
+    "CPU Package Temp(C)",
+    "CPU Package Power(W)",
+    "CPU TDP (W)",
+    *[f"CPUCoreUtil%[{i:2d}]" for i in range(64)],
+    "Current Battery Capacity(Wh)",
+    "Total Battery Capacity(Wh)",
+    "Battery Percentage",
+    "Battery Drain Rate(W)",
+]
+
+# Columns 0-12 are constant per capture; the generator fills 13-24 per frame
+_STATIC_PREFIX = [
+    "Bench.exe",
+    "NVIDIA GeForce RTX 4070",
+    "AMD Ryzen 7 5700X3D 8-Core Processor           ",
+    "2560x1440",
+    "D3D12",
+    "0",
+    "20816",
+    "0x0000000019ACFCC8",
+    "1",
+    "0",
+    "Hardware: Independent Flip",
+]
+# Columns 25 onwards: temperatures, power and CPU cores, mostly NA
+_STATIC_SUFFIX = (
+    ["49", "NA", "NA", "NA", "NA", "NA", "NA"]
+    + ["1.221", "1.890", "1.221", "148", "229", "229", "NA"]
+    + ["4025", "32", " 50", "48.549", "NA"]
+    + ["40", "63", "53", "58", "28", "43", "28", "35"]
+    + ["24", "28", "22", "23", "19", "20", "18", "19"]
+    + ["NA"] * 48
+    + ["NA"] * 4
+)
+
+DISTRIBUTIONS = ("normal", "lognormal", "stutter", "constant")
+
+
+def _frame_time_sampler(
+    rng: random.Random, dist: str, fps: float, jitter: float
+) -> Callable[[], float]:
+    """Return a function drawing frame times in ms around 1000 / fps."""
+    mean_ms = 1000.0 / fps
+    if dist == "constant":
+        return lambda: mean_ms
+    if dist == "normal":
+        sigma = mean_ms * jitter
+        return lambda: max(0.1, rng.gauss(mean_ms, sigma))
+    # Log-normal with the requested mean; jitter is its coefficient of variation
+    sigma = math.sqrt(math.log1p(jitter * jitter))
+    mu = math.log(mean_ms) - sigma * sigma / 2
+    if dist == "lognormal":
+        return lambda: rng.lognormvariate(mu, sigma)
+    if dist == "stutter":
+        # Mostly smooth frames with occasional 3-8x hitches
+        def sample() -> float:
+            ms = rng.lognormvariate(mu, sigma)
+            if rng.random() < 0.01:
+                ms *= rng.uniform(3.0, 8.0)
+            return ms
+
+        return sample
+    raise ValueError(f"Unsupported distribution: {dist}")
+
+
+def generate_log(
+    output_path: Path,
+    rows: int,
+    seed: int = 0,
+    dist: str = "lognormal",
+    fps: float = 144.0,
+    jitter: float = 0.15,
+    na_rate: float = 0.02,
+    decimal_comma: bool = False,
+) -> int:
+    """
+    Write a synthetic FrameView log with ``rows`` frames and return its size
+    in bytes. Frame times follow ``dist`` around ``fps``; ``na_rate`` of the
+    frames have NA display columns (as for frames that never reached the
+    screen). With ``decimal_comma`` decimals use "," and are quoted, as in
+    logs captured under a comma-decimal locale. Rows are written in blocks,
+    so memory stays flat from 10k to 100M rows.
+    """
+    rng = random.Random(seed)
+    frame_time = _frame_time_sampler(rng, dist, fps, jitter)
+    prefix = ",".join(_STATIC_PREFIX) + ","
+    suffix = "," + ",".join(_STATIC_SUFFIX) + "\n"
+
+    if decimal_comma:
+
+        def num(value: float, digits: int) -> str:
+            return '"' + f"{value:.{digits}f}".replace(".", ",") + '"'
+
+    else:
+
+        def num(value: float, digits: int) -> str:
+            return f"{value:.{digits}f}"
+
+    t = 3.889042
+    block: List[str] = []
+    with output_path.open("w", newline="", encoding="utf-8") as f:
+        f.write(",".join(FRAMEVIEW_HEADER) + "\n")
+        for _ in range(rows):
+            ms = frame_time()
+            t += ms / 1000.0
+            dropped = rng.random() < na_rate
+            if dropped:
+                display = "NA,"
+                until = "NA"
+            else:
+                display = num(ms * rng.uniform(0.9, 1.1), 3) + ","
+                until = num(ms * 3.0 + rng.uniform(0.0, 2.0), 3)
+            block.append(
+                prefix
+                + ("1," if dropped else "0,")
+                + "0,"
+                + num(t, 6)
+                + ",NA,"
+                + num(ms, 3)
+                + ","
+                + display
+                + num(ms * rng.uniform(0.3, 0.7), 3)
+                + ","
+                + num(ms * rng.uniform(0.8, 1.3), 3)
+                + ","
+                + until
+                + ","
+                + num(rng.uniform(0.2, 1.9), 3)
+                + ",NA,2010,10096,"
+                + str(rng.randint(35, 99))
+                + suffix
+            )
+            if len(block) >= 10_000:
+                f.write("".join(block))
+                block.clear()
+        f.write("".join(block))
+    return output_path.stat().st_size
+
+
+def _measure(
+    fn: Callable[[], object], repeat: int, memory: bool
+) -> Tuple[float, Optional[float]]:
+    """Best wall time over ``repeat`` runs, then peak traced memory in MB."""
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    peak_mb: Optional[float] = None
+    if memory:
+        # Separate run: tracing slows allocation-heavy code down
+        tracemalloc.start()
+        try:
+            fn()
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+    return best, peak_mb
+
+
+def run_benchmarks(
+    sizes: List[int],
+    workdir: Path,
+    engine: str = "auto",
+    repeat: int = 1,
+    memory: bool = True,
+    dist: str = "lognormal",
+    decimal_comma: bool = False,
+) -> Dict[str, object]:
+    """
+    Time the main code paths on generated logs of each size and return a
+    JSON-ready report. Logs are generated once per size into ``workdir`` and
+    reused by later runs. Stages: series (compute_per_second_series), trim
+    (trim_csv_passthrough), write (write_flourish_wide_csv; its rows are the
+    output bins and its bytes the output size) and compare (the CLI and GUI
+    compare path: compute_series_batch over two logs, compare_rows and
+    write).
+    """
+    engine = resolve_engine(engine)
+    workdir.mkdir(parents=True, exist_ok=True)
+    locale_tag = "comma" if decimal_comma else "dot"
+    results: List[Dict[str, object]] = []
+
+    for rows in sizes:
+        logs: List[Path] = []
+        for seed in (1, 2):
+            path = workdir / f"FrameView_bench_{rows}_{dist}_{locale_tag}_{seed}.csv"
+            if not path.exists():
+                print(f"Generating {path} ...", flush=True)
+                tmp = path.with_name(path.name + ".tmp")
+                generate_log(tmp, rows, seed=seed, dist=dist, decimal_comma=decimal_comma)
+                os.replace(tmp, path)
+            logs.append(path)
+        log_a, log_b = logs
+        size_a = log_a.stat().st_size
+        trim_out = workdir / "bench_trim_out.csv"
+        wide_out = workdir / "bench_wide_out.csv"
+
+        series_rows = [compute_per_second_series(log_a, "avg_fps", engine=engine)]
+        n_bins = len(series_rows[0][1])
+
+        def compare() -> None:
+            loaded = compute_series_batch([log_a, log_b], ["avg_fps"], engine=engine)
+            rows = [(name, results["avg_fps"]) for name, results in loaded]
+            write_flourish_wide_csv(wide_out, compare_rows(rows, engine=engine))
+
+        # (stage, work, rows processed, bytes read or None for bytes written)
+        stages: List[Tuple[str, Callable[[], object], int, Optional[int]]] = [
+            (
+                "series",
+                lambda: compute_per_second_series(log_a, "avg_fps", engine=engine),
+                rows,
+                size_a,
+            ),
+            (
+                "trim",
+                lambda: trim_csv_passthrough(log_a, trim_out, 2.0, 2.0),
+                rows,
+                size_a,
+            ),
+            (
+                "write",
+                lambda: write_flourish_wide_csv(wide_out, series_rows),
+                n_bins,
+                None,
+            ),
+            ("compare", compare, 2 * rows, size_a + log_b.stat().st_size),
+        ]
+        for stage, fn, n_rows, n_bytes in stages:
+            seconds, peak_mb = _measure(fn, repeat, memory)
+            if n_bytes is None:
+                n_bytes = wide_out.stat().st_size
+            result = {
+                "stage": stage,
+                "rows": n_rows,
+                "bytes": n_bytes,
+                "seconds": seconds,
+                "rows_per_s": n_rows / seconds if seconds > 0 else None,
+                "mb_per_s": n_bytes / (1024 * 1024) / seconds if seconds > 0 else None,
+                "peak_mb": peak_mb,
+            }
+            results.append(result)
+            print(
+                f"{rows:>11,} rows  {stage:<8} {seconds:8.3f} s  "
+                f"{result['rows_per_s'] or 0:>13,.0f} rows/s  "
+                f"{result['mb_per_s'] or 0:8.1f} MB/s"
+                + (f"  peak {peak_mb:7.1f} MB" if peak_mb is not None else ""),
+                flush=True,
+            )
+        for tmp_out in (trim_out, wide_out):
+            try:
+                tmp_out.unlink()
+            except OSError:
+                pass
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": None if np is None else np.__version__,
+        "engine": engine,
+        "distribution": dist,
+        "decimal_comma": decimal_comma,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare_reports(old: Dict[str, object], new: Dict[str, object]) -> List[str]:
+    """Lines comparing two run_benchmarks reports stage by stage."""
+    before = {(r["stage"], r["rows"]): r for r in old["results"]}  # type: ignore[index]
+    lines = [f"{'stage':<8} {'rows':>11}  {'old s':>9}  {'new s':>9}  speedup"]
+    for r in new["results"]:  # type: ignore[union-attr]
+        prev = before.get((r["stage"], r["rows"]))
+        if prev is None:
+            continue
+        speedup = prev["seconds"] / r["seconds"] if r["seconds"] > 0 else math.inf
+        lines.append(
+            f"{r['stage']:<8} {r['rows']:>11,}  {prev['seconds']:9.3f}  "
+            f"{r['seconds']:9.3f}  {speedup:6.2f}x"
+        )
+    return lines
+
+
+def _parse_sizes(text: str) -> List[int]:
+    sizes = []
+    for token in text.split(","):
+        token = token.strip().lower().replace("_", "")
+        if not token:
+            continue
+        scale = 1
+        if token[-1] in "km":
+            scale = 1000 if token[-1] == "k" else 1_000_000
+            token = token[:-1]
+        sizes.append(int(float(token) * scale))
+    return sizes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Synthetic FrameView logs and throughput benchmarks."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="Write one synthetic FrameView log")
+    gen.add_argument("output", type=str, help="CSV path to write")
+    gen.add_argument(
+        "--rows", type=str, default="10k", help="Frames to write, e.g. 10k, 5m"
+    )
+    gen.add_argument("--seed", type=int, default=0)
+    gen.add_argument(
+        "--dist",
+        type=str,
+        default="lognormal",
+        choices=DISTRIBUTIONS,
+        help="Frame-time distribution (default: lognormal)",
+    )
+    gen.add_argument("--fps", type=float, default=144.0, help="Mean FPS (default: 144)")
+    gen.add_argument(
+        "--jitter",
+        type=float,
+        default=0.15,
+        help="Frame-time spread as a fraction of the mean (default: 0.15)",
+    )
+    gen.add_argument(
+        "--na-rate",
+        type=float,
+        default=0.02,
+        help="Fraction of frames with NA display columns (default: 0.02)",
+    )
+    gen.add_argument(
+        "--decimal-comma",
+        action="store_true",
+        help="Write quoted comma decimals like a comma-locale capture",
+    )
+
+    run = sub.add_parser("run", help="Time the toolkit on generated logs")
+    run.add_argument(
+        "--sizes",
+        type=str,
+        default="10k,100k,1m",
+        help="Comma-separated row counts (default: 10k,100k,1m)",
+    )
+    run.add_argument(
+        "--workdir",
+        type=str,
+        default="bench_data",
+        help="Folder for generated logs, reused between runs (default: bench_data)",
+    )
+    run.add_argument(
+        "--output",
+        type=str,
+        default="bench_results.json",
+        help="JSON report path (default: bench_results.json)",
+    )
+    run.add_argument("--engine", type=str, default="auto", choices=list(ENGINES))
+    run.add_argument(
+        "--repeat", type=int, default=1, help="Runs per stage; best time is kept"
+    )
+    run.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the extra traced run that measures peak memory",
+    )
+    run.add_argument(
+        "--dist", type=str, default="lognormal", choices=DISTRIBUTIONS
+    )
+    run.add_argument("--decimal-comma", action="store_true")
+
+    cmp_parser = sub.add_parser("compare", help="Compare two JSON reports")
+    cmp_parser.add_argument("old", type=str)
+    cmp_parser.add_argument("new", type=str)
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        size = generate_log(
+            Path(args.output),
+            _parse_sizes(args.rows)[0],
+            seed=args.seed,
+            dist=args.dist,
+            fps=args.fps,
+            jitter=args.jitter,
+            na_rate=args.na_rate,
+            decimal_comma=args.decimal_comma,
+        )
+        print(f"Wrote {args.output} ({size / (1024 * 1024):.1f} MB).")
+    elif args.command == "run":
+        report = run_benchmarks(
+            _parse_sizes(args.sizes),
+            Path(args.workdir),
+            engine=args.engine,
+            repeat=max(1, args.repeat),
+            memory=not args.no_memory,
+            dist=args.dist,
+            decimal_comma=args.decimal_comma,
+        )
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}.")
+    else:
+        with open(args.old, encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.new, encoding="utf-8") as f:
+            new = json.load(f)
+        for line in compare_reports(old, new):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
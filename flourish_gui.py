@@ -1,17 +1,37 @@
+import os
+import queue
+import threading
+import time
 import tkinter as tk
-from tkinter import filedialog, messagebox, simpledialog
+from tkinter import filedialog, messagebox, simpledialog, ttk
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from flourish_maker import (
+    CATALOG_FILE,
+    CancelToken,
+    FileProfile,
+    LogCatalog,
     MetricKind,
-    compute_difference_series,
-    compute_per_second_series,
+    OperationCancelled,
+    compare_rows,
+    compute_series_batch,
     discover_input_files,
+    downsample_rows,
+    log_stem,
+    parse_catalog_filter,
+    read_log_info,
+    read_time_span,
     trim_csv_passthrough,
+    trim_output_path,
     write_flourish_wide_csv,
+    write_profile_report,
+    write_trim_manifest,
 )
 
+# Rows added to the file list per UI event while a scan result is listed
+_LIST_CHUNK = 500
+
 
 LANG_TEXTS = {
     "en": {
@@ -21,6 +41,11 @@ LANG_TEXTS = {
         "browse": "Browse…",
         "glob": "Glob pattern:",
         "refresh": "Refresh",
+        "catalog": "Catalog filter:",
+        "catalog_search": "Search catalog",
+        "status_catalog_scan": "Updating the log catalog…",
+        "status_catalog": "Catalog: {n} matching file(s)",
+        "err_catalog": "Catalog search failed",
         "select_logs": "Select logs (multiple allowed)",
         "select_all": "Select all",
         "clear": "Clear",
@@ -30,13 +55,25 @@ LANG_TEXTS = {
         "fps_mode": "FPS mode:",
         "fps_per_mean": "Per-frame mean",
         "fps_count": "Count",
-        "compare": "Compare mode (exactly 2 logs)",
+        "compare": "Compare mode (baseline + candidates)",
         "enable_compare": "Enable compare",
         "diff_only": "Difference only row",
         "output": "Output",
         "generate": "Generate",
+        "cancel": "Cancel",
+        "tt_cancel": "Stop the running generation",
         "status_found": "Found {n} file(s)",
-        "status_compare": "Compare mode: select exactly 2 logs",
+        "status_scanning": "Scanning…",
+        "status_listing": "Listing files: {done}/{total}",
+        "filter": "Filter:",
+        "tt_filter": "Show only files whose path contains this text",
+        "status_running": "Processing {done}/{total}: {name}",
+        "status_cancelling": "Cancelling…",
+        "status_cancelled": "Cancelled",
+        "status_compare": (
+            "Compare mode: select the baseline (topmost selected log) and "
+            "one or more candidates"
+        ),
         "err_scan": "Failed to scan directory",
         "err_need_two": "Compare mode requires exactly 2 selected logs",
         "err_select_one": "Select at least one log to process",
@@ -45,6 +82,9 @@ LANG_TEXTS = {
             ("Average FPS (display)", "avg_fps"),
             ("Present FPS", "present_fps"),
             ("Display FPS", "display_fps"),
+            ("1% low FPS", "p1_low_fps"),
+            ("0.1% low FPS", "p01_low_fps"),
+            ("Frame time p99 (ms)", "frametime_p99"),
             ("Custom column…", "__custom__"),
         ],
         "fps_opts": [
@@ -53,6 +93,11 @@ LANG_TEXTS = {
         ],
         "tt_dir": "Folder with FrameView CSV logs (e.g., in)",
         "tt_glob": "Optional file pattern (e.g., FrameView_*Log.csv)",
+        "tt_catalog": (
+            "Filters separated by ';', e.g. application=cyberpunk; gpu=4090; "
+            "duration>=60. Subfolders are indexed into "
+            f"{CATALOG_FILE}; only new or changed logs are read"
+        ),
         "tt_files": "Select any combination of logs to include",
         "tt_select_all": "Select all listed logs",
         "tt_clear": "Clear the selection",
@@ -74,26 +119,60 @@ LANG_TEXTS = {
             "Count: number of frames/presents per second (not FPS)."
         ),
         "tt_enable_compare": (
-            "Enable A/B compare. Select exactly two logs. Adds a third row with "
-            "per‑second % difference relative to the first: 100×(B/A − 1)."
+            "Compare logs against a baseline. Select two or more logs; the "
+            "topmost selected one is the baseline. Adds a per‑second % "
+            "difference row per other log: 100×(B/A − 1)."
         ),
-        "tt_diff_only": "Output only the % difference row (no originals)",
+        "tt_diff_only": "Output only the % difference rows (no originals)",
         "tt_output": "Destination CSV file path",
         "tt_generate": "Create Flourish CSV",
         "trim": "Trim",
         "trim_start": "Start (sec):",
         "trim_end": "End (sec):",
         "trim_configure": "Configure…",
+        "trim_export": "Export manifest…",
+        "tt_trim_export": (
+            "Save the trims of the selected logs (or of every individually "
+            "configured log) as a manifest for: flourish_maker.py trim MANIFEST"
+        ),
+        "trim_export_done": "Saved trim manifest for {n} file(s): {path}",
         "trim_title": "Configure Trim Settings",
         "trim_global": "Apply to all selected files",
         "trim_individual": "Configure individually",
         "trim_per_file": "Per-file Settings",
+        "trim_duration": "Duration",
         "tt_trim": (
             "Trim seconds from the beginning and end of data. "
             "Click Configure to set per-file settings."
         ),
         "trim_passthrough": "Trim File",
         "tt_trim_passthrough": "Create trimmed copy of this file without conversion",
+        "jobs": "Parallel jobs:",
+        "tt_jobs": (
+            "Number of worker processes used to parse logs. "
+            "1 parses in the window's own process."
+        ),
+        "bin_width": "Bin (s):",
+        "tt_bin_width": (
+            "Width of each timeline column in seconds, "
+            "e.g. 0.25 for smoother animations or 60 for long tests."
+        ),
+        "downsample": "Steps:",
+        "tt_downsample": (
+            "Reduce every row, the % rows included, to about this many timeline "
+            "steps while keeping stutters visible (e.g. 300); 0 keeps every bin. "
+            "LTTB keeps one shape-preserving value per step, Min/max the lowest "
+            "and highest value of each pair of steps."
+        ),
+        "downsample_opts": [
+            ("LTTB", "lttb"),
+            ("Min/max", "minmax"),
+        ],
+        "profile": "Profile",
+        "tt_profile": (
+            "Time each stage (read, tokenize, parse, write; binning as the "
+            "remainder) per log and save <output>_profile.json next to the output."
+        ),
         "rename_title": "Rename label",
         "rename_prompt": (
             "Enter name of column (label) for:\n{file}\n"
@@ -107,6 +186,11 @@ LANG_TEXTS = {
         "browse": "Выбрать…",
         "glob": "Шаблон файлов:",
         "refresh": "Обновить",
+        "catalog": "Фильтр каталога:",
+        "catalog_search": "Поиск в каталоге",
+        "status_catalog_scan": "Обновление каталога логов…",
+        "status_catalog": "Каталог: подходящих файлов: {n}",
+        "err_catalog": "Не удалось выполнить поиск в каталоге",
         "select_logs": "Выберите логи (можно несколько)",
         "select_all": "Выделить все",
         "clear": "Снять выделение",
@@ -116,13 +200,25 @@ LANG_TEXTS = {
         "fps_mode": "Режим FPS:",
         "fps_per_mean": "Среднее по кадрам",
         "fps_count": "Количество кадров",
-        "compare": "Сравнение (ровно 2 лога)",
+        "compare": "Сравнение (эталон + кандидаты)",
         "enable_compare": "Включить сравнение",
         "diff_only": "Только строка разницы",
         "output": "Выходной файл",
         "generate": "Сформировать",
+        "cancel": "Отмена",
+        "tt_cancel": "Остановить текущую генерацию",
         "status_found": "Найдено файлов: {n}",
-        "status_compare": "Режим сравнения: выберите ровно 2 лога",
+        "status_scanning": "Поиск файлов…",
+        "status_listing": "Добавление файлов: {done}/{total}",
+        "filter": "Фильтр:",
+        "tt_filter": "Показывать только файлы, путь которых содержит этот текст",
+        "status_running": "Обработка {done}/{total}: {name}",
+        "status_cancelling": "Отмена…",
+        "status_cancelled": "Отменено",
+        "status_compare": (
+            "Режим сравнения: выберите эталон (верхний из выбранных логов) "
+            "и один или несколько кандидатов"
+        ),
         "err_scan": "Не удалось прочитать папку",
         "err_need_two": "Для сравнения нужно выбрать ровно 2 лога",
         "err_select_one": "Выберите хотя бы один лог",
@@ -131,6 +227,9 @@ LANG_TEXTS = {
             ("Средний FPS (display)", "avg_fps"),
             ("FPS по Present", "present_fps"),
             ("FPS по Display", "display_fps"),
+            ("1% low FPS", "p1_low_fps"),
+            ("0.1% low FPS", "p01_low_fps"),
+            ("Время кадра p99 (мс)", "frametime_p99"),
             ("Произвольная колонка…", "__custom__"),
         ],
         "fps_opts": [
@@ -139,6 +238,11 @@ LANG_TEXTS = {
         ],
         "tt_dir": "Папка с CSV логами FrameView (например, in)",
         "tt_glob": "Необязательный шаблон (например, FrameView_*Log.csv)",
+        "tt_catalog": (
+            "Фильтры через ';', например application=cyberpunk; gpu=4090; "
+            "duration>=60. Подпапки индексируются в "
+            f"{CATALOG_FILE}; читаются только новые и изменённые логи"
+        ),
         "tt_files": "Выберите нужные логи",
         "tt_select_all": "Выделить все файлы",
         "tt_clear": "Очистить выбор",
@@ -159,26 +263,62 @@ LANG_TEXTS = {
             "Количество кадров: число презентов в секунду (не FPS)."
         ),
         "tt_enable_compare": (
-            "A/B сравнение. Выберите ровно 2 лога. Добавит третью строку "
-            "с %‑разницей по секундам относительно первого: 100×(B/A − 1)."
+            "Сравнение с эталоном. Выберите 2 или больше логов; верхний из "
+            "выбранных — эталон. Для каждого другого лога добавляется строка "
+            "%‑разницы по секундам: 100×(B/A − 1)."
         ),
-        "tt_diff_only": "Вывести только строку %‑разницы (без исходных рядов)",
+        "tt_diff_only": "Вывести только строки %‑разницы (без исходных рядов)",
         "tt_output": "Путь к результирующему CSV",
         "tt_generate": "Создать Flourish CSV",
         "trim": "Обрезка",
         "trim_start": "Начало (сек):",
         "trim_end": "Конец (сек):",
         "trim_configure": "Настроить…",
+        "trim_export": "Экспорт манифеста…",
+        "tt_trim_export": (
+            "Сохранить обрезку выбранных логов (или всех логов с "
+            "индивидуальными настройками) в манифест для: "
+            "flourish_maker.py trim MANIFEST"
+        ),
+        "trim_export_done": "Манифест обрезки сохранён для {n} файл(ов): {path}",
         "trim_title": "Настройки обрезки",
         "trim_global": "Применить ко всем выбранным файлам",
         "trim_individual": "Настроить индивидуально",
         "trim_per_file": "Настройки для каждого файла",
+        "trim_duration": "Длительность",
         "tt_trim": (
             "Обрезать секунды с начала и конца данных. "
             "Нажмите Настроить для индивидуальных настроек."
         ),
         "trim_passthrough": "Обрезать файл",
         "tt_trim_passthrough": "Создать обрезанную копию файла без конвертации",
+        "jobs": "Параллельных задач:",
+        "tt_jobs": (
+            "Число процессов для разбора логов. "
+            "1 — разбор в процессе самого окна."
+        ),
+        "bin_width": "Интервал (с):",
+        "tt_bin_width": (
+            "Ширина одной колонки таймлайна в секундах, "
+            "например 0.25 для плавной анимации или 60 для долгих тестов."
+        ),
+        "downsample": "Шагов:",
+        "tt_downsample": (
+            "Сократить каждую строку, включая строки %, примерно до этого числа "
+            "шагов таймлайна, сохранив видимыми фризы (например, 300); 0 — "
+            "оставить все интервалы. LTTB оставляет одно значение на шаг с "
+            "сохранением формы, Мин/макс — минимум и максимум каждой пары шагов."
+        ),
+        "downsample_opts": [
+            ("LTTB", "lttb"),
+            ("Мин/макс", "minmax"),
+        ],
+        "profile": "Профилирование",
+        "tt_profile": (
+            "Замерить время каждого этапа (чтение, разбиение, разбор, запись; "
+            "группировка — как остаток) по каждому логу и сохранить "
+            "<output>_profile.json рядом с результатом."
+        ),
         "rename_title": "Переименовать подпись",
         "rename_prompt": (
             "Введите имя колонки (подписи) для:\n{file}\n"
@@ -309,15 +449,18 @@ class TrimConfigDialog(tk.Toplevel):
         tk.Label(header_frame, text="File", width=40, anchor="w").grid(
             row=0, column=0, sticky="w"
         )
-        tk.Label(header_frame, text=self.t["trim_start"], width=12).grid(
+        tk.Label(header_frame, text=self.t["trim_duration"], width=12).grid(
             row=0, column=1
         )
-        tk.Label(header_frame, text=self.t["trim_end"], width=12).grid(
+        tk.Label(header_frame, text=self.t["trim_start"], width=12).grid(
             row=0, column=2
         )
-        tk.Label(header_frame, text="Action", width=12).grid(
+        tk.Label(header_frame, text=self.t["trim_end"], width=12).grid(
             row=0, column=3
         )
+        tk.Label(header_frame, text="Action", width=12).grid(
+            row=0, column=4
+        )
         
         # File entries
         for i, file_path in enumerate(self.selected_files):
@@ -339,15 +482,23 @@ class TrimConfigDialog(tk.Toplevel):
                 anchor="w"
             ).grid(row=0, column=0, sticky="w")
             
+            # Duration from the first and last rows only (no full scan)
+            try:
+                span = read_time_span(file_path)
+            except OSError:
+                span = None
+            duration = f"{span[1] - span[0]:.1f}s" if span else "?"
+            tk.Label(file_frame, text=duration, width=12).grid(row=0, column=1)
+            
             # Start trim entry
             start_var = tk.DoubleVar(value=start_val)
             start_entry = tk.Entry(file_frame, textvariable=start_var, width=10)
-            start_entry.grid(row=0, column=1, padx=5)
+            start_entry.grid(row=0, column=2, padx=5)
             
             # End trim entry  
             end_var = tk.DoubleVar(value=end_val)
             end_entry = tk.Entry(file_frame, textvariable=end_var, width=10)
-            end_entry.grid(row=0, column=2, padx=5)
+            end_entry.grid(row=0, column=3, padx=5)
             
             # Trim passthrough button
             trim_btn = tk.Button(
@@ -356,7 +507,7 @@ class TrimConfigDialog(tk.Toplevel):
                 command=lambda fp=file_path, se=start_entry, ee=end_entry: 
                 self._trim_file_passthrough(fp, se, ee)
             )
-            trim_btn.grid(row=0, column=3, padx=5)
+            trim_btn.grid(row=0, column=4, padx=5)
             Tooltip(trim_btn, self.t["tt_trim_passthrough"])
             
             self.entries[file_key] = (start_entry, end_entry)
@@ -412,38 +563,34 @@ class TrimConfigDialog(tk.Toplevel):
         try:
             start_val = float(start_entry.get())
             end_val = float(end_entry.get())
-            
-            if start_val < 0 or end_val < 0:
-                messagebox.showerror("Error", "Trim values must be non-negative")
-                return
-            
-            # Generate output filename
-            stem = file_path.stem
-            suffix = file_path.suffix
-            if start_val > 0 or end_val > 0:
-                trim_suffix = f"_trim_{start_val:.1f}s_{end_val:.1f}s"
-            else:
-                trim_suffix = "_trim"
-            output_path = file_path.parent / f"{stem}{trim_suffix}{suffix}"
-            
-            # Perform the trim
-            success = trim_csv_passthrough(
-                file_path, output_path, start_val, end_val
-            )
-            
-            if success:
-                messagebox.showinfo(
-                    "Success", 
-                    f"Trimmed file saved as:\n{output_path.name}"
-                )
-            else:
-                messagebox.showerror(
-                    "Error", 
-                    "Failed to trim file. Check that the file has valid time data."
-                )
-                
         except ValueError:
             messagebox.showerror("Error", "Invalid trim values entered")
+            return
+        if start_val < 0 or end_val < 0:
+            messagebox.showerror("Error", "Trim values must be non-negative")
+            return
+
+        output_path = trim_output_path(file_path, start_val, end_val)
+        try:
+            success = trim_csv_passthrough(file_path, output_path, start_val, end_val)
+        except Exception as exc:  # noqa: BLE001
+            # I/O, an output that would overwrite the log, or a damaged
+            # compressed log
+            messagebox.showerror(
+                "Error", f"Failed to trim file: {str(exc) or type(exc).__name__}"
+            )
+            return
+
+        if success:
+            messagebox.showinfo(
+                "Success", 
+                f"Trimmed file saved as:\n{output_path.name}"
+            )
+        else:
+            messagebox.showerror(
+                "Error", 
+                "Failed to trim file. Check that the file has valid time data."
+            )
 
 
 class App(tk.Tk):
@@ -463,6 +610,7 @@ class App(tk.Tk):
         # Inputs state
         self.dir_var = tk.StringVar(value=str(Path("in").resolve()))
         self.glob_var = tk.StringVar(value="*.csv")
+        self.catalog_var = tk.StringVar(value="")
         # Initialize with localized labels
         default_metric_label = LANG_TEXTS[self.lang]["metric_opts"][0][0]
         self.metric_choice_var = tk.StringVar(value=default_metric_label)
@@ -478,9 +626,49 @@ class App(tk.Tk):
         self.trim_end_var = tk.DoubleVar(value=0.0)
         # Per-file trim settings: file_path -> (start_sec, end_sec)
         self.trim_settings: dict[str, Tuple[float, float]] = {}
+        # Worker processes for parsing
+        self.jobs_var = tk.IntVar(value=1)
+        # Timeline bin width in seconds
+        self.bin_width_var = tk.DoubleVar(value=1.0)
+        # Downsampling: target step count (0 = off) and method label
+        self.downsample_var = tk.IntVar(value=0)
+        self.downsample_method_var = tk.StringVar(
+            value=LANG_TEXTS[self.lang]["downsample_opts"][0][0]
+        )
+        # Write a per-stage timing report next to the output
+        self.profile_var = tk.BooleanVar(value=False)
+        # Background generation: worker thread, its cancel token and the
+        # queue it reports progress through (polled on the Tk thread)
+        self.progress_var = tk.DoubleVar(value=0.0)
+        self._worker: Optional[threading.Thread] = None
+        self._cancel_token: Optional[CancelToken] = None
+        self._events: "queue.Queue[tuple]" = queue.Queue()
+        self._job_files: List[Path] = []
+        self._job_done = 0
+
+        # File list model: every listed log, the ones passing the filter (one
+        # per Listbox row, as resolved paths) and per-file metadata, loaded
+        # by a background thread for the rows that are scrolled into view
+        self.filter_var = tk.StringVar(value="")
+        self._all_files: List[Path] = []
+        self._shown: List[Path] = []
+        self._row_of: Dict[str, int] = {}
+        self._file_states: Dict[str, str] = {}
+        self._file_meta: Dict[Path, str] = {}
+        self._meta_pending: Set[Path] = set()
+        # Last in, first out: rows just scrolled to are described first
+        self._meta_requests: "queue.LifoQueue[Path]" = queue.LifoQueue()
+        self._meta_results: "queue.Queue[Tuple[Path, str]]" = queue.Queue()
+        self._scan_id = 0
+        self._filter_after: Optional[str] = None
+        self._meta_after: Optional[str] = None
+        self.filter_var.trace_add("write", self._on_filter_changed)
+        threading.Thread(target=self._meta_worker, daemon=True).start()
 
         self._build_ui()
         self._refresh_file_list()
+        self.after(150, self._poll_meta)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_ui(self) -> None:
         # Language selector
@@ -515,11 +703,25 @@ class App(tk.Tk):
         tk.Button(
             glob_frame, text=self.t["refresh"], command=self._refresh_file_list
         ).pack(side="left")
+        tk.Label(glob_frame, text=self.t["catalog"]).pack(side="left", padx=(16, 6))
+        catalog_entry = tk.Entry(glob_frame, textvariable=self.catalog_var, width=40)
+        catalog_entry.pack(side="left", padx=(0, 6))
+        Tooltip(catalog_entry, self.t["tt_catalog"])
+        tk.Button(
+            glob_frame, text=self.t["catalog_search"], command=self._search_catalog
+        ).pack(side="left")
 
         # Files list
         files_frame = tk.LabelFrame(self, text=self.t["select_logs"])
         files_frame.pack(fill="both", expand=True, padx=10, pady=8)
 
+        filter_row = tk.Frame(files_frame)
+        filter_row.pack(fill="x", pady=(0, 6))
+        tk.Label(filter_row, text=self.t["filter"]).pack(side="left", padx=(0, 6))
+        filter_entry = tk.Entry(filter_row, textvariable=self.filter_var)
+        filter_entry.pack(side="left", fill="x", expand=True)
+        Tooltip(filter_entry, self.t["tt_filter"])
+
         list_container = tk.Frame(files_frame)
         list_container.pack(fill="both", expand=True)
 
@@ -531,7 +733,12 @@ class App(tk.Tk):
         self.files_list.pack(side="left", fill="both", expand=True)
         scrollbar = tk.Scrollbar(list_container, orient="vertical")
         scrollbar.config(command=self.files_list.yview)
-        self.files_list.config(yscrollcommand=scrollbar.set)
+
+        def on_scroll(first: str, last: str) -> None:
+            scrollbar.set(first, last)
+            self._schedule_visible_meta()
+
+        self.files_list.config(yscrollcommand=on_scroll)
         scrollbar.pack(side="right", fill="y")
 
         btns = tk.Frame(files_frame)
@@ -630,6 +837,11 @@ class App(tk.Tk):
             command=self._configure_trim
         )
         self.trim_configure_btn.grid(row=0, column=4, sticky="w", padx=8)
+        trim_export_btn = tk.Button(
+            trim_frame, text=self.t["trim_export"], command=self._export_trim_manifest
+        )
+        trim_export_btn.grid(row=0, column=5, sticky="w")
+        Tooltip(trim_export_btn, self.t["tt_trim_export"])
         
         # Tooltip for trim controls
         Tooltip(trim_frame, self.t["tt_trim"])
@@ -647,12 +859,61 @@ class App(tk.Tk):
         # Actions
         actions = tk.Frame(self)
         actions.pack(fill="x", padx=10, pady=(0, 10))
-        tk.Button(actions, text=self.t["generate"], command=self._generate).pack(
-            side="left"
+        self.generate_btn = tk.Button(
+            actions, text=self.t["generate"], command=self._generate
+        )
+        self.generate_btn.pack(side="left")
+        self.cancel_btn = tk.Button(
+            actions, text=self.t["cancel"], command=self._cancel_generate
         )
+        self.cancel_btn.pack(side="left", padx=(8, 0))
+        Tooltip(self.cancel_btn, self.t["tt_cancel"])
+        running = self._worker is not None
+        self.generate_btn.configure(state="disabled" if running else "normal")
+        self.cancel_btn.configure(state="normal" if running else "disabled")
         tk.Button(actions, text="Rename…", command=self._rename_selected).pack(
             side="left", padx=(8, 0)
         )
+        tk.Label(actions, text=self.t["jobs"]).pack(side="left", padx=(12, 4))
+        jobs_spin = tk.Spinbox(
+            actions,
+            from_=1,
+            to=os.cpu_count() or 1,
+            textvariable=self.jobs_var,
+            width=4,
+        )
+        jobs_spin.pack(side="left")
+        Tooltip(jobs_spin, self.t["tt_jobs"])
+        tk.Label(actions, text=self.t["bin_width"]).pack(side="left", padx=(12, 4))
+        bin_width_entry = tk.Entry(actions, textvariable=self.bin_width_var, width=6)
+        bin_width_entry.pack(side="left")
+        Tooltip(bin_width_entry, self.t["tt_bin_width"])
+        tk.Label(actions, text=self.t["downsample"]).pack(side="left", padx=(12, 4))
+        downsample_entry = tk.Entry(actions, textvariable=self.downsample_var, width=5)
+        downsample_entry.pack(side="left")
+        Tooltip(downsample_entry, self.t["tt_downsample"])
+        method_labels = [label for (label, _key) in self.t["downsample_opts"]]
+        if self.downsample_method_var.get() not in method_labels:
+            # Language switch: show the same method under its new label
+            method = self._downsample_method()
+            self.downsample_method_var.set(
+                next(lbl for lbl, v in self.t["downsample_opts"] if v == method)
+            )
+        method_menu = tk.OptionMenu(actions, self.downsample_method_var, *method_labels)
+        method_menu.pack(side="left", padx=(4, 0))
+        Tooltip(method_menu, self.t["tt_downsample"])
+        profile_check = tk.Checkbutton(
+            actions, text=self.t["profile"], variable=self.profile_var
+        )
+        profile_check.pack(side="left", padx=(12, 0))
+        Tooltip(profile_check, self.t["tt_profile"])
+        ttk.Progressbar(
+            actions,
+            variable=self.progress_var,
+            maximum=1.0,
+            mode="determinate",
+            length=180,
+        ).pack(side="left", padx=(12, 0))
         self.status_var = tk.StringVar(value="")
         tk.Label(actions, textvariable=self.status_var, anchor="w").pack(
             side="left", padx=12
@@ -682,20 +943,184 @@ class App(tk.Tk):
         for child in self.winfo_children():
             child.destroy()
         self._build_ui()
-        self._refresh_file_list()
+        self._render_file_list()
 
     def _refresh_file_list(self) -> None:
+        directory = Path(self.dir_var.get())
+        glob = self.glob_var.get().strip() or None
+        self._load_files(
+            lambda: discover_input_files(directory, glob), "status_found", "err_scan"
+        )
+
+    def _load_files(
+        self, find: Callable[[], List[Path]], done_key: str, error_key: str
+    ) -> None:
+        """Replace the file list with find()'s result, computed off the UI
+        thread (directory scans can take long on network shares)."""
+        self._scan_id += 1
+        scan_id = self._scan_id
+        self._all_files = []
+        self._render_file_list()
+        self.status_var.set(self.t["status_scanning"])
+        results: "queue.Queue[tuple]" = queue.Queue()
+
+        def work() -> None:
+            try:
+                results.put(("done", [p.resolve() for p in find()]))
+            except Exception as exc:  # noqa: BLE001
+                results.put(("error", str(exc)))
+
+        threading.Thread(target=work, daemon=True).start()
+        self.after(50, self._poll_files, scan_id, results, done_key, error_key)
+
+    def _poll_files(
+        self,
+        scan_id: int,
+        results: "queue.Queue[tuple]",
+        done_key: str,
+        error_key: str,
+    ) -> None:
+        if scan_id != self._scan_id:
+            return  # superseded by a newer scan
+        try:
+            kind, value = results.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_files, scan_id, results, done_key, error_key)
+            return
+        if kind == "error":
+            self.status_var.set("")
+            messagebox.showerror("Error", f"{self.t[error_key]}:\n{value}")
+            return
+        self._add_files(scan_id, value, 0, done_key)
+
+    def _add_files(self, scan_id: int, files: List[Path], start: int, done_key: str) -> None:
+        """Append files in chunks between UI events so the window stays live."""
+        if scan_id != self._scan_id:
+            return
+        chunk = files[start : start + _LIST_CHUNK]
+        self._all_files.extend(chunk)
+        self._append_rows(chunk)
+        done = start + len(chunk)
+        if done < len(files):
+            self.status_var.set(
+                self.t["status_listing"].format(done=done, total=len(files))
+            )
+            self.after(1, self._add_files, scan_id, files, done, done_key)
+        else:
+            self.status_var.set(self.t[done_key].format(n=len(files)))
+
+    def _row_text(self, path: Path) -> str:
+        meta = self._file_meta.get(path)
+        return f"{path}    ({meta})" if meta else str(path)
+
+    def _append_rows(self, paths: List[Path]) -> None:
+        needle = self.filter_var.get().strip().lower()
+        rows = [p for p in paths if needle in str(p).lower()] if needle else paths
+        if not rows:
+            return
+        first = len(self._shown)
+        for p in rows:
+            self._row_of[str(p)] = len(self._shown)
+            self._shown.append(p)
+        self.files_list.insert(tk.END, *[self._row_text(p) for p in rows])
+        self._color_rows(
+            [first + i for i, p in enumerate(rows) if str(p) in self._file_states]
+        )
+
+    def _render_file_list(self) -> None:
+        """Rebuild the rows from the model, keeping the selection."""
+        self._filter_after = None
+        selected = set(self._read_selected_files())
         self.files_list.delete(0, tk.END)
+        self._shown = []
+        self._row_of = {}
+        self._append_rows(self._all_files)
+        for p in selected:
+            row = self._row_of.get(str(p))
+            if row is not None:
+                self.files_list.selection_set(row)
+
+    def _on_filter_changed(self, *_: object) -> None:
+        # Re-filter once typing pauses
+        if self._filter_after is not None:
+            self.after_cancel(self._filter_after)
+        self._filter_after = self.after(150, self._render_file_list)
+
+    def _schedule_visible_meta(self) -> None:
+        if self._meta_after is None:
+            self._meta_after = self.after(100, self._request_visible_meta)
+
+    def _request_visible_meta(self) -> None:
+        """Queue metadata loads for the rows currently in view."""
+        self._meta_after = None
+        if not self._shown:
+            return
+        first = self.files_list.nearest(0)
+        last = self.files_list.nearest(self.files_list.winfo_height())
+        for p in self._shown[first : last + 1]:
+            if p not in self._file_meta and p not in self._meta_pending:
+                self._meta_pending.add(p)
+                self._meta_requests.put(p)
+
+    def _meta_worker(self) -> None:
+        # Background thread: describe one file at a time, newest request first
+        while True:
+            path = self._meta_requests.get()
+            try:
+                info = read_log_info(path, count_rows=False)
+            except Exception:  # noqa: BLE001
+                self._meta_results.put((path, "?"))
+                continue
+            duration = info["duration"]
+            parts = [
+                "?" if duration is None else f"{duration:.1f}s",
+                str(info["application"] or ""),
+                str(info["gpu"] or ""),
+            ]
+            self._meta_results.put((path, " · ".join(p for p in parts if p)))
+
+    def _poll_meta(self) -> None:
+        try:
+            while True:
+                path, meta = self._meta_results.get_nowait()
+                self._meta_pending.discard(path)
+                self._file_meta[path] = meta
+                row = self._row_of.get(str(path))
+                if row is None:
+                    continue
+                selected = self.files_list.selection_includes(row)
+                self.files_list.delete(row)
+                self.files_list.insert(row, self._row_text(path))
+                if selected:
+                    self.files_list.selection_set(row)
+                self._color_rows([row])
+        except queue.Empty:
+            pass
+        self.after(150, self._poll_meta)
+
+    def _search_catalog(self) -> None:
+        """Update the catalog of the directory tree off the UI thread, then
+        list the logs matching the filter."""
         directory = Path(self.dir_var.get())
         glob = self.glob_var.get().strip() or None
         try:
-            files = discover_input_files(directory, glob)
-        except Exception as exc:  # noqa: BLE001
-            messagebox.showerror("Error", f"{self.t['err_scan']}:\n{exc}")
+            filters = [
+                parse_catalog_filter(part)
+                for part in self.catalog_var.get().split(";")
+                if part.strip()
+            ]
+        except ValueError as exc:
+            messagebox.showerror("Error", str(exc))
             return
-        for p in files:
-            self.files_list.insert(tk.END, str(p.resolve()))
-        self.status_var.set(self.t["status_found"].format(n=len(files)))
+
+        def find() -> List[Path]:
+            with LogCatalog(directory / CATALOG_FILE) as catalog:
+                catalog.update(directory, glob)
+                entries = catalog.query(filters, under=directory)
+            return [entry["path"] for entry in entries]  # type: ignore[misc]
+
+        self._load_files(find, "status_catalog", "err_catalog")
+        self.status_var.set(self.t["status_catalog_scan"])
 
     def _select_all(self) -> None:
         self.files_list.select_set(0, tk.END)
@@ -720,8 +1145,7 @@ class App(tk.Tk):
             self.status_var.set("")
 
     def _read_selected_files(self) -> List[Path]:
-        selection = [self.files_list.get(i) for i in self.files_list.curselection()]
-        return [Path(s) for s in selection]
+        return [self._shown[i] for i in self.files_list.curselection()]
 
     def _resolve_metric_value(self) -> str:
         choice_label = self.metric_choice_var.get()
@@ -737,7 +1161,18 @@ class App(tk.Tk):
             return f"{MetricKind.COLUMN_PREFIX}{hdr}"
         return choice
 
+    def _downsample_method(self) -> str:
+        # Method key of the selected label, whichever language it is in
+        label = self.downsample_method_var.get()
+        for texts in LANG_TEXTS.values():
+            for lbl, value in texts["downsample_opts"]:
+                if lbl == label:
+                    return value
+        return "lttb"
+
     def _generate(self) -> None:
+        if self._worker is not None:
+            return
         try:
             out_path = Path(self.output_var.get())
             metric = self._resolve_metric_value()
@@ -752,53 +1187,200 @@ class App(tk.Tk):
             selected = self._read_selected_files()
 
             if compare:
-                if len(selected) != 2:
-                    raise ValueError("Compare mode requires exactly 2 selected logs")
-
-                rows = []
-                trim_start_a, trim_end_a = self._get_trim_settings(selected[0])
-                trim_start_b, trim_end_b = self._get_trim_settings(selected[1])
-                name_a, series_a = compute_per_second_series(
-                    selected[0], metric, fps_mode=fps_mode,
-                    trim_start=trim_start_a, trim_end=trim_end_a
-                )
-                name_b, series_b = compute_per_second_series(
-                    selected[1], metric, fps_mode=fps_mode,
-                    trim_start=trim_start_b, trim_end=trim_end_b
-                )
-                lbls = getattr(self, "custom_labels", {})
-                name_a = lbls.get(str(selected[0]), name_a)
-                name_b = lbls.get(str(selected[1]), name_b)
-                diff_series = compute_difference_series(series_a, series_b)
-
-                if diff_only:
-                    rows = [("%", diff_series)]
-                else:
-                    rows = [
-                        (name_a, series_a),
-                        (name_b, series_b),
-                        ("%", diff_series),
-                    ]
-            else:
-                if len(selected) == 0:
-                    raise ValueError("Select at least one log to process")
-                rows = []
-                for p in selected:
-                    trim_start, trim_end = self._get_trim_settings(p)
-                    name, series = compute_per_second_series(
-                        p, metric, fps_mode=fps_mode,
-                        trim_start=trim_start, trim_end=trim_end
+                if len(selected) < 2:
+                    raise ValueError(
+                        "Compare mode requires a baseline and at least one "
+                        "candidate log"
                     )
-                    # Apply user-provided label if present
-                    lbls = getattr(self, "custom_labels", {})
-                    label = lbls.get(str(p), name)
-                    rows.append((label, series))
-
-            write_flourish_wide_csv(out_path, rows)
-            self.status_var.set(f"{self.t['done_file']} {out_path}")
-            messagebox.showinfo(self.t["done_file"], str(out_path))
+            elif len(selected) == 0:
+                raise ValueError("Select at least one log to process")
+
+            bin_width = self.bin_width_var.get()
+            downsample = self.downsample_var.get()
+            if downsample == 1 or downsample < 0:
+                raise ValueError("Steps must be 0 (off) or at least 2")
+            downsample_method = self._downsample_method()
+            trims = [self._get_trim_settings(p) for p in selected]
+            jobs = max(1, self.jobs_var.get())
+            profile = self.profile_var.get()
+            # Apply user-provided labels if present
+            lbls = dict(getattr(self, "custom_labels", {}))
         except Exception as exc:  # noqa: BLE001
             messagebox.showerror("Error", str(exc))
+            return
+
+        # Tk variables are read above; the worker only touches plain values
+        self._cancel_token = CancelToken()
+        self._job_files = selected
+        self._job_done = 0
+        self._set_file_colors(None)
+        self.progress_var.set(0.0)
+        self.generate_btn.configure(state="disabled")
+        self.cancel_btn.configure(state="normal")
+        self._worker = threading.Thread(
+            target=self._generate_worker,
+            args=(
+                out_path,
+                metric,
+                fps_mode,
+                compare,
+                diff_only,
+                selected,
+                trims,
+                jobs,
+                bin_width,
+                downsample,
+                downsample_method,
+                profile,
+                lbls,
+                self._cancel_token,
+            ),
+            daemon=True,
+        )
+        self._worker.start()
+        self.after(100, self._poll_worker)
+
+    def _generate_worker(
+        self,
+        out_path: Path,
+        metric: str,
+        fps_mode: str,
+        compare: bool,
+        diff_only: bool,
+        selected: List[Path],
+        trims: List[Tuple[float, float]],
+        jobs: int,
+        bin_width: float,
+        downsample: int,
+        downsample_method: str,
+        profile: bool,
+        lbls: dict,
+        cancel: CancelToken,
+    ) -> None:
+        # Runs off the Tk thread: report only through self._events
+        try:
+            profiles: Optional[List[FileProfile]] = [] if profile else None
+            start = time.perf_counter()
+            loaded = compute_series_batch(
+                selected,
+                [metric],
+                fps_mode=fps_mode,
+                trims=trims,
+                jobs=jobs,
+                bin_width=bin_width,
+                progress=lambda done, total: self._events.put(
+                    ("progress", done / total if total else 1.0)
+                ),
+                cancel=cancel,
+                file_status=lambda index, state: self._events.put(
+                    ("file", index, state)
+                ),
+                profiles=profiles,
+            )
+            rows = [
+                (lbls.get(str(p), name), results[metric])
+                for p, (name, results) in zip(selected, loaded)
+            ]
+
+            if compare:
+                rows = compare_rows(rows, diff_only)
+            if downsample:
+                rows, bin_width = downsample_rows(
+                    rows, downsample, downsample_method, bin_width
+                )
+
+            write_start = time.perf_counter()
+            write_flourish_wide_csv(out_path, rows, bin_width)
+            report_path: Optional[Path] = None
+            if profiles is not None:
+                report_path = out_path.with_name(f"{out_path.stem}_profile.json")
+                write_profile_report(
+                    report_path,
+                    profiles,
+                    [(out_path, time.perf_counter() - write_start)],
+                    time.perf_counter() - start,
+                )
+            self._events.put(("done", out_path, report_path))
+        except OperationCancelled:
+            self._events.put(("cancelled",))
+        except Exception as exc:  # noqa: BLE001
+            self._events.put(("error", str(exc)))
+
+    def _poll_worker(self) -> None:
+        finished = False
+        try:
+            while True:
+                event = self._events.get_nowait()
+                kind = event[0]
+                if kind == "progress":
+                    self.progress_var.set(event[1])
+                elif kind == "file":
+                    self._on_file_status(event[1], event[2])
+                elif kind == "done":
+                    finished = True
+                    self.progress_var.set(1.0)
+                    self.status_var.set(f"{self.t['done_file']} {event[1]}")
+                    written = [str(path) for path in event[1:] if path is not None]
+                    messagebox.showinfo(self.t["done_file"], "\n".join(written))
+                elif kind == "cancelled":
+                    finished = True
+                    self.progress_var.set(0.0)
+                    self.status_var.set(self.t["status_cancelled"])
+                elif kind == "error":
+                    finished = True
+                    self.status_var.set("")
+                    messagebox.showerror("Error", event[1])
+        except queue.Empty:
+            pass
+        if finished:
+            self._worker = None
+            self._cancel_token = None
+            self.generate_btn.configure(state="normal")
+            self.cancel_btn.configure(state="disabled")
+        else:
+            self.after(100, self._poll_worker)
+
+    def _on_file_status(self, index: int, state: str) -> None:
+        path = self._job_files[index]
+        if state == "done":
+            self._job_done += 1
+        if self._cancel_token is not None and self._cancel_token.is_set():
+            self.status_var.set(self.t["status_cancelling"])
+        else:
+            self.status_var.set(
+                self.t["status_running"].format(
+                    done=self._job_done, total=len(self._job_files), name=path.name
+                )
+            )
+        self._set_file_colors({str(path.resolve()): state})
+
+    def _set_file_colors(self, states: Optional[dict]) -> None:
+        """Color list entries by job state; None resets every entry."""
+        if states is None:
+            rows = [self._row_of.get(path) for path in self._file_states]
+            self._file_states = {}
+        else:
+            self._file_states.update(states)
+            rows = [self._row_of.get(path) for path in states]
+        self._color_rows([row for row in rows if row is not None])
+
+    def _color_rows(self, rows: List[int]) -> None:
+        colors = {"running": "#d7ba7d", "done": "#89d185", "failed": "#f48771"}
+        default_fg = self.files_list.cget("foreground")
+        for row in rows:
+            state = self._file_states.get(str(self._shown[row]))
+            self.files_list.itemconfig(row, foreground=colors.get(state, default_fg))
+
+    def _cancel_generate(self) -> None:
+        if self._cancel_token is not None:
+            self._cancel_token.cancel()
+            self.status_var.set(self.t["status_cancelling"])
+
+    def _on_close(self) -> None:
+        # Stop a running generation so worker processes exit with the window
+        if self._cancel_token is not None:
+            self._cancel_token.cancel()
+        self.destroy()
 
     def _configure_trim(self) -> None:
         # Open trim configuration dialog
@@ -811,6 +1393,35 @@ class App(tk.Tk):
         dialog = TrimConfigDialog(self, selected_paths, self.trim_settings, self.t)
         self.wait_window(dialog)
 
+    def _export_trim_manifest(self) -> None:
+        # Selected logs, or every log with its own trim settings
+        paths = self._read_selected_files() or [Path(k) for k in self.trim_settings]
+        if not paths:
+            messagebox.showinfo("Info", "No files selected")
+            return
+        try:
+            entries = [(p, *self._get_trim_settings(p), None) for p in paths]
+        except tk.TclError:
+            messagebox.showerror("Error", "Invalid trim values entered")
+            return
+        sel = filedialog.asksaveasfilename(
+            title=self.t["trim_export"],
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("CSV files", "*.csv")],
+            initialfile="trim_manifest.json",
+            initialdir=str(paths[0].parent),
+        )
+        if not sel:
+            return
+        try:
+            write_trim_manifest(Path(sel), entries)
+        except OSError as exc:
+            messagebox.showerror("Error", str(exc))
+            return
+        self.status_var.set(
+            self.t["trim_export_done"].format(n=len(entries), path=sel)
+        )
+
     def _get_trim_settings(self, file_path: Path) -> Tuple[float, float]:
         """Get trim settings for a specific file (start, end)"""
         file_key = str(file_path)
@@ -827,7 +1438,7 @@ class App(tk.Tk):
         # Store mapping filename -> custom label in-memory for this run
         self.custom_labels = getattr(self, "custom_labels", {})
         for p in selected_paths:
-            default = p.stem
+            default = log_stem(p)
             prompt = self.t["rename_prompt"].format(file=str(p), default=default)
             name = simpledialog.askstring(self.t["rename_title"], prompt)
             if name is None:
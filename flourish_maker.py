@@ -1,24 +1,345 @@
 import argparse
+import bisect
+import bz2
 import csv
+import hashlib
+import io
+import itertools
+import json
+import lzma
 import math
-from pathlib import Path
-from typing import List, Optional, Tuple
+import mmap
+import multiprocessing
+import os
+import queue
+import re
+import secrets
+import shutil
+import sqlite3
+import statistics
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+import warnings
+import zipfile
+import zlib
+from array import array
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from pathlib import Path, PurePosixPath
+from typing import (
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python engine is used instead
+    np = None
 
-def discover_input_files(directory: Path, include_glob: Optional[str]) -> List[Path]:
-    if include_glob:
-        return sorted(p for p in directory.glob(include_glob) if p.is_file())
-    return sorted(
-        p
-        for p in directory.glob("*.csv")
-        if (
-            p.is_file()
-            and p.name.lower().startswith("frameview_")
-            and p.name != "FrameView_Summary.csv"
+T = TypeVar("T")
+_Decompressor = Union["zlib._Decompress", bz2.BZ2Decompressor, lzma.LZMADecompressor]
+
+
+# Decompressor factory per compression suffix. These work on whole chunks
+# with the GIL released, unlike the gzip/bz2/lzma file objects.
+_CODECS: Dict[str, Callable[[], "_Decompressor"]] = {
+    ".gz": lambda: zlib.decompressobj(zlib.MAX_WBITS | 16),
+    ".bz2": bz2.BZ2Decompressor,
+    ".xz": lzma.LZMADecompressor,
+}
+_ARCHIVE_SUFFIX = ".zip"
+# Compressed bytes decompressed per step
+_DECOMPRESS_CHUNK_BYTES = 256 * 1024
+# Decompressed chunks the reader thread may run ahead of the parser
+_DECOMPRESS_QUEUE_CHUNKS = 8
+
+
+def _codec_suffix(path: Path) -> str:
+    suffix = path.suffix.lower()
+    return suffix if suffix in _CODECS else ""
+
+
+def _archive_member(path: Path) -> Optional[Tuple[Path, str]]:
+    """
+    Split a virtual path like ``logs/bundle.zip/run1/FrameView_x.csv`` into
+    the zip archive and the member name. Returns None for other paths.
+    """
+    for parent in path.parents:
+        if parent.suffix.lower() == _ARCHIVE_SUFFIX and parent.is_file():
+            return parent, path.relative_to(parent).as_posix()
+    return None
+
+
+def _zip_info(archive: Path, name: str) -> zipfile.ZipInfo:
+    try:
+        with zipfile.ZipFile(archive) as zf:
+            return zf.getinfo(name)
+    except (KeyError, zipfile.BadZipFile) as exc:
+        raise FileNotFoundError(f"Input not found: {archive / name}") from exc
+
+
+def is_packed_log(path: Path) -> bool:
+    """True for compressed logs and zip members, which can only be streamed."""
+    return bool(_codec_suffix(path)) or _archive_member(path) is not None
+
+
+def log_stem(path: Path) -> str:
+    """Stem of a log name without its compression suffix (x.csv.gz -> x)."""
+    if _codec_suffix(path):
+        path = path.with_suffix("")
+    return path.stem
+
+
+def log_file(path: Path) -> Path:
+    """The file on disk holding a log: the zip archive for members."""
+    member = _archive_member(path)
+    return path if member is None else member[0]
+
+
+def log_stat(path: Path) -> os.stat_result:
+    """
+    stat() of the file holding a log (the archive for zip members). Raises
+    FileNotFoundError when a member is not in its archive.
+    """
+    member = _archive_member(path)
+    if member is None:
+        return path.stat()
+    _zip_info(*member)
+    return member[0].stat()
+
+
+def log_size(path: Path) -> int:
+    """Bytes read from disk for a log; progress is reported against this."""
+    member = _archive_member(path)
+    if member is None:
+        return path.stat().st_size
+    return _zip_info(*member).compress_size
+
+
+def _decompressed_chunks(
+    source: BinaryIO, codec: str
+) -> Iterator[Tuple[bytes, int]]:
+    """
+    Yield (data, compressed bytes consumed) while decompressing source.
+    Concatenated streams (e.g. ``cat a.gz b.gz``) are read one after another.
+    """
+    decompressor = _CODECS[codec]()
+    consumed = 0
+    while True:
+        data = source.read(_DECOMPRESS_CHUNK_BYTES)
+        consumed += len(data)
+        if not data:
+            if not decompressor.eof:
+                raise EOFError(
+                    "Compressed file ended before the end-of-stream marker was reached"
+                )
+            return
+        while data:
+            chunk = decompressor.decompress(data)
+            data = b""
+            if decompressor.eof:
+                data = decompressor.unused_data
+                if not data.strip(b"\0"):
+                    # Trailing zero padding after the last stream
+                    data = b""
+                else:
+                    decompressor = _CODECS[codec]()
+            if chunk:
+                yield chunk, consumed
+
+
+def _member_chunks(stream: BinaryIO, ratio: float) -> Iterator[Tuple[bytes, int]]:
+    """_decompressed_chunks for a zip member, whose reader decompresses itself."""
+    done = 0
+    while True:
+        chunk = stream.read(_DECOMPRESS_CHUNK_BYTES * 4)
+        if not chunk:
+            return
+        done += len(chunk)
+        yield chunk, int(done * ratio)
+
+
+class _DecompressingReader(io.RawIOBase):
+    """
+    Raw stream over decompressed chunks produced by a background thread, so
+    inflating the next chunks overlaps with parsing the current one (zlib,
+    bz2 and lzma release the GIL while they work). ``source_bytes`` is how
+    much of the compressed input the returned data came from.
+    """
+
+    def __init__(
+        self, chunks: Iterator[Tuple[bytes, int]], resources: List[object]
+    ) -> None:
+        super().__init__()
+        self._chunks = chunks
+        self._resources = resources
+        self.source_bytes = 0
+        self._queue: "queue.Queue[Union[Tuple[bytes, int], BaseException, None]]" = (
+            queue.Queue(_DECOMPRESS_QUEUE_CHUNKS)
         )
+        self._stop = threading.Event()
+        self._chunk = memoryview(b"")
+        self._pos = 0
+        self._eof = False
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Union[Tuple[bytes, int], BaseException, None]) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _produce(self) -> None:
+        try:
+            for item in self._chunks:
+                if self._stop.is_set():
+                    return
+                self._put(item)
+            self._put(None)
+        except BaseException as exc:  # handed to the reading thread
+            self._put(exc)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:  # type: ignore[no-untyped-def]
+        while self._pos >= len(self._chunk):
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if item is None or isinstance(item, BaseException):
+                self._eof = True
+                if item is None:
+                    return 0
+                raise item
+            chunk, self.source_bytes = item
+            self._chunk = memoryview(chunk)
+            self._pos = 0
+        n = min(len(buffer), len(self._chunk) - self._pos)
+        buffer[:n] = self._chunk[self._pos : self._pos + n]
+        self._pos += n
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            # The thread stops after its current chunk or queue timeout
+            self._stop.set()
+            self._thread.join()
+            for resource in reversed(self._resources):
+                resource.close()  # type: ignore[attr-defined]
+        super().close()
+
+
+def open_log(path: Path) -> BinaryIO:
+    """
+    Open a log for binary reading. .gz/.bz2/.xz files and zip members
+    (virtual paths below a .zip file) are decompressed on the fly by a
+    _DecompressingReader; other files are opened directly.
+    """
+    member = _archive_member(path)
+    if member is not None:
+        archive, name = member
+        zf = zipfile.ZipFile(archive)
+        try:
+            info = zf.getinfo(name)
+            stream = zf.open(info)
+        except KeyError as exc:
+            zf.close()
+            raise FileNotFoundError(f"Input not found: {path}") from exc
+        ratio = info.compress_size / info.file_size if info.file_size else 0.0
+        raw = _DecompressingReader(_member_chunks(stream, ratio), [zf, stream])
+    else:
+        codec = _codec_suffix(path)
+        if not codec:
+            return path.open("rb")
+        source = path.open("rb")
+        raw = _DecompressingReader(_decompressed_chunks(source, codec), [source])
+    return io.BufferedReader(raw, _FAST_CHUNK_BYTES)  # type: ignore[return-value]
+
+
+def open_log_text(path: Path) -> io.TextIOWrapper:
+    """open_log for the csv module: UTF-8 text without newline translation."""
+    return io.TextIOWrapper(
+        open_log(path), encoding="utf-8", errors="ignore", newline=""
+    )
+
+
+def _is_default_log(name: str) -> bool:
+    return (
+        name.endswith(".csv")
+        and name.lower().startswith("frameview_")
+        and name != "FrameView_Summary.csv"
     )
 
 
+def discover_input_files(
+    directory: Path, include_glob: Optional[str], recursive: bool = False
+) -> List[Path]:
+    """
+    Logs in directory: files matching include_glob, or by default the
+    FrameView_*.csv logs other than the summary. Either rule also accepts the
+    name with a .gz/.bz2/.xz suffix. Members of the zip archives in directory
+    (and below it when the glob contains ``**``) are listed as virtual paths
+    like ``bundle.zip/run1/FrameView_x.csv``, which the glob is matched
+    against with Path.match. ``recursive`` applies the rule in every
+    subdirectory as well.
+    """
+    if recursive and include_glob and "**" not in include_glob:
+        include_glob = "**/" + include_glob
+    patterns = [include_glob or ("**/*.csv" if recursive else "*.csv")]
+    patterns += [patterns[0] + suffix for suffix in _CODECS]
+    found = set()
+    for pattern in patterns:
+        for p in directory.glob(pattern):
+            if not p.is_file() or p.suffix.lower() == _ARCHIVE_SUFFIX:
+                continue
+            name = p.with_suffix("").name if _codec_suffix(p) else p.name
+            if include_glob or _is_default_log(name):
+                found.add(p)
+
+    recursive = recursive or (include_glob is not None and "**" in include_glob)
+    archives = directory.glob(("**/*" if recursive else "*") + _ARCHIVE_SUFFIX)
+    for archive in archives:
+        if not archive.is_file():
+            continue
+        try:
+            with zipfile.ZipFile(archive) as zf:
+                names = [i.filename for i in zf.infolist() if not i.is_dir()]
+        except (OSError, zipfile.BadZipFile):
+            continue
+        for name in names:
+            path = archive.joinpath(*PurePosixPath(name).parts)
+            if include_glob:
+                matched = path.relative_to(directory).match(include_glob)
+            else:
+                matched = _is_default_log(path.name)
+            if matched:
+                found.add(path)
+    return sorted(found)
+
+
 def parse_float(value: str) -> Optional[float]:
     if value is None:
         return None
@@ -37,7 +358,7 @@ def parse_float(value: str) -> Optional[float]:
 
 def pick_row_name(file_path: Path, header: List[str], first_row: List[str]) -> str:
     # Use filename as base for label
-    stem = file_path.stem
+    stem = log_stem(file_path)
     name = stem
 
     # Clean up common filename patterns
@@ -78,9 +399,32 @@ class MetricKind:
     AVG_FPS = "avg_fps"  # uses displayed frame time by default
     PRESENT_FPS = "present_fps"  # uses MsBetweenPresents
     DISPLAY_FPS = "display_fps"  # uses MsBetweenDisplayChange
+    P1_LOW_FPS = "p1_low_fps"  # FPS at the 99th percentile frame time
+    P01_LOW_FPS = "p01_low_fps"  # FPS at the 99.9th percentile frame time
+    FRAMETIME_PREFIX = "frametime_p"  # e.g., frametime_p99 (ms)
     COLUMN_PREFIX = "column:"  # e.g., column:GPU0Util(%)
 
 
+def metric_quantile(metric: str) -> Optional[Tuple[float, bool]]:
+    """
+    For percentile metrics returns (frame_time_quantile, as_fps), e.g.
+    (0.99, True) for p1_low_fps or (0.5, False) for frametime_p50.
+    Returns None for other metrics.
+    """
+    if metric == MetricKind.P1_LOW_FPS:
+        return 0.99, True
+    if metric == MetricKind.P01_LOW_FPS:
+        return 0.999, True
+    if metric.startswith(MetricKind.FRAMETIME_PREFIX):
+        try:
+            pct = float(metric[len(MetricKind.FRAMETIME_PREFIX) :])
+        except ValueError:
+            return None
+        if 0.0 < pct <= 100.0:
+            return pct / 100.0, False
+    return None
+
+
 def resolve_metric_column(header: List[str], metric: str) -> Tuple[str, bool]:
     """
     Returns (column_name, transform_is_ms_to_fps).
@@ -89,7 +433,7 @@ def resolve_metric_column(header: List[str], metric: str) -> Tuple[str, bool]:
     # Normalize header mapping for quick checks
     header_set = set(header)
 
-    if metric == MetricKind.AVG_FPS:
+    if metric == MetricKind.AVG_FPS or metric_quantile(metric) is not None:
         # Default to display time; fall back to present if display not
         # available
         if "MsBetweenDisplayChange" in header_set:
@@ -123,297 +467,4171 @@ def resolve_metric_column(header: List[str], metric: str) -> Tuple[str, bool]:
     raise ValueError(f"Unsupported metric: {metric}")
 
 
-def compute_per_second_series(
-    file_path: Path,
-    metric: str,
-    fps_mode: str = "per-frame-mean",
-    trim_start: float = 0.0,
-    trim_end: float = 0.0,
-) -> Tuple[str, List[Optional[float]]]:
+class _NonMonotonicTime(Exception):
+    """Raised by the single-pass readers when TimeInSeconds goes backwards."""
+
+
+class OperationCancelled(Exception):
+    """Raised inside long-running work once its CancelToken is cancelled."""
+
+
+class CancelToken:
     """
-    Streams the CSV, computes a per-second series for the chosen metric.
-    Returns (row_name, series) where series is a list where index 0 corresponds
-    to second 1.
-    
-    Args:
-        file_path: Path to the CSV file
-        metric: Metric to compute
-        fps_mode: "per-frame-mean" or "count"
-        trim_start: Seconds to trim from the beginning
-        trim_end: Seconds to trim from the end
+    Cancellation flag shared between a caller (e.g. a GUI thread) and the
+    work it started. Readers check it between ~1 MB blocks, so cancelled
+    work stops with OperationCancelled within a fraction of a second.
     """
-    sums: List[float] = []  # For FPS: sum ms; for others: sum values
-    counts: List[int] = []
-    row_name: str = file_path.stem
-    max_time: Optional[float] = None
 
-    with file_path.open("r", newline="", encoding="utf-8", errors="ignore") as f:
-        reader = csv.reader(f)
-        try:
-            header = next(reader)
-        except StopIteration:
-            return (row_name, [])
+    def __init__(self) -> None:
+        self._event = threading.Event()
 
-        # Peek the first data row to get a friendlier name; keep it too
-        try:
-            first_row = next(reader)
-        except StopIteration:
-            return (row_name, [])
+    def cancel(self) -> None:
+        self._event.set()
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+
+# progress(bytes_done, bytes_total)
+ProgressCallback = Callable[[int, int], None]
 
-        row_name = pick_row_name(file_path, header, first_row)
 
-        # Resolve columns
+class FileProfile:
+    """
+    Where the time went for one log, collected when profiling is on (see
+    compute_series_batch). ``seconds`` holds wall time per stage: read (file
+    I/O), tokenize (splitting lines into fields), parse (float conversion)
+    and finalize (series and summaries from the bins), all measured, plus
+    REMAINDER_STAGE: the total minus those, which is mostly the trim window
+    and binning (including NumPy array building and reads from the parse
+    cache). Binning runs row by row between the reads, so it is not timed
+    on its own.
+
+    Row counters: ``rows`` data rows, ``rows_timed`` rows with a usable
+    TimeInSeconds, ``rows_in_window`` rows inside the trim window, and per
+    metric ``values_na`` the rows in the window whose value was NA or not
+    positive. With ``trace_memory`` the file is processed under tracemalloc
+    and ``peak_memory`` holds the peak in bytes; tracing slows Python code
+    down several times, so the stage timings are best taken without it.
+    """
+
+    REMAINDER_STAGE = "other/bin (remainder)"
+    STAGES = ("read", "tokenize", "parse", "finalize", REMAINDER_STAGE)
+
+    def __init__(
+        self, file_path: Path, engine: str = "", trace_memory: bool = False
+    ) -> None:
+        self.file = str(file_path)
+        self.engine = engine
+        self.trace_memory = trace_memory
+        self.seconds: Dict[str, float] = dict.fromkeys(self.STAGES, 0.0)
+        self.total_seconds = 0.0
+        self.bytes_read = 0
+        self.rows = 0
+        self.rows_timed = 0
+        self.rows_in_window = 0
+        self.values_na: Dict[str, int] = {}
+        self.peak_memory: Optional[int] = None
+
+    def reset_rows(self) -> None:
+        """Forget the row counters before a log is read again."""
+        self.rows = 0
+        self.rows_timed = 0
+        self.rows_in_window = 0
+
+    def counted(self, items: Iterable[T], counter: str) -> Iterator[T]:
+        """Pass items through, adding how many there were to ``counter``."""
+        n = 0
         try:
-            t_idx = header.index("TimeInSeconds")
-        except ValueError as exc:
-            raise ValueError("TimeInSeconds column not found in CSV") from exc
+            for item in items:
+                n += 1
+                yield item
+        finally:
+            setattr(self, counter, getattr(self, counter) + n)
 
-        metric_col, transform_ms_to_fps = resolve_metric_column(header, metric)
-        m_idx = header.index(metric_col)
+    def as_dict(self) -> dict:
+        return {
+            "file": self.file,
+            "engine": self.engine,
+            "total_seconds": self.total_seconds,
+            "seconds": dict(self.seconds),
+            "bytes_read": self.bytes_read,
+            "rows": self.rows,
+            "rows_skipped_no_time": self.rows - self.rows_timed,
+            "rows_skipped_trim": self.rows_timed - self.rows_in_window,
+            "values_skipped_na": dict(self.values_na),
+            "peak_memory_bytes": self.peak_memory,
+        }
 
-        # First pass: find time range to determine actual trim bounds
-        all_rows = [first_row]
-        for row in reader:
-            all_rows.append(row)
 
-        # Find time bounds
-        valid_times = []
-        for row in all_rows:
-            if t_idx >= len(row):
-                continue
-            t = parse_float(row[t_idx])
-            if t is not None:
-                valid_times.append(t)
+class _ReadMonitor:
+    """
+    Counts the bytes read from one file and raises OperationCancelled once
+    ``cancel`` (anything with is_set(), e.g. a CancelToken or a
+    multiprocessing Event) is set. Reported bytes are capped at the file
+    size, so logs that need a second pass do not overshoot. The readers also
+    record stage timings into ``profile`` when one is attached.
+    """
 
-        if not valid_times:
-            return (row_name, [])
+    def __init__(
+        self,
+        size: int,
+        on_bytes: Optional[Callable[[int], None]] = None,
+        cancel: Optional[CancelToken] = None,
+        profile: Optional[FileProfile] = None,
+    ) -> None:
+        self.size = size
+        self.done = 0
+        self.on_bytes = on_bytes
+        self.cancel = cancel
+        self.profile = profile
 
-        min_time = min(valid_times)
-        max_time = max(valid_times)
+    def check(self) -> None:
+        if self.cancel is not None and self.cancel.is_set():
+            raise OperationCancelled("Cancelled")
 
-        # Calculate effective trim bounds
-        effective_start = min_time + trim_start
-        effective_end = max_time - trim_end
-        
-        if effective_start >= effective_end:
-            # Invalid trim range
-            return (row_name, [])
+    def advance(self, n_bytes: int) -> None:
+        self.check()
+        step = min(n_bytes, self.size - self.done)
+        if step > 0:
+            self.done += step
+            if self.on_bytes is not None:
+                self.on_bytes(step)
 
-        def process_row(row: List[str]):
-            nonlocal sums, counts
-            if t_idx >= len(row) or m_idx >= len(row):
-                return
-            t = parse_float(row[t_idx])
-            if t is None:
-                return
-            
-            # Apply trimming
-            if t < effective_start or t > effective_end:
-                return
-                
-            rel_t = t - effective_start  # Adjust to trimmed start
-            if rel_t < 0:
-                rel_t = 0.0
-            # 0-based index for second buckets
-            sec_idx = int(math.floor(rel_t))
-
-            val_raw = parse_float(row[m_idx])
-            if val_raw is None:
-                return
-            if transform_ms_to_fps:
-                # Accumulate milliseconds; later compute FPS as
-                # 1000 * count / sum_ms
-                if val_raw <= 0:
-                    return
-                value = val_raw
-            else:
-                value = val_raw
+    def finish(self) -> None:
+        """Report the rest of the file, e.g. after reading it from the cache."""
+        self.advance(self.size - self.done)
 
-            # Ensure capacity
-            if sec_idx >= len(sums):
-                grow_by = sec_idx + 1 - len(sums)
-                sums.extend([0.0] * grow_by)
-                counts.extend([0] * grow_by)
-            sums[sec_idx] += value
-            counts[sec_idx] += 1
 
-        # Process all rows
-        for row in all_rows:
-            process_row(row)
+def _timed_rows(
+    rows: Iterable[List[str]], t_idx: int, keep_untimed: bool = False
+) -> Iterator[Tuple[Optional[float], List[str]]]:
+    """
+    Yield (time, row) for every CSV row with a parseable TimeInSeconds,
+    and (None, row) for the other rows when keep_untimed is set.
+    """
+    for row in rows:
+        t = parse_float(row[t_idx]) if t_idx < len(row) else None
+        if t is not None:
+            yield t, row
+        elif keep_untimed:
+            yield None, row
 
-    # Finalize series: average per second (or use count if fps_mode == 'count')
-    series: List[Optional[float]] = []
-    if fps_mode == "count":
-        for c in counts:
-            series.append(float(c))
-    else:
-        for s, c in zip(sums, counts):
-            if c <= 0:
-                series.append(None)
-                continue
-            if metric in (
-                MetricKind.AVG_FPS,
-                MetricKind.PRESENT_FPS,
-                MetricKind.DISPLAY_FPS,
-            ):
-                # s is sum of ms; compute average FPS over the second window
-                if s <= 0:
-                    series.append(None)
-                else:
-                    series.append(1000.0 * c / s)
-            else:
-                # Simple arithmetic mean for arbitrary columns
-                series.append(s / c)
 
-    # Trim trailing None seconds if present
-    while series and series[-1] is None:
-        series.pop()
+def _timed_values(
+    rows: Iterable[List[str]], t_idx: int, col_idxs: List[int]
+) -> Iterator[Tuple[float, Tuple[Optional[float], ...]]]:
+    """
+    Yield (time, values) for every CSV row with a parseable TimeInSeconds,
+    values holding the parsed col_idxs fields (None when missing or NA).
+    """
+    for t, row in _timed_rows(rows, t_idx):
+        n_fields = len(row)
+        yield t, tuple(parse_float(row[i]) if i < n_fields else None for i in col_idxs)
 
-    return row_name, series
 
+def _scan_time_bounds(
+    timed: Iterable[Tuple[float, object]]
+) -> Optional[Tuple[float, float]]:
+    """Return (min_time, max_time) over (time, payload) pairs."""
+    min_time: Optional[float] = None
+    max_time: Optional[float] = None
+    for t, _payload in timed:
+        if min_time is None or t < min_time:
+            min_time = t
+        if max_time is None or t > max_time:
+            max_time = t
+    if min_time is None or max_time is None:
+        return None
+    return min_time, max_time
 
-def write_flourish_wide_csv(
-    output_path: Path,
-    rows: List[Tuple[str, List[Optional[float]]]],
-):
-    if not rows:
-        # Create an empty file with just the header
-        with output_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["Label"])
-        return
 
-    # Determine common length: shortest series
-    min_len = min(len(series) for _, series in rows)
-    if min_len == 0:
-        # No data; still write header only
-        with output_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["Label"])
-        return
+_FAST_CHUNK_BYTES = 1024 * 1024
 
-    header = ["Label"] + [str(i + 1) for i in range(min_len)]
 
-    def fmt(x: Optional[float]) -> str:
-        if x is None or math.isnan(x):
-            return ""
-        # Limit to 3 decimal places, drop trailing zeros
-        return f"{x:.3f}".rstrip("0").rstrip(".")
+def _bytes_to_float(field: bytes) -> Optional[float]:
+    # float() accepts bytes and surrounding whitespace; NA and "" fail
+    if not field or field == b"NA":
+        return None
+    try:
+        return float(field)
+    except ValueError:
+        return None
 
-    # Ensure unique labels by adding suffixes if needed
-    seen_labels = {}
-    unique_rows = []
-    for name, series in rows:
-        if name in seen_labels:
-            seen_labels[name] += 1
-            unique_name = f"{name}_{seen_labels[name]}"
-        else:
-            seen_labels[name] = 1
-            unique_name = name
-        unique_rows.append((unique_name, series))
 
-    with output_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow(header)
-        for name, series in unique_rows:
-            trimmed = series[:min_len]
-            formatted_values = [fmt(v if v is not None else 0.0) for v in trimmed]
-            row = [name] + formatted_values
-            writer.writerow(row)
+def _str_to_float(field: str) -> Optional[float]:
+    s = field.strip()
+    if not s or s.upper() == "NA":
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
 
 
-def compute_difference_series(
-    base: List[Optional[float]],
-    other: List[Optional[float]],
-) -> List[Optional[float]]:
-    min_len = min(len(base), len(other))
-    diff: List[Optional[float]] = []
-    for i in range(min_len):
-        a = base[i]
-        b = other[i]
-        if a is None or b is None or a == 0:
-            diff.append(None)
+def _comma_str_to_float(field: str) -> Optional[float]:
+    return _str_to_float(field.replace(",", "."))
+
+
+def _iter_line_blocks(
+    f: BinaryIO, monitor: Optional[_ReadMonitor] = None
+) -> Iterator[Tuple[bytes, bool]]:
+    """
+    Yield (block, quoted) for the complete lines of a binary CSV, read in
+    large chunks. ``block`` holds whole lines joined by newlines and
+    ``quoted`` tells whether it contains a quote character and so needs the
+    csv module. A final line without a trailing newline is yielded last.
+    Each chunk read is reported to ``monitor``, which may cancel the read.
+    """
+    profile = None if monitor is None else monitor.profile
+    # Compressed input: progress follows the compressed bytes consumed
+    packed = getattr(f, "raw", None)
+    if not isinstance(packed, _DecompressingReader):
+        packed = None
+    source_done = 0
+    leftover = b""
+    while True:
+        if profile is None:
+            chunk = f.read(_FAST_CHUNK_BYTES)
+        else:
+            start = time.perf_counter()
+            chunk = f.read(_FAST_CHUNK_BYTES)
+            profile.seconds["read"] += time.perf_counter() - start
+            profile.bytes_read += len(chunk)
+        if monitor is not None:
+            if packed is None:
+                monitor.advance(len(chunk))
+            else:
+                monitor.advance(packed.source_bytes - source_done)
+                source_done = packed.source_bytes
+        if not chunk:
+            if leftover:
+                yield leftover, b'"' in leftover
+            return
+        buf = leftover + chunk
+        cut = buf.rfind(b"\n")
+        if cut < 0:
+            leftover = buf
             continue
-        diff.append(100.0 * (b / a - 1.0))
-    return diff
+        block, leftover = buf[:cut], buf[cut + 1 :]
+        yield block, b'"' in block
 
 
-def trim_csv_passthrough(
-    input_path: Path,
-    output_path: Path,
-    trim_start: float = 0.0,
-    trim_end: float = 0.0,
-) -> bool:
+def _open_fast(file_path: Path) -> Optional[BinaryIO]:
     """
-    Trim a CSV file by time range without converting to Flourish format.
-    Returns True if successful, False otherwise.
+    Open a log for the fast reader, positioned after the header line.
+    Returns None when lines do not end in a newline (e.g. bare carriage
+    returns) so the caller can use the csv module instead.
     """
+    f = open_log(file_path)
     try:
-        with input_path.open("r", newline="", encoding="utf-8", errors="ignore") as f:
-            reader = csv.reader(f)
-            try:
-                header = next(reader)
-            except StopIteration:
-                return False
+        header_line = f.readline()
+    except BaseException:
+        f.close()
+        raise
+    if b"\r" in header_line.rstrip(b"\r\n"):
+        f.close()
+        return None
+    return f
 
-            # Find TimeInSeconds column
-            try:
-                t_idx = header.index("TimeInSeconds")
-            except ValueError:
-                return False
 
-            # Read all rows to determine time bounds
-            all_rows = []
+def _csv_block_rows(block: bytes) -> List[List[str]]:
+    return list(
+        csv.reader(io.StringIO(block.decode("utf-8", errors="ignore"), newline=""))
+    )
+
+
+def _detect_decimal_parser(
+    rows: List[List[str]], col_idxs: List[int]
+) -> Callable[[str], Optional[float]]:
+    """Pick a comma- or dot-decimal parser from the needed fields of rows."""
+    for row in rows[:1000]:
+        for i in col_idxs:
+            if i < len(row) and "," in row[i]:
+                return _comma_str_to_float
+    return _str_to_float
+
+
+def _fast_row_values(
+    file_path: Path, col_idxs: List[int], monitor: Optional[_ReadMonitor] = None
+) -> Iterator[Tuple[Optional[float], ...]]:
+    """
+    Yield the parsed col_idxs fields (None when missing or NA) of every data
+    row, reading only what is needed.
+
+    Unquoted lines are split only up to the highest needed column and only the
+    needed fields are converted, straight from bytes. Blocks containing quotes
+    go through the csv module; their decimal separator is detected once per
+    file from the first such block rather than retried per value.
+    """
+    profile = None if monitor is None else monitor.profile
+    f = _open_fast(file_path)
+    if f is None:
+        with open_log_text(file_path) as tf:
+            reader = csv.reader(tf)
+            next(reader, None)
+            if profile is not None:
+                reader = profile.counted(reader, "rows")
+                profile.bytes_read += log_size(file_path)
             for row in reader:
-                all_rows.append(row)
+                n_fields = len(row)
+                yield tuple(
+                    [parse_float(row[i]) if i < n_fields else None for i in col_idxs]
+                )
+        return
 
-            # Find time bounds
-            valid_times = []
-            for row in all_rows:
-                if t_idx >= len(row):
-                    continue
-                t = parse_float(row[t_idx])
-                if t is not None:
-                    valid_times.append(t)
+    max_split = max(col_idxs) + 1
+    to_float: Optional[Callable[[str], Optional[float]]] = None
 
-            if not valid_times:
-                return False
+    def split(block: bytes, quoted: bool) -> Tuple[List[list], Callable]:
+        # Fields of every line of a block (bytes, or str from the csv
+        # module) and the converter for them
+        nonlocal to_float
+        if not quoted:
+            lines = block.split(b"\n")
+            return [line.split(b",", max_split) for line in lines], _bytes_to_float
+        rows = _csv_block_rows(block)
+        if to_float is None:
+            to_float = _detect_decimal_parser(rows, col_idxs)
+        return rows, to_float
 
-            min_time = min(valid_times)
-            max_time = max(valid_times)
+    def convert(
+        rows: List[list], to_value: Callable
+    ) -> List[Tuple[Optional[float], ...]]:
+        return [
+            tuple([to_value(row[i]) if i < len(row) else None for i in col_idxs])
+            for row in rows
+        ]
 
-            # Calculate effective trim bounds
-            effective_start = min_time + trim_start
-            effective_end = max_time - trim_end
+    with f:
+        for block, quoted in _iter_line_blocks(f, monitor):
+            if profile is None:
+                yield from convert(*split(block, quoted))
+                continue
+            start = time.perf_counter()
+            rows, to_value = split(block, quoted)
+            split_done = time.perf_counter()
+            block_values = convert(rows, to_value)
+            profile.seconds["tokenize"] += split_done - start
+            profile.seconds["parse"] += time.perf_counter() - split_done
+            profile.rows += len(block_values)
+            yield from block_values
 
-            if effective_start >= effective_end:
-                return False
 
-            # Write trimmed CSV
-            with output_path.open("w", newline="", encoding="utf-8") as out_f:
-                writer = csv.writer(out_f)
-                writer.writerow(header)
+def _fast_timed_values(
+    file_path: Path,
+    t_idx: int,
+    col_idxs: List[int],
+    monitor: Optional[_ReadMonitor] = None,
+) -> Iterator[Tuple[float, Tuple[Optional[float], ...]]]:
+    """Column-projected equivalent of _timed_values over a whole file."""
+    for values in _fast_row_values(file_path, [t_idx] + col_idxs, monitor):
+        t = values[0]
+        if t is not None:
+            yield t, values[1:]
 
-                for row in all_rows:
-                    if t_idx >= len(row):
-                        continue
-                    t = parse_float(row[t_idx])
-                    if t is None:
+
+# A data row as the fast readers yield it: the line text when unquoted
+LogRow = Union[str, List[str]]
+
+
+def _fast_data_rows(
+    file_path: Path, monitor: Optional[_ReadMonitor] = None
+) -> Iterator[LogRow]:
+    """
+    Yield every data row of a file: the line text (without its line ending)
+    for unquoted lines, the parsed row for lines that needed the csv module.
+    """
+    f = _open_fast(file_path)
+    if f is None:
+        with open_log_text(file_path) as tf:
+            reader = csv.reader(tf)
+            next(reader, None)
+            yield from reader
+        return
+
+    with f:
+        for block, quoted in _iter_line_blocks(f, monitor):
+            if quoted:
+                yield from _csv_block_rows(block)
+                continue
+            for line in block.decode("utf-8", errors="ignore").split("\n"):
+                yield line[:-1] if line.endswith("\r") else line
+
+
+def _fast_timed_rows(
+    file_path: Path,
+    t_idx: int,
+    monitor: Optional[_ReadMonitor] = None,
+    keep_untimed: bool = False,
+) -> Iterator[Tuple[Optional[float], LogRow]]:
+    """
+    Like _timed_rows over a whole file, with rows as in _fast_data_rows.
+    Unquoted lines are only split up to the time column.
+    """
+    f = _open_fast(file_path)
+    if f is None:
+        with open_log_text(file_path) as tf:
+            reader = csv.reader(tf)
+            next(reader, None)
+            yield from _timed_rows(reader, t_idx, keep_untimed)
+        return
+
+    max_split = t_idx + 1
+    to_float: Optional[Callable[[str], Optional[float]]] = None
+    with f:
+        for block, quoted in _iter_line_blocks(f, monitor):
+            if not quoted:
+                for line in block.split(b"\n"):
+                    fields = line.split(b",", max_split)
+                    t = _bytes_to_float(fields[t_idx]) if t_idx < len(fields) else None
+                    if t is None and not keep_untimed:
                         continue
-                    if effective_start <= t <= effective_end:
-                        writer.writerow(row)
+                    if line.endswith(b"\r"):
+                        line = line[:-1]
+                    yield t, line.decode("utf-8", errors="ignore")
+                continue
 
-            return True
+            rows = _csv_block_rows(block)
+            if to_float is None:
+                to_float = _detect_decimal_parser(rows, [t_idx])
+            for row in rows:
+                t = to_float(row[t_idx]) if t_idx < len(row) else None
+                if t is not None or keep_untimed:
+                    yield t, row
 
-    except Exception:
-        return False
 
+def read_last_timestamp(
+    file_path: Path,
+    t_idx: int,
+    chunk_size: int = 64 * 1024,
+) -> Optional[float]:
+    """
+    Return TimeInSeconds of the last complete row by seeking back from EOF.
 
-def main():
+    Only newline-terminated lines are considered, so a row that is still being
+    written is ignored. Walks back over rows without a parseable time. Returns
+    None if no such row is found in the tail of the file, or for compressed
+    logs, which cannot be seeked. The value is only the run's maximum time
+    when the log is time-ordered; callers must verify that.
+    """
+    if is_packed_log(file_path):
+        return None
+    with file_path.open("rb") as f:
+        f.seek(0, 2)
+        file_size = f.tell()
+        read_size = min(chunk_size, file_size)
+        while read_size > 0:
+            f.seek(file_size - read_size)
+            tail = f.read(read_size)
+            # Drop the partial line after the last newline
+            tail = tail[: tail.rfind(b"\n") + 1]
+            lines = tail.split(b"\n")
+            # Without a newline before the first line it may be cut short
+            complete = lines[1:] if read_size < file_size else lines
+            for raw in reversed(complete):
+                line = raw.decode("utf-8", errors="ignore").rstrip("\r")
+                if not line:
+                    continue
+                row = next(csv.reader([line]), [])
+                if t_idx < len(row):
+                    t = parse_float(row[t_idx])
+                    if t is not None:
+                        return t
+            if read_size >= file_size or len(complete) > 1:
+                return None
+            # A single row longer than the chunk; widen the window
+            read_size = min(read_size * 2, file_size)
+    return None
+
+
+def read_time_span(file_path: Path) -> Optional[Tuple[float, float]]:
+    """
+    Return (first_time, last_time) of a log reading only its head and tail
+    (compressed logs have no tail to seek to and are read in full).
+    Returns None if the file has no TimeInSeconds column or no timed rows.
+    """
+    with open_log_text(file_path) as f:
+        reader = csv.reader(f)
+        try:
+            header = next(reader)
+            t_idx = header.index("TimeInSeconds")
+        except (StopIteration, ValueError):
+            return None
+        first_time: Optional[float] = None
+        for row in reader:
+            if t_idx < len(row):
+                first_time = parse_float(row[t_idx])
+                if first_time is not None:
+                    break
+    if first_time is None:
+        return None
+    if is_packed_log(file_path):
+        bounds = _scan_time_bounds(_fast_timed_rows(file_path, t_idx))
+        last_time = None if bounds is None else bounds[1]
+    else:
+        last_time = read_last_timestamp(file_path, t_idx)
+    if last_time is None:
+        return None
+    return first_time, last_time
+
+
+class _TrimWindow:
+    """
+    Single-pass trim filter over (time, payload) pairs ordered by time.
+
+    rows() yields (seconds since the trimmed start, payload) for every pair
+    inside [min_time + trim_start, max_time - trim_end], in file order. The bounds are
+    taken from ``bounds`` when given; otherwise the first timestamp is the start
+    and the end comes from ``last_time`` (e.g. read_last_timestamp) or, when
+    that is unknown, rows inside the trailing trim_end window are held back
+    until a later timestamp proves they are in range. Raises _NonMonotonicTime
+    when rows are not time-ordered (or last_time is not the real maximum) and
+    bounds were not given. After iteration ``valid`` tells whether the log had
+    timed rows and a non-empty trim range.
+    """
+
+    def __init__(
+        self,
+        trim_start: float = 0.0,
+        trim_end: float = 0.0,
+        bounds: Optional[Tuple[float, float]] = None,
+        last_time: Optional[float] = None,
+    ) -> None:
+        self.trim_start = trim_start
+        self.trim_end = trim_end
+        self.bounds = bounds
+        self.last_time = last_time
+        self.valid = False
+
+    def rows(self, timed: Iterable[Tuple[float, T]]) -> Iterator[Tuple[float, T]]:
+        trim_end = self.trim_end
+        bounds = self.bounds
+        last_time = self.last_time
+        self.valid = False
+
+        effective_start: Optional[float] = None
+        effective_end: Optional[float] = None
+        if bounds is not None:
+            effective_start = bounds[0] + self.trim_start
+            effective_end = bounds[1] - trim_end
+            if effective_start >= effective_end:
+                # Invalid trim range
+                return
+        elif last_time is not None:
+            effective_end = last_time - trim_end
+
+        max_time: Optional[float] = None
+        # Rows not yet known to be before the trim_end bound
+        pending: Deque[Tuple[float, T]] = deque()
+
+        for t, row in timed:
+            if bounds is None:
+                if max_time is None:
+                    max_time = t
+                    effective_start = t + self.trim_start
+                elif t < max_time:
+                    raise _NonMonotonicTime
+                elif t > max_time:
+                    max_time = t
+                    if effective_end is None:
+                        while pending and pending[0][0] < max_time - trim_end:
+                            pt, prow = pending.popleft()
+                            yield pt - effective_start, prow
+                if last_time is not None and t > last_time:
+                    raise _NonMonotonicTime
+
+            # Apply trimming
+            if t < effective_start:
+                continue
+            if effective_end is None:
+                if pending or t >= max_time - trim_end:
+                    pending.append((t, row))
+                    continue
+            elif t > effective_end or effective_start >= effective_end:
+                continue
+            yield t - effective_start, row
+
+        if bounds is None:
+            if max_time is None:
+                return
+            if last_time is not None and max_time != last_time:
+                raise _NonMonotonicTime
+            effective_end = max_time - trim_end
+            if effective_start >= effective_end:
+                # Invalid trim range
+                return
+            for t, row in pending:
+                if t <= effective_end:
+                    yield t - effective_start, row
+        self.valid = True
+
+
+# Frame-time sketch: log-spaced buckets (as in DDSketch). Bucket k holds the
+# values in (_SKETCH_BOUNDS[k-1], _SKETCH_BOUNDS[k]] and is reported as
+# 2 * bound / (GAMMA + 1), so a frame time read from the sketch is within
+# _SKETCH_ALPHA of the exact nearest-rank value. FPS percentiles invert it
+# (1000 / ms), which turns a bound of a into a / (1 - a); _SKETCH_ALPHA is
+# chosen so that both the frame time and its FPS stay within
+# SKETCH_RELATIVE_ACCURACY. The bounds span 1 us to ~1 h of frame time in
+# ~2200 buckets, whatever the capture length; both engines look buckets up
+# in the same table so they agree exactly.
+SKETCH_RELATIVE_ACCURACY = 0.005
+_SKETCH_ALPHA = SKETCH_RELATIVE_ACCURACY / (1 + SKETCH_RELATIVE_ACCURACY)
+_SKETCH_GAMMA = (1 + _SKETCH_ALPHA) / (1 - _SKETCH_ALPHA)
+_SKETCH_MIN_EXP = int(math.floor(math.log(1e-3) / math.log(_SKETCH_GAMMA)))
+_SKETCH_MAX_EXP = int(math.ceil(math.log(3.6e6) / math.log(_SKETCH_GAMMA)))
+_SKETCH_BOUNDS = [
+    _SKETCH_GAMMA ** i for i in range(_SKETCH_MIN_EXP, _SKETCH_MAX_EXP + 1)
+]
+_SKETCH_BOUNDS_NP = None if np is None else np.array(_SKETCH_BOUNDS)
+
+# Per value column: (sums, counts, per-second sketches or None)
+_Bins = Tuple[List[float], List[int], Optional[List[Optional[Dict[int, int]]]]]
+
+
+def _sketch_bucket(value: float) -> int:
+    # Values past either end are clamped into the first/last bucket
+    return min(bisect.bisect_left(_SKETCH_BOUNDS, value), len(_SKETCH_BOUNDS) - 1)
+
+
+def _sketch_merge(target: Dict[int, int], other: Dict[int, int]) -> None:
+    for bucket, count in other.items():
+        target[bucket] = target.get(bucket, 0) + count
+
+
+def sketch_quantile(sketch: Dict[int, int], q: float) -> Optional[float]:
+    """
+    Nearest-rank q-quantile of a frame-time sketch ({bucket: count}), within
+    SKETCH_RELATIVE_ACCURACY of the exact value, as is 1000 / the result for
+    FPS percentiles. None for an empty sketch.
+    """
+    total = sum(sketch.values())
+    if total <= 0:
+        return None
+    rank = max(1, int(math.ceil(q * total)))
+    seen = 0
+    for bucket in sorted(sketch):
+        seen += sketch[bucket]
+        if seen >= rank:
+            return 2.0 * _SKETCH_BOUNDS[bucket] / (_SKETCH_GAMMA + 1.0)
+    return None
+
+
+def _bin_rows(
+    window_rows: Iterable[Tuple[float, Tuple[Optional[float], ...]]],
+    transforms: List[bool],
+    sketches: Optional[List[bool]] = None,
+    bin_width: float = 1.0,
+    bins: Optional[List[_Bins]] = None,
+) -> List[_Bins]:
+    """
+    Bin trimmed (relative time, values) pairs into per-bin sums/counts.
+    ``transforms`` holds transform_is_ms_to_fps per value column; one
+    (sums, counts, sketches) triple is returned per column, filled in the same
+    pass. Columns flagged in ``sketches`` also get a frame-time sketch per
+    bin (None for bins without frames); for the others it is None.
+    Bins are ``bin_width`` seconds wide (default: whole seconds). Pass the
+    result of an earlier call as ``bins`` to keep adding rows to it; such
+    bins keep their spare capacity (see _used_bins).
+    """
+    if sketches is None:
+        sketches = [False] * len(transforms)
+    fresh = bins is None
+    if bins is None:
+        bins = [([], [], [] if sketch else None) for sketch in sketches]
+    specs = [(transform, sums, counts, hists) for transform, (sums, counts, hists)
+             in zip(transforms, bins)]
+
+    for rel_t, values in window_rows:
+        # 0-based index for bin_width buckets
+        sec_idx = int(math.floor(rel_t / bin_width))
+
+        # sums: for FPS, sum ms; for others, sum values
+        for val_raw, (transform_ms_to_fps, sums, counts, hists) in zip(values, specs):
+            if val_raw is None:
+                continue
+            # FPS metrics accumulate milliseconds; later FPS = 1000 * count / sum_ms
+            if transform_ms_to_fps and val_raw <= 0:
+                continue
+
+            # Ensure capacity; grow geometrically so long runs of small
+            # bins do not reallocate on every new bin
+            if sec_idx >= len(sums):
+                grow_by = max(sec_idx + 1, 2 * len(sums)) - len(sums)
+                sums.extend([0.0] * grow_by)
+                counts.extend([0] * grow_by)
+                if hists is not None:
+                    hists.extend([None] * grow_by)
+            sums[sec_idx] += val_raw
+            counts[sec_idx] += 1
+            if hists is not None:
+                hist = hists[sec_idx]
+                if hist is None:
+                    hist = hists[sec_idx] = {}
+                bucket = _sketch_bucket(val_raw)
+                hist[bucket] = hist.get(bucket, 0) + 1
+
+    if fresh:
+        # Drop unused capacity: the last kept bin is the last one with frames
+        for sums, counts, hists in bins:
+            length = _used_length(counts)
+            del sums[length:], counts[length:]
+            if hists is not None:
+                del hists[length:]
+    return bins
+
+
+def _used_length(counts: List[int], limit: Optional[int] = None) -> int:
+    """Number of bins up to and including the last one with frames."""
+    length = len(counts) if limit is None else min(limit, len(counts))
+    while length and counts[length - 1] == 0:
+        length -= 1
+    return length
+
+
+def _used_bins(bins: List[_Bins], limit: Optional[int] = None) -> List[_Bins]:
+    """Copies of the first ``limit`` bins without trailing empty ones."""
+    used: List[_Bins] = []
+    for sums, counts, hists in bins:
+        length = _used_length(counts, limit)
+        used.append(
+            (sums[:length], counts[:length], None if hists is None else hists[:length])
+        )
+    return used
+
+
+ENGINES = ("auto", "python", "numpy")
+
+
+def resolve_engine(engine: str) -> str:
+    """Map "auto" to "numpy" when NumPy is installed, else "python"."""
+    if engine == "auto":
+        return "python" if np is None else "numpy"
+    if engine not in ENGINES:
+        raise ValueError(f"Unsupported engine: {engine}")
+    if engine == "numpy" and np is None:
+        raise ValueError("The numpy engine requires NumPy to be installed")
+    return engine
+
+
+class _NumpyBins:
+    """
+    Per-second sums/counts (and optional frame-time sketches) of one value
+    column in growable NumPy arrays.
+    """
+
+    def __init__(self, transform_ms_to_fps: bool, sketch: bool = False) -> None:
+        self.transform_ms_to_fps = transform_ms_to_fps
+        self.sums = np.zeros(0, dtype=np.float64)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.hists: Optional[List[Optional[Dict[int, int]]]] = [] if sketch else None
+        self.length = 0
+
+    def add(self, sec_idx: "np.ndarray", values: "np.ndarray") -> None:
+        # NaN marks NA; FPS metrics also drop non-positive frame times
+        if self.transform_ms_to_fps:
+            keep = values > 0
+        else:
+            keep = ~np.isnan(values)
+        idx = sec_idx[keep]
+        if idx.size == 0:
+            return
+        kept = values[keep]
+        n_bins = int(idx.max()) + 1
+        # bincount sums each bin in input order, matching the Python engine
+        sums = np.bincount(idx, weights=kept, minlength=n_bins)
+        counts = np.bincount(idx, minlength=n_bins)
+        if n_bins > self.sums.size:
+            capacity = max(n_bins, 2 * self.sums.size)
+            self.sums = np.concatenate(
+                [self.sums, np.zeros(capacity - self.sums.size)]
+            )
+            self.counts = np.concatenate(
+                [self.counts, np.zeros(capacity - self.counts.size, dtype=np.int64)]
+            )
+        self.sums[:n_bins] += sums
+        self.counts[:n_bins] += counts
+        self.length = max(self.length, n_bins)
+
+        if self.hists is not None:
+            buckets = np.minimum(
+                np.searchsorted(_SKETCH_BOUNDS_NP, kept, side="left"),
+                len(_SKETCH_BOUNDS) - 1,
+            )
+            keys, key_counts = np.unique(
+                idx * len(_SKETCH_BOUNDS) + buckets, return_counts=True
+            )
+            hists = self.hists
+            if n_bins > len(hists):
+                hists.extend([None] * (n_bins - len(hists)))
+            for key, count in zip(keys.tolist(), key_counts.tolist()):
+                sec, bucket = divmod(key, len(_SKETCH_BOUNDS))
+                hist = hists[sec]
+                if hist is None:
+                    hist = hists[sec] = {}
+                hist[bucket] = hist.get(bucket, 0) + count
+
+    def result(self) -> _Bins:
+        hists = None if self.hists is None else self.hists[: self.length]
+        return (
+            self.sums[: self.length].tolist(),
+            self.counts[: self.length].tolist(),
+            hists,
+        )
+
+
+def _bin_arrays_numpy(
+    times: "np.ndarray",
+    values: List["np.ndarray"],
+    bins: List[_NumpyBins],
+    effective_start: float,
+    effective_end: float,
+    bin_width: float = 1.0,
+    profile: Optional[FileProfile] = None,
+) -> None:
+    """Vectorized binning of one block of rows inside the trim window."""
+    # NaN times fail both comparisons and are dropped here
+    in_window = (times >= effective_start) & (times <= effective_end)
+    if profile is not None:
+        profile.rows_in_window += int(np.count_nonzero(in_window))
+    sec_idx = np.floor((times[in_window] - effective_start) / bin_width).astype(
+        np.int64
+    )
+    for column, col_bins in zip(values, bins):
+        col_bins.add(sec_idx, column[in_window])
+
+
+def _value_chunks(
+    timed: Iterable[Tuple[float, Tuple[Optional[float], ...]]],
+    n_columns: int,
+    chunk_rows: int = 64 * 1024,
+) -> Iterator[Tuple["np.ndarray", List["np.ndarray"]]]:
+    """Group (time, values) pairs into float64 arrays, NaN for missing."""
+    nan = float("nan")
+    times = array("d")
+    columns = [array("d") for _ in range(n_columns)]
+    for t, vals in timed:
+        times.append(t)
+        for column, v in zip(columns, vals):
+            column.append(nan if v is None else v)
+        if len(times) >= chunk_rows:
+            yield np.array(times), [np.array(c) for c in columns]
+            times = array("d")
+            columns = [array("d") for _ in range(n_columns)]
+    if times:
+        yield np.array(times), [np.array(c) for c in columns]
+
+
+def _bin_chunks_numpy(
+    chunks: Iterable[Tuple["np.ndarray", List["np.ndarray"]]],
+    transforms: List[bool],
+    trim_start: float,
+    trim_end: float,
+    last_time: Optional[float],
+    sketches: Optional[List[bool]] = None,
+    bin_width: float = 1.0,
+    profile: Optional[FileProfile] = None,
+) -> List[_Bins]:
+    """
+    Streaming NumPy binning of time-ordered chunks with constant memory.
+
+    The run starts at the first timestamp and ends at ``last_time`` (or is
+    open-ended when trim_end is 0 and last_time is unknown). Rows of the
+    newest bin are carried into the next chunk so every bin is summed by a
+    single bincount, which keeps results identical to the Python engine.
+    Raises _NonMonotonicTime when time goes backwards or last_time turns out
+    not to be the maximum.
+    """
+    if sketches is None:
+        sketches = [False] * len(transforms)
+    bins = [_NumpyBins(t, sketch) for t, sketch in zip(transforms, sketches)]
+    effective_start: Optional[float] = None
+    effective_end = math.inf if last_time is None else last_time - trim_end
+    prev_time: Optional[float] = None
+    carry_times = np.zeros(0)
+    carry_values = [np.zeros(0) for _ in transforms]
+
+    for times, values in chunks:
+        if times.size == 0:
+            continue
+        if (prev_time is not None and times[0] < prev_time) or np.any(
+            np.diff(times) < 0
+        ):
+            raise _NonMonotonicTime
+        prev_time = float(times[-1])
+        if last_time is not None and prev_time > last_time:
+            raise _NonMonotonicTime
+        if effective_start is None:
+            effective_start = float(times[0]) + trim_start
+        if effective_start >= effective_end:
+            continue
+
+        if carry_times.size:
+            times = np.concatenate([carry_times, times])
+            values = [np.concatenate([c, v]) for c, v in zip(carry_values, values)]
+        lo = int(np.searchsorted(times, effective_start, side="left"))
+        hi = int(np.searchsorted(times, effective_end, side="right"))
+        if lo >= hi:
+            carry_times = np.zeros(0)
+            carry_values = [np.zeros(0) for _ in transforms]
+            continue
+        # Hold back the newest (possibly incomplete) bin
+        sec_idx = np.floor((times[lo:hi] - effective_start) / bin_width)
+        cut = lo + int(np.searchsorted(sec_idx, sec_idx[-1], side="left"))
+        _bin_arrays_numpy(
+            times[lo:cut],
+            [v[lo:cut] for v in values],
+            bins,
+            effective_start,
+            effective_end,
+            bin_width,
+            profile,
+        )
+        carry_times = times[cut:hi]
+        carry_values = [v[cut:hi] for v in values]
+
+    if prev_time is None or effective_start is None:
+        return [_NumpyBins(t, sk).result() for t, sk in zip(transforms, sketches)]
+    if last_time is not None and prev_time != last_time:
+        raise _NonMonotonicTime
+    effective_end = prev_time - trim_end
+    if effective_start >= effective_end:
+        # Invalid trim range
+        return [_NumpyBins(t, sk).result() for t, sk in zip(transforms, sketches)]
+    if carry_times.size:
+        _bin_arrays_numpy(
+            carry_times,
+            carry_values,
+            bins,
+            effective_start,
+            effective_end,
+            bin_width,
+            profile,
+        )
+    return [b.result() for b in bins]
+
+
+def _finalize_series(
+    sums: List[float],
+    counts: List[int],
+    metric: str,
+    fps_mode: str,
+    hists: Optional[List[Optional[Dict[int, int]]]] = None,
+    bin_width: float = 1.0,
+) -> List[Optional[float]]:
+    # Average per bin (or use count if fps_mode == 'count')
+    series: List[Optional[float]] = []
+    quantile = metric_quantile(metric)
+    if fps_mode == "count":
+        # Frames per second, whatever the bin width
+        for c in counts:
+            series.append(c / bin_width)
+    elif quantile is not None and hists is not None:
+        q, as_fps = quantile
+        for hist in hists:
+            ms = None if hist is None else sketch_quantile(hist, q)
+            if ms is None:
+                series.append(None)
+            else:
+                series.append(1000.0 / ms if as_fps else ms)
+    else:
+        for s, c in zip(sums, counts):
+            if c <= 0:
+                series.append(None)
+                continue
+            if metric in (
+                MetricKind.AVG_FPS,
+                MetricKind.PRESENT_FPS,
+                MetricKind.DISPLAY_FPS,
+            ):
+                # s is sum of ms; compute average FPS over the bin window
+                if s <= 0:
+                    series.append(None)
+                else:
+                    series.append(1000.0 * c / s)
+            else:
+                # Simple arithmetic mean for arbitrary columns
+                series.append(s / c)
+
+    # Trim trailing None seconds if present
+    while series and series[-1] is None:
+        series.pop()
+
+    return series
+
+
+def _summarize_run(
+    sums: List[float],
+    counts: List[int],
+    metric: str,
+    fps_mode: str,
+    hists: Optional[List[Optional[Dict[int, int]]]] = None,
+    bin_width: float = 1.0,
+) -> Optional[float]:
+    """Whole-run value of a metric from its per-bin sums/counts."""
+    total_count = sum(counts)
+    if total_count <= 0:
+        return None
+    if fps_mode == "count":
+        # Mean frames per second over the binned time
+        return total_count / (len(counts) * bin_width)
+    quantile = metric_quantile(metric)
+    if quantile is not None and hists is not None:
+        q, as_fps = quantile
+        merged: Dict[int, int] = {}
+        for hist in hists:
+            if hist is not None:
+                _sketch_merge(merged, hist)
+        ms = sketch_quantile(merged, q)
+        if ms is None:
+            return None
+        return 1000.0 / ms if as_fps else ms
+    total_sum = sum(sums)
+    if metric in (MetricKind.AVG_FPS, MetricKind.PRESENT_FPS, MetricKind.DISPLAY_FPS):
+        return 1000.0 * total_count / total_sum if total_sum > 0 else None
+    return total_sum / total_count
+
+
+class CachedColumns:
+    """
+    Memory-mapped float64 columns of one log from a ParseCache entry.
+    One value per data row; NaN marks a missing or NA field. Use as a
+    context manager so the mappings are released.
+    """
+
+    def __init__(
+        self,
+        n_rows: int,
+        time_bounds: Optional[Tuple[float, float]],
+        paths: Dict[str, Path],
+    ) -> None:
+        self.n_rows = n_rows
+        self.time_bounds = time_bounds
+        self._paths = paths
+        self._maps: List[mmap.mmap] = []
+        self._views: List[memoryview] = []
+
+    def column(self, name: str) -> Sequence[float]:
+        if self.n_rows == 0:
+            return array("d")
+        with self._paths[name].open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped).cast("d")
+        self._maps.append(mapped)
+        self._views.append(view)
+        return view
+
+    def close(self) -> None:
+        for view in self._views:
+            view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._views.clear()
+        self._maps.clear()
+
+    def __enter__(self) -> "CachedColumns":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed numeric CSV columns.
+
+    Each log gets an entry keyed by its resolved path; the entry is dropped
+    when the file's size or mtime changes. Columns are stored as raw float64
+    arrays (one file per column) and added on demand, so later runs that need
+    the same columns skip CSV tokenizing and float parsing entirely. When the
+    cache grows past ``max_bytes`` the least recently used entries are evicted.
+    A cache folder that cannot be written (read-only share, a file in the
+    way) only costs the speed-up: load() warns and returns None, and the
+    log is parsed without the cache.
+
+    Args:
+        directory: Cache directory; None keeps a ``.flourish_cache`` folder
+            next to each input
+        max_bytes: Size bound per cache directory
+    """
+
+    DIR_NAME = ".flourish_cache"
+    _CHUNK_ROWS = 64 * 1024
+
+    def __init__(
+        self, directory: Optional[Path] = None, max_bytes: int = 1024 * 1024 * 1024
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _root(self, file_path: Path) -> Path:
+        if self.directory is not None:
+            return self.directory
+        return log_file(file_path).resolve().parent / self.DIR_NAME
+
+    def _entry_dir(self, file_path: Path) -> Path:
+        key = hashlib.sha1(str(file_path.resolve()).encode("utf-8")).hexdigest()
+        return self._root(file_path) / key[:20]
+
+    @staticmethod
+    def _column_file(name: str) -> str:
+        return hashlib.sha1(name.encode("utf-8")).hexdigest()[:16] + ".f64"
+
+    def _read_meta(self, file_path: Path, entry: Path) -> Optional[dict]:
+        try:
+            with (entry / "meta.json").open("r", encoding="utf-8") as f:
+                meta = json.load(f)
+            stat = log_stat(file_path)
+        except (OSError, ValueError):
+            return None
+        if (
+            meta.get("size") != stat.st_size
+            or meta.get("mtime_ns") != stat.st_mtime_ns
+            or meta.get("byteorder") != sys.byteorder
+        ):
+            return None
+        return meta
+
+    @staticmethod
+    def _write_meta(entry: Path, meta: dict) -> None:
+        tmp = entry / f"meta.json.{os.getpid()}.tmp"
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp, entry / "meta.json")
+
+    def load(
+        self,
+        file_path: Path,
+        header: List[str],
+        names: List[str],
+        monitor: Optional[_ReadMonitor] = None,
+    ) -> Optional[CachedColumns]:
+        """
+        Return TimeInSeconds plus the named columns of file_path, parsing the
+        CSV once to add whatever the cache entry is missing. Returns None
+        (with a RuntimeWarning) when the entry cannot be written; callers
+        then read the log directly.
+        """
+        entry = self._entry_dir(file_path)
+        meta = self._read_meta(file_path, entry)
+        if meta is None:
+            shutil.rmtree(entry, ignore_errors=True)
+            stat = log_stat(file_path)
+            meta = {
+                "path": str(file_path.resolve()),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "byteorder": sys.byteorder,
+                "header": header,
+                "n_rows": 0,
+                "time_bounds": None,
+                "columns": {},
+            }
+
+        wanted = ["TimeInSeconds"] + [n for n in names if n != "TimeInSeconds"]
+        missing = [n for n in dict.fromkeys(wanted) if n not in meta["columns"]]
+        if missing:
+            try:
+                entry.mkdir(parents=True, exist_ok=True)
+                n_rows = self._extract(file_path, header, missing, entry, monitor)
+                meta["n_rows"] = n_rows
+                for name in missing:
+                    meta["columns"][name] = self._column_file(name)
+                if "TimeInSeconds" in missing:
+                    meta["time_bounds"] = self._time_bounds(
+                        entry / meta["columns"]["TimeInSeconds"], n_rows
+                    )
+                self._write_meta(entry, meta)
+            except OSError as exc:
+                warnings.warn(
+                    f"Parse cache not writable for {file_path} ({exc}); "
+                    "reading the log without it",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                return None
+            try:
+                self._evict(self._root(file_path), keep=entry)
+            except OSError:
+                # Best effort: the entry itself is complete
+                pass
+        else:
+            # Mark as recently used for LRU eviction
+            try:
+                os.utime(entry / "meta.json")
+            except OSError:
+                pass
+
+        bounds = meta["time_bounds"]
+        return CachedColumns(
+            meta["n_rows"],
+            tuple(bounds) if bounds else None,
+            {n: entry / meta["columns"][n] for n in wanted},
+        )
+
+    def _extract(
+        self,
+        file_path: Path,
+        header: List[str],
+        names: List[str],
+        entry: Path,
+        monitor: Optional[_ReadMonitor] = None,
+    ) -> int:
+        """Parse the named columns of the whole CSV into float64 files."""
+        col_idxs = [header.index(n) for n in names]
+        targets = [entry / self._column_file(n) for n in names]
+        tmp_paths = [t.with_name(f"{t.name}.{os.getpid()}.tmp") for t in targets]
+        outs = [t.open("wb") for t in tmp_paths]
+        buffers = [array("d") for _ in names]
+        nan = float("nan")
+        n_rows = 0
+        try:
+            for values in _fast_row_values(file_path, col_idxs, monitor):
+                for v, buf in zip(values, buffers):
+                    buf.append(nan if v is None else v)
+                n_rows += 1
+                if n_rows % self._CHUNK_ROWS == 0:
+                    for buf, out in zip(buffers, outs):
+                        buf.tofile(out)
+                        del buf[:]
+            for buf, out in zip(buffers, outs):
+                buf.tofile(out)
+        except BaseException:
+            # Cancelled or failed: leave no partial column files behind
+            for out in outs:
+                out.close()
+            for tmp in tmp_paths:
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
+            raise
+        finally:
+            for out in outs:
+                out.close()
+        for tmp, target in zip(tmp_paths, targets):
+            os.replace(tmp, target)
+        return n_rows
+
+    def _time_bounds(self, path: Path, n_rows: int) -> Optional[List[float]]:
+        times = array("d")
+        min_time: Optional[float] = None
+        max_time: Optional[float] = None
+        with path.open("rb") as f:
+            remaining = n_rows
+            while remaining > 0:
+                del times[:]
+                times.fromfile(f, min(remaining, self._CHUNK_ROWS))
+                remaining -= len(times)
+                for t in times:
+                    if t != t:
+                        continue
+                    if min_time is None or t < min_time:
+                        min_time = t
+                    if max_time is None or t > max_time:
+                        max_time = t
+        if min_time is None or max_time is None:
+            return None
+        return [min_time, max_time]
+
+    def _evict(self, root: Path, keep: Path) -> None:
+        entries = []
+        total = 0
+        for entry in root.iterdir():
+            if not entry.is_dir():
+                continue
+            size = sum(p.stat().st_size for p in entry.iterdir() if p.is_file())
+            try:
+                last_used = (entry / "meta.json").stat().st_mtime
+            except OSError:
+                last_used = 0.0
+            entries.append((last_used, size, entry))
+            total += size
+        for _last_used, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self, file_paths: Optional[List[Path]] = None) -> None:
+        """Remove the cache directory (or, without a directory, the cache
+        folders next to the given files)."""
+        if self.directory is not None:
+            roots = {self.directory}
+        else:
+            roots = {self._root(p) for p in file_paths or []}
+        for root in roots:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def _cached_timed_values(
+    time_col: Sequence[float],
+    value_cols: List[Sequence[float]],
+    monitor: Optional[_ReadMonitor] = None,
+) -> Iterator[Tuple[float, Tuple[Optional[float], ...]]]:
+    # NaN != NaN marks missing fields in cached columns
+    for i, (t, *values) in enumerate(zip(time_col, *value_cols)):
+        if monitor is not None and not i & 0xFFFF:
+            monitor.check()
+        if t != t:
+            continue
+        yield t, tuple(None if v != v else v for v in values)
+
+
+def _compute_file(
+    file_path: Path,
+    metrics: List[str],
+    fps_mode: str = "per-frame-mean",
+    trim_start: float = 0.0,
+    trim_end: float = 0.0,
+    cache: Optional[ParseCache] = None,
+    engine: str = "auto",
+    bin_width: float = 1.0,
+    monitor: Optional[_ReadMonitor] = None,
+) -> Tuple[str, Dict[str, List[Optional[float]]], Dict[str, Optional[float]]]:
+    """
+    One pass over a log for several metrics; see compute_per_second_multi.
+    Returns (row_name, {metric: series}, {metric: whole-run value}).
+    """
+    profile = None if monitor is None else monitor.profile
+    if profile is not None:
+        tracing = tracemalloc.is_tracing()
+        if profile.trace_memory:
+            if tracing:
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+        start = time.perf_counter()
+    try:
+        row_name, results, summary = _compute_file_bins(
+            file_path,
+            metrics,
+            fps_mode,
+            trim_start,
+            trim_end,
+            cache,
+            engine,
+            bin_width,
+            monitor,
+        )
+    finally:
+        if profile is not None:
+            profile.total_seconds = time.perf_counter() - start
+            if profile.trace_memory:
+                profile.peak_memory = tracemalloc.get_traced_memory()[1]
+                if not tracing:
+                    tracemalloc.stop()
+    if profile is not None:
+        # Whatever the readers and finalizing did not account for
+        measured = sum(
+            seconds
+            for stage, seconds in profile.seconds.items()
+            if stage != FileProfile.REMAINDER_STAGE
+        )
+        profile.seconds[FileProfile.REMAINDER_STAGE] = max(
+            0.0, profile.total_seconds - measured
+        )
+    if monitor is not None:
+        monitor.finish()
+    return row_name, results, summary
+
+
+def _compute_file_bins(
+    file_path: Path,
+    metrics: List[str],
+    fps_mode: str,
+    trim_start: float,
+    trim_end: float,
+    cache: Optional[ParseCache],
+    engine: str,
+    bin_width: float,
+    monitor: Optional[_ReadMonitor],
+) -> Tuple[str, Dict[str, List[Optional[float]]], Dict[str, Optional[float]]]:
+    # Body of _compute_file, which reports the whole file as read afterwards
+    engine = resolve_engine(engine)
+    if not bin_width > 0 or math.isinf(bin_width):
+        raise ValueError(f"Bin width must be a positive number of seconds: {bin_width}")
+    row_name: str = log_stem(file_path)
+    empty: Dict[str, List[Optional[float]]] = {m: [] for m in metrics}
+    no_summary: Dict[str, Optional[float]] = {m: None for m in metrics}
+
+    with open_log_text(file_path) as f:
+        reader = csv.reader(f)
+        try:
+            header = next(reader)
+        except StopIteration:
+            return (row_name, empty, no_summary)
+
+        # Peek the first data row to get a friendlier name
+        try:
+            first_row = next(reader)
+        except StopIteration:
+            return (row_name, empty, no_summary)
+
+    row_name = pick_row_name(file_path, header, first_row)
+
+    # Resolve columns
+    try:
+        t_idx = header.index("TimeInSeconds")
+    except ValueError as exc:
+        raise ValueError("TimeInSeconds column not found in CSV") from exc
+
+    columns: List[Tuple[str, bool]] = []
+    metric_slots: List[int] = []
+    for metric in metrics:
+        column = resolve_metric_column(header, metric)
+        if column not in columns:
+            columns.append(column)
+        metric_slots.append(columns.index(column))
+    col_idxs = [header.index(name) for name, _transform in columns]
+    transforms = [transform for _name, transform in columns]
+    # Percentile metrics need frame-time sketches on their column
+    sketches = [False] * len(columns)
+    for metric, slot in zip(metrics, metric_slots):
+        if metric_quantile(metric) is not None:
+            sketches[slot] = True
+
+    profile = None if monitor is None else monitor.profile
+    if profile is not None:
+        profile.engine = engine
+
+    def counted(items: Iterable[T], counter: str) -> Iterable[T]:
+        return items if profile is None else profile.counted(items, counter)
+
+    cached = None
+    if cache is not None:
+        cached = cache.load(
+            file_path, header, [name for name, _t in columns], monitor
+        )
+    if cached is not None:
+        with cached:
+            if profile is not None:
+                # Cache hits read no CSV rows
+                profile.rows = cached.n_rows
+            if cached.time_bounds is None:
+                return (row_name, empty, no_summary)
+            time_col = cached.column("TimeInSeconds")
+            value_cols = [cached.column(name) for name, _t in columns]
+            if engine == "numpy":
+                effective_start = cached.time_bounds[0] + trim_start
+                effective_end = cached.time_bounds[1] - trim_end
+                np_bins = [
+                    _NumpyBins(t, sketch) for t, sketch in zip(transforms, sketches)
+                ]
+                times = np.frombuffer(time_col, dtype=np.float64)
+                if profile is not None:
+                    profile.rows_timed = int(np.count_nonzero(times == times))
+                if effective_start < effective_end:
+                    _bin_arrays_numpy(
+                        times,
+                        [np.frombuffer(c, dtype=np.float64) for c in value_cols],
+                        np_bins,
+                        effective_start,
+                        effective_end,
+                        bin_width,
+                        profile,
+                    )
+                bins = [b.result() for b in np_bins]
+                del times, time_col, value_cols
+            else:
+                window = _TrimWindow(trim_start, trim_end, bounds=cached.time_bounds)
+                timed = counted(
+                    _cached_timed_values(time_col, value_cols, monitor), "rows_timed"
+                )
+                bins = _bin_rows(
+                    counted(window.rows(timed), "rows_in_window"),
+                    transforms,
+                    sketches,
+                    bin_width,
+                )
+    else:
+        bins: Optional[List[_Bins]] = None
+        last_time: Optional[float] = None
+        if trim_end > 0 or engine == "numpy":
+            # Time-ordered logs end with their largest timestamp
+            last_time = read_last_timestamp(file_path, t_idx)
+
+        try:
+            timed = counted(
+                _fast_timed_values(file_path, t_idx, col_idxs, monitor), "rows_timed"
+            )
+            if engine == "numpy" and (last_time is not None or trim_end <= 0):
+                bins = _bin_chunks_numpy(
+                    _value_chunks(timed, len(columns)),
+                    transforms,
+                    trim_start,
+                    trim_end,
+                    last_time,
+                    sketches,
+                    bin_width,
+                    profile,
+                )
+            else:
+                window = _TrimWindow(trim_start, trim_end, last_time=last_time)
+                bins = _bin_rows(
+                    counted(window.rows(timed), "rows_in_window"),
+                    transforms,
+                    sketches,
+                    bin_width,
+                )
+        except _NonMonotonicTime:
+            bins = None
+        if bins is None:
+            # Out-of-order timestamps: find the real bounds, then bin again
+            bounds = _scan_time_bounds(
+                _fast_timed_values(file_path, t_idx, [], monitor)
+            )
+            if bounds is None:
+                return (row_name, empty, no_summary)
+            window = _TrimWindow(trim_start, trim_end, bounds=bounds)
+            # Replacing timed closes the first pass, which adds its count
+            timed = counted(
+                _fast_timed_values(file_path, t_idx, col_idxs, monitor), "rows_timed"
+            )
+            if profile is not None:
+                profile.reset_rows()
+            bins = _bin_rows(
+                counted(window.rows(timed), "rows_in_window"),
+                transforms,
+                sketches,
+                bin_width,
+            )
+
+    if profile is not None:
+        start = time.perf_counter()
+    results: Dict[str, List[Optional[float]]] = {}
+    summary: Dict[str, Optional[float]] = {}
+    for metric, slot in zip(metrics, metric_slots):
+        sums, counts, hists = bins[slot]
+        results[metric] = _finalize_series(
+            sums, counts, metric, fps_mode, hists, bin_width
+        )
+        summary[metric] = _summarize_run(
+            sums, counts, metric, fps_mode, hists, bin_width
+        )
+    if profile is not None:
+        profile.seconds["finalize"] += time.perf_counter() - start
+        for metric, slot in zip(metrics, metric_slots):
+            profile.values_na[metric] = profile.rows_in_window - sum(bins[slot][1])
+    return row_name, results, summary
+
+
+def _file_monitor(
+    file_path: Path,
+    progress: Optional[ProgressCallback],
+    cancel: Optional[CancelToken],
+) -> Optional[_ReadMonitor]:
+    """Monitor reporting progress(bytes_done, file_size) for one file."""
+    if progress is None and cancel is None:
+        return None
+    monitor = _ReadMonitor(log_size(file_path), cancel=cancel)
+    if progress is not None:
+        monitor.on_bytes = lambda _n: progress(monitor.done, monitor.size)
+    return monitor
+
+
+def compute_per_second_multi(
+    file_path: Path,
+    metrics: List[str],
+    fps_mode: str = "per-frame-mean",
+    trim_start: float = 0.0,
+    trim_end: float = 0.0,
+    cache: Optional[ParseCache] = None,
+    engine: str = "auto",
+    bin_width: float = 1.0,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Tuple[str, Dict[str, List[Optional[float]]]]:
+    """
+    Computes per-second series for several metrics in one pass over the CSV.
+    Every metric is resolved through resolve_metric_column up front; metrics
+    that map to the same column share its sums/counts. With a ParseCache the
+    parsed columns are read from (and added to) the cache instead.
+    ``engine`` picks pure-Python or vectorized NumPy binning (see
+    resolve_engine); both give identical series. Logs that are not
+    time-ordered are always binned by the Python engine.
+    ``bin_width`` sets the bin size in seconds (e.g. 0.25 or 60).
+    ``progress`` is called with (bytes_read, file_size) as the file is read;
+    setting ``cancel`` stops the work with OperationCancelled.
+    Returns (row_name, {metric: series}) with series as in
+    compute_per_second_series.
+    """
+    row_name, results, _summary = _compute_file(
+        file_path,
+        metrics,
+        fps_mode,
+        trim_start,
+        trim_end,
+        cache,
+        engine,
+        bin_width,
+        _file_monitor(file_path, progress, cancel),
+    )
+    return row_name, results
+
+
+def compute_run_summary(
+    file_path: Path,
+    metrics: List[str],
+    fps_mode: str = "per-frame-mean",
+    trim_start: float = 0.0,
+    trim_end: float = 0.0,
+    cache: Optional[ParseCache] = None,
+    engine: str = "auto",
+    bin_width: float = 1.0,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Tuple[str, Dict[str, Optional[float]]]:
+    """
+    Whole-run value of each metric over the trimmed log: total frames over
+    total time for FPS metrics, the overall mean for columns and the
+    percentile over every frame (merged per-second sketches) for
+    p1_low_fps / p01_low_fps / frametime_pXX.
+    Returns (row_name, {metric: value or None}).
+    """
+    row_name, _results, summary = _compute_file(
+        file_path,
+        metrics,
+        fps_mode,
+        trim_start,
+        trim_end,
+        cache,
+        engine,
+        bin_width,
+        _file_monitor(file_path, progress, cancel),
+    )
+    return row_name, summary
+
+
+def compute_per_second_series(
+    file_path: Path,
+    metric: str,
+    fps_mode: str = "per-frame-mean",
+    trim_start: float = 0.0,
+    trim_end: float = 0.0,
+    cache: Optional[ParseCache] = None,
+    engine: str = "auto",
+    bin_width: float = 1.0,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancelToken] = None,
+) -> Tuple[str, List[Optional[float]]]:
+    """
+    Streams the CSV in a single pass, computes a per-second series for the
+    chosen metric. Memory does not grow with file size; the trim_end bound is
+    read from the tail of the file. Logs whose time goes backwards are re-read
+    once to find the true time bounds first.
+    Returns (row_name, series) where series is a list where index 0 corresponds
+    to second 1 (or to the first bin_width-second bin).
+    
+    Args:
+        file_path: Path to the CSV file
+        metric: Metric to compute
+        fps_mode: "per-frame-mean" or "count"
+        trim_start: Seconds to trim from the beginning
+        trim_end: Seconds to trim from the end
+        cache: Optional ParseCache to read parsed columns from
+        engine: "auto", "python" or "numpy" binning
+        bin_width: Bin size in seconds (default: 1.0)
+        progress: Optional callback receiving (bytes_read, file_size)
+        cancel: Optional CancelToken; raises OperationCancelled once set
+    """
+    row_name, results = compute_per_second_multi(
+        file_path,
+        [metric],
+        fps_mode=fps_mode,
+        trim_start=trim_start,
+        trim_end=trim_end,
+        cache=cache,
+        engine=engine,
+        bin_width=bin_width,
+        progress=progress,
+        cancel=cancel,
+    )
+    return row_name, results[metric]
+
+
+# Set in pool workers by _init_worker: shared cancel event and byte counter
+_WORKER_CANCEL = None
+_WORKER_BYTES = None
+
+
+def _init_worker(cancel_event, bytes_counter) -> None:
+    global _WORKER_CANCEL, _WORKER_BYTES
+    _WORKER_CANCEL = cancel_event
+    _WORKER_BYTES = bytes_counter
+
+
+def _add_worker_bytes(n_bytes: int) -> None:
+    with _WORKER_BYTES.get_lock():
+        _WORKER_BYTES.value += n_bytes
+
+
+def _compute_file_job(
+    job: Tuple[
+        Path,
+        List[str],
+        str,
+        float,
+        float,
+        Optional[ParseCache],
+        str,
+        float,
+        Optional[bool],
+    ],
+    monitor: Optional[_ReadMonitor] = None,
+) -> Tuple[
+    str,
+    Dict[str, List[Optional[float]]],
+    Dict[str, Optional[float]],
+    Optional[FileProfile],
+]:
+    # Top-level so it can be pickled for worker processes
+    (
+        file_path,
+        metrics,
+        fps_mode,
+        trim_start,
+        trim_end,
+        cache,
+        engine,
+        bin_width,
+        trace_memory,
+    ) = job
+    # trace_memory is None when profiling is off
+    profiled = trace_memory is not None
+    if monitor is None and (_WORKER_CANCEL is not None or profiled):
+        monitor = _ReadMonitor(log_size(file_path))
+        if _WORKER_CANCEL is not None:
+            monitor.on_bytes = _add_worker_bytes
+            monitor.cancel = _WORKER_CANCEL
+    if profiled:
+        monitor.profile = FileProfile(file_path, trace_memory=trace_memory)
+    row_name, series, summary = _compute_file(
+        file_path,
+        metrics,
+        fps_mode=fps_mode,
+        trim_start=trim_start,
+        trim_end=trim_end,
+        cache=cache,
+        engine=engine,
+        bin_width=bin_width,
+        monitor=monitor,
+    )
+    return row_name, series, summary, monitor.profile if profiled else None
+
+
+def compute_series_batch(
+    file_paths: List[Path],
+    metrics: List[str],
+    fps_mode: str = "per-frame-mean",
+    trims: Optional[List[Tuple[float, float]]] = None,
+    jobs: int = 1,
+    cache: Optional[ParseCache] = None,
+    engine: str = "auto",
+    summaries: Optional[List[Dict[str, Optional[float]]]] = None,
+    bin_width: float = 1.0,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancelToken] = None,
+    file_status: Optional[Callable[[int, str], None]] = None,
+    profiles: Optional[List[FileProfile]] = None,
+    profile_memory: bool = False,
+) -> List[Tuple[str, Dict[str, List[Optional[float]]]]]:
+    """
+    Runs compute_per_second_multi for every file, optionally spread over a
+    process pool. Results are returned in input order; only the compact
+    (row_name, {metric: series}) tuples cross process boundaries.
+
+    Args:
+        file_paths: Logs to process
+        metrics: Metrics to compute for every file
+        fps_mode: "per-frame-mean" or "count"
+        trims: Optional (trim_start, trim_end) per file; defaults to no trim
+        jobs: Worker processes; 1 runs in-process, 0 uses every CPU
+        cache: Optional ParseCache shared by all files
+        engine: "auto", "python" or "numpy" binning
+        summaries: Optional list that receives each file's whole-run
+            {metric: value} (see compute_run_summary), in input order
+        bin_width: Bin size in seconds (default: 1.0)
+        progress: Optional callback receiving (bytes_read, total_bytes) over
+            all files; called from the calling thread
+        cancel: Optional CancelToken; once set, running files stop within
+            one read block and OperationCancelled is raised
+        file_status: Optional callback receiving (index, state) with state
+            "running" (in-process only), "done" or "failed"
+        profiles: Optional list that receives a FileProfile per file, in
+            input order; profiling is off (and costs nothing) without it
+        profile_memory: Also record each file's peak traced memory (slow)
+
+    Raises ValueError naming the file that failed.
+    """
+    if trims is None:
+        trims = [(0.0, 0.0)] * len(file_paths)
+    # None turns profiling off in _compute_file_job
+    trace_memory = profile_memory if profiles is not None else None
+    work = [
+        (p, metrics, fps_mode, ts, te, cache, engine, bin_width, trace_memory)
+        for p, (ts, te) in zip(file_paths, trims)
+    ]
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(work))
+
+    total_bytes = 0
+    if progress is not None:
+        for p in file_paths:
+            try:
+                total_bytes += log_size(p)
+            except OSError:
+                pass
+
+    def report(state: str, index: int) -> None:
+        if file_status is not None:
+            file_status(index, state)
+
+    results: List[Tuple[str, Dict[str, List[Optional[float]]]]] = []
+    file_summaries: List[Dict[str, Optional[float]]] = []
+    file_profiles: List[FileProfile] = []
+
+    def collect(
+        result: Tuple[
+            str,
+            Dict[str, List[Optional[float]]],
+            Dict[str, Optional[float]],
+            Optional[FileProfile],
+        ]
+    ) -> None:
+        row_name, series, summary, profile = result
+        results.append((row_name, series))
+        file_summaries.append(summary)
+        if profile is not None:
+            file_profiles.append(profile)
+
+    if jobs <= 1:
+        done_bytes = 0
+
+        def on_bytes(n_bytes: int) -> None:
+            nonlocal done_bytes
+            done_bytes += n_bytes
+            progress(done_bytes, total_bytes)
+
+        for index, job in enumerate(work):
+            if cancel is not None and cancel.is_set():
+                raise OperationCancelled("Cancelled")
+            report("running", index)
+            try:
+                monitor = None
+                if progress is not None or cancel is not None:
+                    monitor = _ReadMonitor(
+                        log_size(job[0]),
+                        on_bytes if progress is not None else None,
+                        cancel,
+                    )
+                collect(_compute_file_job(job, monitor))
+            except OperationCancelled:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                report("failed", index)
+                raise ValueError(f"Failed to process {job[0]}: {exc}") from exc
+            report("done", index)
+    else:
+        cancel_event = multiprocessing.Event()
+        bytes_counter = multiprocessing.Value("q", 0)
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(cancel_event, bytes_counter),
+        ) as pool:
+            futures = [pool.submit(_compute_file_job, job) for job in work]
+            index_of = {future: index for index, future in enumerate(futures)}
+            pending = set(futures)
+            try:
+                while pending:
+                    finished, pending = wait(
+                        pending, timeout=0.1, return_when=FIRST_COMPLETED
+                    )
+                    if progress is not None:
+                        progress(min(bytes_counter.value, total_bytes), total_bytes)
+                    if cancel is not None and cancel.is_set():
+                        raise OperationCancelled("Cancelled")
+                    for future in sorted(finished, key=index_of.__getitem__):
+                        index = index_of[future]
+                        exc = future.exception()
+                        if exc is not None:
+                            report("failed", index)
+                            if isinstance(exc, OperationCancelled):
+                                raise exc
+                            raise ValueError(
+                                f"Failed to process {work[index][0]}: {exc}"
+                            ) from exc
+                        report("done", index)
+            except BaseException:
+                # Stop running workers at their next read block
+                cancel_event.set()
+                for pending_future in futures:
+                    pending_future.cancel()
+                raise
+        for future in futures:
+            collect(future.result())
+
+    if summaries is not None:
+        summaries.extend(file_summaries)
+    if profiles is not None:
+        profiles.extend(file_profiles)
+    return results
+
+
+class LogFollower:
+    """
+    Per-bin series of a log that is still being written (--follow).
+
+    poll() reads only the complete lines appended since the previous poll
+    and adds them to running per-bin sums/counts, so each update costs time
+    proportional to the new data. Rows inside the trailing trim_end window
+    are held back until later timestamps prove they are in range; after
+    finish() the series match compute_per_second_multi on the finished log.
+    The log must be time-ordered. A file that shrinks (e.g. a new capture
+    written over the old one) is followed again from the start.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        metrics: List[str],
+        fps_mode: str = "per-frame-mean",
+        trim_start: float = 0.0,
+        trim_end: float = 0.0,
+        bin_width: float = 1.0,
+    ) -> None:
+        if not bin_width > 0 or math.isinf(bin_width):
+            raise ValueError(
+                f"Bin width must be a positive number of seconds: {bin_width}"
+            )
+        if is_packed_log(file_path):
+            raise ValueError(f"Compressed logs cannot be followed: {file_path}")
+        self.file_path = file_path
+        self.metrics = metrics
+        self.fps_mode = fps_mode
+        self.trim_start = trim_start
+        self.trim_end = trim_end
+        self.bin_width = bin_width
+        self._reset()
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self.row_name = log_stem(self.file_path)
+        self._header: Optional[List[str]] = None
+        self._named = False
+        self._t_idx = 0
+        self._col_idxs: List[int] = []
+        self._transforms: List[bool] = []
+        self._sketches: List[bool] = []
+        self._metric_slots: List[int] = []
+        self._bins: Optional[List[_Bins]] = None
+        self._effective_start: Optional[float] = None
+        self._max_time: Optional[float] = None
+        self._pending: Deque[Tuple[float, Tuple[Optional[float], ...]]] = deque()
+
+    def _set_header(self, header: List[str]) -> None:
+        try:
+            self._t_idx = header.index("TimeInSeconds")
+        except ValueError as exc:
+            raise ValueError("TimeInSeconds column not found in CSV") from exc
+        columns: List[Tuple[str, bool]] = []
+        self._metric_slots = []
+        for metric in self.metrics:
+            column = resolve_metric_column(header, metric)
+            if column not in columns:
+                columns.append(column)
+            self._metric_slots.append(columns.index(column))
+        self._col_idxs = [header.index(name) for name, _transform in columns]
+        self._transforms = [transform for _name, transform in columns]
+        self._sketches = [False] * len(columns)
+        for metric, slot in zip(self.metrics, self._metric_slots):
+            if metric_quantile(metric) is not None:
+                self._sketches[slot] = True
+        self._header = header
+
+    def poll(self) -> bool:
+        """Read newly appended complete lines. Returns True if any were read."""
+        try:
+            size = self.file_path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if size < self.offset:
+            self._reset()
+        start = self.offset
+        with self.file_path.open("rb") as f:
+            f.seek(start)
+            remaining = size - start
+            leftover = b""
+            while remaining > 0:
+                chunk = f.read(min(_FAST_CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                buf = leftover + chunk
+                # A line is only parsed once its newline has been written
+                cut = buf.rfind(b"\n")
+                if cut < 0:
+                    leftover = buf
+                    continue
+                leftover = buf[cut + 1 :]
+                self._feed(buf[: cut + 1])
+                self.offset += cut + 1
+        return self.offset > start
+
+    def _feed(self, lines: bytes) -> None:
+        reader: Iterator[List[str]] = csv.reader(
+            io.StringIO(lines.decode("utf-8", errors="ignore"), newline="")
+        )
+        if self._header is None:
+            header = next(reader, None)
+            if header is None:
+                return
+            self._set_header(header)
+        assert self._header is not None
+        if not self._named:
+            first_row = next(reader, None)
+            if first_row is None:
+                return
+            self.row_name = pick_row_name(self.file_path, self._header, first_row)
+            self._named = True
+            reader = itertools.chain([first_row], reader)
+
+        self._bins = _bin_rows(
+            self._trim(_timed_values(reader, self._t_idx, self._col_idxs)),
+            self._transforms,
+            self._sketches,
+            self.bin_width,
+            self._bins,
+        )
+
+    def _trim(
+        self, timed: Iterable[Tuple[float, Tuple[Optional[float], ...]]]
+    ) -> Iterator[Tuple[float, Tuple[Optional[float], ...]]]:
+        # Incremental form of _TrimWindow.rows with an unknown end
+        pending = self._pending
+        trim_end = self.trim_end
+        for t, values in timed:
+            if self._max_time is None:
+                self._max_time = t
+                self._effective_start = t + self.trim_start
+            elif t < self._max_time:
+                raise ValueError(
+                    f"TimeInSeconds goes backwards in {self.file_path}; "
+                    "follow mode needs a time-ordered log"
+                )
+            elif t > self._max_time:
+                self._max_time = t
+                while pending and pending[0][0] < t - trim_end:
+                    pt, pvalues = pending.popleft()
+                    yield pt - self._effective_start, pvalues
+            if t < self._effective_start:
+                continue
+            if pending or t >= self._max_time - trim_end:
+                pending.append((t, values))
+                continue
+            yield t - self._effective_start, values
+
+    def finish(self) -> None:
+        """Bin the held-back rows; call once the log is complete."""
+        if self._max_time is None or self._bins is None:
+            return
+        effective_end = self._max_time - self.trim_end
+        rows = [
+            (t - self._effective_start, values)
+            for t, values in self._pending
+            if t <= effective_end
+        ]
+        self._pending.clear()
+        self._bins = _bin_rows(
+            rows, self._transforms, self._sketches, self.bin_width, self._bins
+        )
+
+    def _closed_bins(self, include_open: bool) -> Optional[List[_Bins]]:
+        if self._bins is None or self._max_time is None:
+            return None
+        assert self._effective_start is not None
+        effective_end = self._max_time - self.trim_end
+        if self._effective_start >= effective_end:
+            # Invalid trim range (so far)
+            return None
+        limit: Optional[int] = None
+        if not include_open:
+            # Bins from the one holding effective_end on may still get rows
+            limit = int(
+                math.floor((effective_end - self._effective_start) / self.bin_width)
+            )
+        return _used_bins(self._bins, limit)
+
+    def series(
+        self, include_open: bool = False
+    ) -> Tuple[str, Dict[str, List[Optional[float]]]]:
+        """
+        (row_name, {metric: series}) for what has been read so far. The bin
+        that can still receive rows is left out unless ``include_open``.
+        """
+        bins = self._closed_bins(include_open)
+        if bins is None:
+            return self.row_name, {m: [] for m in self.metrics}
+        results: Dict[str, List[Optional[float]]] = {}
+        for metric, slot in zip(self.metrics, self._metric_slots):
+            sums, counts, hists = bins[slot]
+            results[metric] = _finalize_series(
+                sums, counts, metric, self.fps_mode, hists, self.bin_width
+            )
+        return self.row_name, results
+
+    def summary(self, include_open: bool = False) -> Dict[str, Optional[float]]:
+        """Whole-run value of each metric so far (see compute_run_summary)."""
+        bins = self._closed_bins(include_open)
+        if bins is None:
+            return {m: None for m in self.metrics}
+        summary: Dict[str, Optional[float]] = {}
+        for metric, slot in zip(self.metrics, self._metric_slots):
+            sums, counts, hists = bins[slot]
+            summary[metric] = _summarize_run(
+                sums, counts, metric, self.fps_mode, hists, self.bin_width
+            )
+        return summary
+
+
+def metric_slug(metric: str) -> str:
+    """Filesystem/label friendly form of a metric, e.g. GPU0Util_pct."""
+    if metric.startswith(MetricKind.COLUMN_PREFIX):
+        metric = metric[len(MetricKind.COLUMN_PREFIX) :]
+    slug = metric.replace("%", "pct")
+    slug = "".join(ch if ch.isalnum() else "_" for ch in slug)
+    return "_".join(tok for tok in slug.split("_") if tok) or "metric"
+
+
+def metric_output_path(output_path: Path, metric: str) -> Path:
+    """Per-metric output path: flourish_out.csv -> flourish_out_avg_fps.csv."""
+    return output_path.with_name(
+        f"{output_path.stem}_{metric_slug(metric)}{output_path.suffix}"
+    )
+
+
+def bin_labels(n_bins: int, bin_width: float = 1.0, first_bin: int = 0) -> List[str]:
+    """
+    Timeline header labels: the end time of each bin in seconds, e.g.
+    1, 2, 3 for whole seconds or 0.25, 0.5, 0.75 for quarter-second bins.
+    Labels start at bin ``first_bin`` (e.g. 601 for the second of several
+    600-bin segments).
+    """
+    if bin_width == 1.0:
+        return [str(i + 1) for i in range(first_bin, first_bin + n_bins)]
+    # Multiply rather than accumulate so long timelines do not drift
+    return [
+        f"{(i + 1) * bin_width:.6f}".rstrip("0").rstrip(".")
+        for i in range(first_bin, first_bin + n_bins)
+    ]
+
+
+# (label, per-bin series) row of an output file
+SeriesRow = Tuple[str, Sequence[Optional[float]]]
+# File layout of the columnar format (see write_columnar)
+COLUMNAR_MAGIC = b"FVCOL1"
+_COLUMNAR_TAIL = struct.Struct("<I6s")
+
+
+def format_values(values: Sequence[Optional[float]]) -> List[str]:
+    """
+    Output text of a batch of values: three decimals without trailing
+    zeros (150.5, 60, -0.125), and "" for None or NaN. The whole batch goes
+    through one %-format and a few string passes instead of a call per value.
+    """
+    if not values:
+        return []
+    nan = float("nan")
+    text = ("%.3f\n" * len(values)) % tuple(nan if v is None else v for v in values)
+    # At most three trailing zeros, then a bare decimal point
+    for zero in ("0\n", "0\n", "0\n", ".\n"):
+        text = text.replace(zero, "\n")
+    strings = text.split("\n")
+    del strings[-1]
+    if "nan" in strings:
+        strings = ["" if s == "nan" else s for s in strings]
+    return strings
+
+
+def _unique_rows(rows: Iterable[SeriesRow]) -> Iterator[SeriesRow]:
+    # Repeated labels get a _2, _3, ... suffix
+    seen_labels: Dict[str, int] = {}
+    for name, series in rows:
+        if name in seen_labels:
+            seen_labels[name] += 1
+            yield f"{name}_{seen_labels[name]}", series
+        else:
+            seen_labels[name] = 1
+            yield name, series
+
+
+def write_flourish_wide_csv(
+    output_path: Path,
+    rows: Iterable[SeriesRow],
+    bin_width: float = 1.0,
+    first_bin: int = 0,
+):
+    """
+    Wide layout for Flourish's Bar chart race: a Label column plus one
+    column per bin. Every row is cut to the shortest series and gaps are
+    written as 0, as the chart needs a number in every cell. ``first_bin``
+    is the timeline position of the series' first value (see bin_labels).
+    """
+    rows = list(rows)
+    # Common length: shortest series
+    min_len = min((len(series) for _, series in rows), default=0)
+    with output_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        if min_len == 0:
+            # No data; still write header only
+            writer.writerow(["Label"])
+            return
+        writer.writerow(["Label"] + bin_labels(min_len, bin_width, first_bin))
+        for name, series in _unique_rows(rows):
+            values = [0.0 if v is None else v for v in series[:min_len]]
+            writer.writerow([name] + format_values(values))
+
+
+def write_long_csv(
+    output_path: Path,
+    rows: Iterable[SeriesRow],
+    bin_width: float = 1.0,
+    first_bin: int = 0,
+):
+    """
+    Long (tidy) layout: one Label,Time,Value line per bin of every series,
+    Time being the bin's end as in the wide header and Value blank for a
+    bin without data. Rows are written as they come, so a generator of
+    rows is never held in memory as a whole.
+    """
+    with output_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Label", "Time", "Value"])
+        for name, series in _unique_rows(rows):
+            times = bin_labels(len(series), bin_width, first_bin)
+            writer.writerows(
+                zip(itertools.repeat(name), times, format_values(series))
+            )
+
+
+def write_series_json(
+    output_path: Path,
+    rows: Iterable[SeriesRow],
+    bin_width: float = 1.0,
+    first_bin: int = 0,
+):
+    """
+    JSON layout: {"bin_width": w, "first_bin": k, "series": [{"label": ...,
+    "values": [...]}, ...]} with null for bins without data; value i covers
+    the bin ending at (k + i + 1) * w seconds. Series are written one at a
+    time.
+    """
+    with output_path.open("w", encoding="utf-8") as f:
+        f.write(
+            f'{{"bin_width": {json.dumps(bin_width)}, "first_bin": {first_bin}, '
+            '"series": ['
+        )
+        for i, (name, series) in enumerate(_unique_rows(rows)):
+            values = ", ".join(s or "null" for s in format_values(series))
+            f.write(
+                f'{"," if i else ""}\n  '
+                f'{{"label": {json.dumps(name)}, "values": [{values}]}}'
+            )
+        f.write("\n]}\n")
+
+
+def write_columnar(
+    output_path: Path,
+    rows: Iterable[SeriesRow],
+    bin_width: float = 1.0,
+    first_bin: int = 0,
+):
+    """
+    Compact binary layout with one column per series: every column is its
+    float64 little-endian values (NaN for bins without data), zlib
+    compressed, written as it comes. A JSON footer lists bin_width,
+    first_bin and each column's label, length, offset and compressed size;
+    the file ends with the footer's size (uint32 LE) and COLUMNAR_MAGIC.
+    See read_columnar.
+    """
+    columns = []
+    offset = 0
+    with output_path.open("wb") as f:
+        for name, series in _unique_rows(rows):
+            values = array("d", (math.nan if v is None else v for v in series))
+            if sys.byteorder != "little":
+                values.byteswap()
+            blob = zlib.compress(values.tobytes())
+            f.write(blob)
+            columns.append(
+                {
+                    "label": name,
+                    "length": len(values),
+                    "offset": offset,
+                    "bytes": len(blob),
+                }
+            )
+            offset += len(blob)
+        footer = json.dumps(
+            {
+                "format": 1,
+                "bin_width": bin_width,
+                "first_bin": first_bin,
+                "dtype": "<f8",
+                "columns": columns,
+            }
+        ).encode("utf-8")
+        f.write(footer)
+        f.write(_COLUMNAR_TAIL.pack(len(footer), COLUMNAR_MAGIC))
+
+
+def read_columnar(
+    input_path: Path,
+) -> Tuple[List[Tuple[str, List[Optional[float]]]], float, int]:
+    """
+    Read a write_columnar file back as ((label, series) rows, bin_width,
+    first_bin).
+    """
+    with input_path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size < _COLUMNAR_TAIL.size:
+            raise ValueError(f"Not a columnar output file: {input_path}")
+        f.seek(size - _COLUMNAR_TAIL.size)
+        footer_size, magic = _COLUMNAR_TAIL.unpack(f.read(_COLUMNAR_TAIL.size))
+        if magic != COLUMNAR_MAGIC or footer_size > size - _COLUMNAR_TAIL.size:
+            raise ValueError(f"Not a columnar output file: {input_path}")
+        f.seek(size - _COLUMNAR_TAIL.size - footer_size)
+        footer = json.loads(f.read(footer_size))
+        rows: List[Tuple[str, List[Optional[float]]]] = []
+        for column in footer["columns"]:
+            f.seek(column["offset"])
+            values = array("d")
+            values.frombytes(zlib.decompress(f.read(column["bytes"])))
+            if sys.byteorder != "little":
+                values.byteswap()
+            rows.append(
+                (column["label"], [None if math.isnan(v) else v for v in values])
+            )
+    return rows, footer["bin_width"], footer.get("first_bin", 0)
+
+
+# Output format name -> (default file suffix, writer)
+OUTPUT_WRITERS: Dict[
+    str,
+    Tuple[str, Callable[[Path, Iterable[SeriesRow], float, int], None]],
+] = {
+    "wide": (".csv", write_flourish_wide_csv),
+    "long": (".csv", write_long_csv),
+    "json": (".json", write_series_json),
+    "columnar": (".fvc", write_columnar),
+}
+
+
+def write_series(
+    output_path: Path,
+    rows: Iterable[SeriesRow],
+    bin_width: float = 1.0,
+    output_format: str = "wide",
+    first_bin: int = 0,
+):
+    """Write (label, series) rows with the OUTPUT_WRITERS entry for output_format."""
+    try:
+        _suffix, writer = OUTPUT_WRITERS[output_format]
+    except KeyError:
+        formats = ", ".join(OUTPUT_WRITERS)
+        raise ValueError(
+            f"Unsupported output format {output_format!r} (use one of: {formats})"
+        ) from None
+    writer(output_path, rows, bin_width, first_bin)
+
+
+# (segment file, first bin, bin count) of a segmented output
+SegmentEntry = Tuple[Path, int, int]
+SEGMENT_INDEX_FIELDS = ("output", "segment", "path", "start", "end", "bins")
+_SEGMENT_STEM = re.compile(r"(.*)_part\d{3,}")
+
+
+def segment_output_path(output_path: Path, index: int) -> Path:
+    """Path of segment ``index`` (from 0): flourish_out.csv -> flourish_out_part001.csv."""
+    return output_path.with_name(
+        f"{output_path.stem}_part{index + 1:03d}{output_path.suffix}"
+    )
+
+
+def segment_index_path(output_path: Path) -> Path:
+    """Index of a segmented output: flourish_out.csv -> flourish_out_segments.csv."""
+    return output_path.with_name(f"{output_path.stem}_segments.csv")
+
+
+def write_segments(
+    output_path: Path,
+    rows: List[Tuple[str, List[Optional[float]]]],
+    segment_bins: int,
+    bin_width: float = 1.0,
+    output_format: str = "wide",
+    finished: Optional[Set[Path]] = None,
+) -> Iterator[SegmentEntry]:
+    """
+    Split the timeline into files of ``segment_bins`` bins (see
+    segment_output_path), writing each as soon as it is generated and
+    yielding its (path, first_bin, bins); only one segment's slice of the
+    rows is formatted at a time. The wide layout is cut to the shortest
+    series first, as in an unsplit file.
+
+    Pass a set as ``finished`` when the rows only ever grow (--follow): full
+    segments are added to it and not written again on later calls.
+    """
+    if segment_bins <= 0:
+        raise ValueError(f"Segments need at least one bin: {segment_bins}")
+    lengths = [len(series) for _, series in rows]
+    if output_format == "wide":
+        n_bins = min(lengths, default=0)
+    else:
+        n_bins = max(lengths, default=0)
+    for index, first_bin in enumerate(range(0, max(n_bins, 1), segment_bins)):
+        path = segment_output_path(output_path, index)
+        end = min(first_bin + segment_bins, n_bins)
+        if finished is None or path not in finished:
+            write_series(
+                path,
+                [(name, series[first_bin:end]) for name, series in rows],
+                bin_width,
+                output_format,
+                first_bin,
+            )
+            if finished is not None and end - first_bin == segment_bins:
+                finished.add(path)
+        yield path, first_bin, end - first_bin
+
+
+def write_segment_index(
+    index_path: Path,
+    segments: List[Tuple[Path, List[SegmentEntry]]],
+    bin_width: float = 1.0,
+):
+    """
+    Writes one SEGMENT_INDEX_FIELDS row per segment file: the name of the
+    unsplit output it belongs to, its number (from 1), its file name (the
+    segments sit next to the index) and the time range it covers in seconds.
+    """
+    with index_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(SEGMENT_INDEX_FIELDS)
+        for output_path, entries in segments:
+            for number, (path, first_bin, bins) in enumerate(entries, start=1):
+                start, end = format_values(
+                    [first_bin * bin_width, (first_bin + bins) * bin_width]
+                )
+                writer.writerow([output_path.name, number, path.name, start, end, bins])
+
+
+def summary_output_path(output_path: Path, output_format: str = "wide") -> Path:
+    """
+    Path of the --summary CSV: flourish_out.csv -> flourish_out_summary.csv.
+    Outputs in a non-CSV format get a .csv summary next to them.
+    """
+    suffix = output_path.suffix if OUTPUT_WRITERS[output_format][0] == ".csv" else ".csv"
+    return output_path.with_name(f"{output_path.stem}_summary{suffix}")
+
+
+def write_run_summary_csv(
+    output_path: Path,
+    metrics: List[str],
+    rows: List[Tuple[str, Dict[str, Optional[float]]]],
+):
+    """
+    Writes one row per log with its whole-run value for every metric
+    (see compute_run_summary); missing values are left blank.
+    """
+    with output_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Label"] + [metric_slug(m) for m in metrics])
+        for name, summary in rows:
+            writer.writerow([name] + format_values([summary.get(m) for m in metrics]))
+
+
+def write_profile_report(
+    output_path: Path,
+    profiles: List[FileProfile],
+    writes: List[Tuple[Path, float]],
+    wall_seconds: Optional[float] = None,
+):
+    """
+    Writes the FileProfile of every log plus the time taken to write each
+    output file, as JSON or (for a .csv path) as one CSV row per log and
+    output.
+    """
+    outputs = []
+    for path, seconds in writes:
+        try:
+            size: Optional[int] = path.stat().st_size
+        except OSError:
+            size = None
+        outputs.append({"path": str(path), "seconds": seconds, "bytes": size})
+
+    if output_path.suffix.lower() != ".csv":
+        report = {
+            "wall_seconds": wall_seconds,
+            "files": [p.as_dict() for p in profiles],
+            "outputs": outputs,
+        }
+        with output_path.open("w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        return
+
+    metrics = list(dict.fromkeys(m for p in profiles for m in p.values_na))
+    with output_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["path", "engine", "total_seconds"]
+            + [f"{stage}_seconds" for stage in FileProfile.STAGES + ("write",)]
+            + ["bytes", "rows", "rows_skipped_no_time", "rows_skipped_trim"]
+            + [f"values_skipped_na:{metric_slug(m)}" for m in metrics]
+            + ["peak_memory_bytes"]
+        )
+        for profile in profiles:
+            info = profile.as_dict()
+            writer.writerow(
+                [info["file"], info["engine"], info["total_seconds"]]
+                + [info["seconds"][stage] for stage in FileProfile.STAGES]
+                + [""]
+                + [
+                    info["bytes_read"],
+                    info["rows"],
+                    info["rows_skipped_no_time"],
+                    info["rows_skipped_trim"],
+                ]
+                + [info["values_skipped_na"].get(m, "") for m in metrics]
+                + [info["peak_memory_bytes"]]
+            )
+        for output in outputs:
+            writer.writerow(
+                [output["path"], "", output["seconds"]]
+                + [""] * len(FileProfile.STAGES)
+                + [output["seconds"], output["bytes"]]
+                + [""] * (3 + len(metrics) + 1)
+            )
+
+
+def compute_difference_series(
+    base: List[Optional[float]],
+    other: List[Optional[float]],
+) -> List[Optional[float]]:
+    min_len = min(len(base), len(other))
+    diff: List[Optional[float]] = []
+    for i in range(min_len):
+        a = base[i]
+        b = other[i]
+        if a is None or b is None or a == 0:
+            diff.append(None)
+            continue
+        diff.append(100.0 * (b / a - 1.0))
+    return diff
+
+
+def compute_difference_matrix(
+    base: List[Optional[float]],
+    others: Sequence[List[Optional[float]]],
+    engine: str = "auto",
+) -> List[List[Optional[float]]]:
+    """
+    compute_difference_series of base against every series in others. The
+    numpy engine computes all candidates and bins as one array operation.
+    """
+    if resolve_engine(engine) == "python" or not others:
+        return [compute_difference_series(base, other) for other in others]
+    n_bins = len(base)
+    base_arr = np.array([np.nan if v is None else v for v in base], dtype=float)
+    other_arr = np.full((len(others), n_bins), np.nan)
+    for row, other in zip(other_arr, others):
+        values = other[:n_bins]
+        row[: len(values)] = [np.nan if v is None else v for v in values]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        diff = 100.0 * (other_arr / base_arr - 1.0)
+    diff[:, base_arr == 0] = np.nan
+    return [
+        [None if math.isnan(v) else v for v in row[: min(n_bins, len(other))]]
+        for row, other in zip(diff.tolist(), others)
+    ]
+
+
+def compare_rows(
+    rows: List[Tuple[str, List[Optional[float]]]],
+    difference_only: bool = False,
+    engine: str = "auto",
+) -> List[Tuple[str, List[Optional[float]]]]:
+    """
+    Compare mode rows: the first (name, series) row is the baseline and the
+    others are candidates. Returns the input rows followed by one percentage
+    difference row per candidate, 100 * (candidate / baseline - 1), or only
+    the difference rows. A single candidate's row is labelled "%", several
+    are labelled "<candidate> %".
+    """
+    (_base_name, base), candidates = rows[0], rows[1:]
+    diffs = compute_difference_matrix(base, [series for _, series in candidates], engine)
+    if len(candidates) == 1:
+        diff_rows = [("%", diffs[0])]
+    else:
+        diff_rows = [(f"{name} %", diff) for (name, _), diff in zip(candidates, diffs)]
+    return diff_rows if difference_only else rows + diff_rows
+
+
+# Statistic rows written per group of repeated runs, in output order
+AGGREGATE_STATS = ("mean", "median", "min", "max", "ci95_low", "ci95_high")
+# Two-sided 95% Student t critical values for 1..30 degrees of freedom
+_T95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+# Explicit run marker ending a row name: "_run1", " pass 3", "Run2", "_r2",
+# " (5)". A bare trailing number is left alone: it is often part of the
+# scene (Game_60 and Game_120 are different frame caps)
+_RUN_MARKER_PATTERN = (
+    r"[ _-]+(?i:run|pass|take)[ _-]*\d+"
+    r"|(?<=[a-z0-9])(?:Run|Pass|Take)[ _-]*\d+"
+    r"|[ _-]+[rR]\d+"
+    r"|[ _-]*\(\d+\)"
+)
+_RUN_MARKER = re.compile(rf"(?:{_RUN_MARKER_PATTERN})$")
+# For --group-by number: a bare trailing number ("_2", " 3") ends a run too
+_RUN_NUMBER = re.compile(rf"(?:{_RUN_MARKER_PATTERN}|[ _-]+\d+)$")
+
+
+def _t95(df: int) -> float:
+    if df <= len(_T95):
+        return _T95[df - 1]
+    # Cornish-Fisher expansion around the normal quantile
+    z = 1.959964
+    return z + (z**3 + z) / (4 * df)
+
+
+def group_runs(
+    paths: Sequence[Path], names: Sequence[str], group_by: str = "name"
+) -> List[str]:
+    """
+    Group key of every run for aggregate_runs.
+
+    ``name`` drops an explicit run marker from the end of the row name
+    (Scene_run1, Scene pass2, Scene_r3 and Scene (4) all become Scene) but
+    keeps bare numbers, so Game_60 and Game_120 stay apart; ``number`` drops
+    any trailing number as well (Scene_1 becomes Scene); ``re:PATTERN`` uses
+    the first group (or the whole match) of PATTERN searched in the row
+    name, keeping the name when it does not match; a catalog field such as
+    ``application`` or ``gpu`` uses that value from the log's first row.
+    """
+    if group_by in ("name", "number"):
+        suffix = _RUN_MARKER if group_by == "name" else _RUN_NUMBER
+        return [suffix.sub("", name) or name for name in names]
+    if group_by.startswith("re:"):
+        pattern = re.compile(group_by[len("re:") :])
+        keys = []
+        for name in names:
+            match = pattern.search(name)
+            if match is None:
+                keys.append(name)
+            else:
+                keys.append(match.group(1) if pattern.groups else match.group(0))
+        return keys
+    if group_by in _CATALOG_RUN_COLUMNS:
+        return [
+            str(read_log_info(p, count_rows=False)[group_by] or "unknown")
+            for p in paths
+        ]
+    fields = ", ".join(["name", "number", "re:PATTERN"] + list(_CATALOG_RUN_COLUMNS))
+    raise ValueError(f"Unsupported grouping {group_by!r} (use one of: {fields})")
+
+
+def aggregate_runs(
+    runs: Sequence[List[Optional[float]]], engine: str = "auto"
+) -> Dict[str, List[Optional[float]]]:
+    """
+    Reduce the per-bin series of repeated runs to one series per statistic
+    in AGGREGATE_STATS: mean, median, min, max and the 95% confidence
+    interval of the mean (Student t over the runs with a value in that bin).
+
+    Series may differ in length; each bin uses the runs that reach it and
+    have a value there, and the interval is None below two such runs. The
+    numpy engine reduces a runs x bins array in one go.
+    """
+    engine = resolve_engine(engine)
+    n_bins = max((len(series) for series in runs), default=0)
+    if engine == "numpy":
+        return _aggregate_runs_numpy(runs, n_bins)
+
+    stats: Dict[str, List[Optional[float]]] = {s: [] for s in AGGREGATE_STATS}
+    for i in range(n_bins):
+        values = [
+            series[i] for series in runs if i < len(series) and series[i] is not None
+        ]
+        if not values:
+            for s in AGGREGATE_STATS:
+                stats[s].append(None)
+            continue
+        mean = math.fsum(values) / len(values)
+        stats["mean"].append(mean)
+        stats["median"].append(statistics.median(values))
+        stats["min"].append(min(values))
+        stats["max"].append(max(values))
+        if len(values) < 2:
+            stats["ci95_low"].append(None)
+            stats["ci95_high"].append(None)
+            continue
+        half = _t95(len(values) - 1) * statistics.stdev(values) / math.sqrt(len(values))
+        stats["ci95_low"].append(mean - half)
+        stats["ci95_high"].append(mean + half)
+    return stats
+
+
+def _aggregate_runs_numpy(
+    runs: Sequence[List[Optional[float]]], n_bins: int
+) -> Dict[str, List[Optional[float]]]:
+    values = np.full((len(runs), n_bins), np.nan)
+    for row, series in zip(values, runs):
+        row[: len(series)] = [np.nan if v is None else v for v in series]
+    counts = np.count_nonzero(~np.isnan(values), axis=0)
+    with warnings.catch_warnings():
+        # All-NaN bins just give NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean = np.nanmean(values, axis=0)
+        half = np.full(n_bins, np.nan)
+        several = counts >= 2
+        if several.any():
+            t = np.array([_t95(int(n) - 1) for n in counts[several]])
+            sd = np.nanstd(values[:, several], axis=0, ddof=1)
+            half[several] = t * sd / np.sqrt(counts[several])
+        columns = {
+            "mean": mean,
+            "median": np.nanmedian(values, axis=0),
+            "min": np.nanmin(values, axis=0),
+            "max": np.nanmax(values, axis=0),
+            "ci95_low": mean - half,
+            "ci95_high": mean + half,
+        }
+    return {
+        s: [None if math.isnan(v) else v for v in columns[s].tolist()]
+        for s in AGGREGATE_STATS
+    }
+
+
+def aggregate_rows(
+    rows: List[Tuple[str, List[Optional[float]]]],
+    keys: Sequence[str],
+    engine: str = "auto",
+) -> List[Tuple[str, List[Optional[float]]]]:
+    """
+    Replace the (name, series) rows of repeated runs by ``<key>_<stat>``
+    rows, one group per distinct key in order of first appearance.
+    """
+    groups: Dict[str, List[List[Optional[float]]]] = {}
+    for key, (_name, series) in zip(keys, rows):
+        groups.setdefault(key, []).append(series)
+    out: List[Tuple[str, List[Optional[float]]]] = []
+    for key, runs in groups.items():
+        stats = aggregate_runs(runs, engine)
+        out.extend((f"{key}_{s}", stats[s]) for s in AGGREGATE_STATS)
+    return out
+
+
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+
+
+def _lttb_series(
+    series: Sequence[Optional[float]], bucket_bins: int
+) -> List[Optional[float]]:
+    # One value per bucket_bins-wide bucket, Largest-Triangle-Three-Buckets
+    # style: the first bucket keeps its first value and the last bucket its
+    # last; every other bucket keeps the value forming the largest triangle
+    # with the previously kept point and the average of the next bucket
+    n = len(series)
+    n_buckets = -(-n // bucket_bins)
+    out: List[Optional[float]] = []
+    prev: Optional[Tuple[int, float]] = None
+    for b in range(n_buckets):
+        lo = b * bucket_bins
+        points = [
+            (i, series[i])
+            for i in range(lo, min(lo + bucket_bins, n))
+            if series[i] is not None
+        ]
+        if not points:
+            out.append(None)
+            continue
+        if prev is None:
+            chosen = points[0]
+        elif b == n_buckets - 1:
+            chosen = points[-1]
+        else:
+            hi = lo + bucket_bins
+            following = [
+                (i, series[i])
+                for i in range(hi, min(hi + bucket_bins, n))
+                if series[i] is not None
+            ]
+            ax, ay = prev
+            if following:
+                cx = math.fsum(i for i, _ in following) / len(following)
+                cy = math.fsum(v for _, v in following) / len(following)
+                chosen = max(
+                    points,
+                    key=lambda p: abs(
+                        (ax - cx) * (p[1] - ay) - (ax - p[0]) * (cy - ay)
+                    ),
+                )
+            else:
+                # No next bucket to aim at: keep the largest step
+                chosen = max(points, key=lambda p: abs(p[1] - ay))
+        out.append(chosen[1])
+        prev = chosen
+    return out
+
+
+def _minmax_series(
+    series: Sequence[Optional[float]], bucket_bins: int
+) -> List[Optional[float]]:
+    # Two values per bucket: its minimum and maximum, in time order
+    out: List[Optional[float]] = []
+    for lo in range(0, len(series), bucket_bins):
+        values = [v for v in series[lo : lo + bucket_bins] if v is not None]
+        if not values:
+            out.extend((None, None))
+            continue
+        i_min = values.index(min(values))
+        i_max = values.index(max(values))
+        first, last = sorted((i_min, i_max))
+        out.extend((values[first], values[last]))
+    return out
+
+
+def downsample_rows(
+    rows: List[Tuple[str, List[Optional[float]]]],
+    points: int,
+    method: str = "lttb",
+    bin_width: float = 1.0,
+    n_bins: Optional[int] = None,
+) -> Tuple[List[Tuple[str, List[Optional[float]]]], float]:
+    """
+    Shrink every row to about ``points`` values that keep its shape: the
+    timeline is cut into equal buckets shared by all rows (so a compare "%"
+    row is reduced like the rows it came from) and each bucket keeps one
+    value chosen by Largest-Triangle-Three-Buckets ("lttb") or its minimum
+    and maximum in time order ("minmax"), so stutters survive where a
+    plain average would smooth them away. Cost is O(bins) per row.
+
+    Buckets are sized for ``n_bins`` bins (default: the longest row); pass
+    the same value to reduce several tables alike. Returns the rows and
+    the bin width of their values in seconds; rows already that short are
+    returned unchanged.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        methods = ", ".join(DOWNSAMPLE_METHODS)
+        raise ValueError(
+            f"Unsupported downsampling {method!r} (use one of: {methods})"
+        )
+    if points < 2:
+        raise ValueError(f"Downsampling needs at least 2 points: {points}")
+    if n_bins is None:
+        n_bins = max((len(series) for _, series in rows), default=0)
+    if n_bins <= points:
+        return rows, bin_width
+    per_bucket = 2 if method == "minmax" else 1
+    bucket_bins = -(-n_bins // (points // per_bucket))
+    reduce = _minmax_series if method == "minmax" else _lttb_series
+    return (
+        [(name, reduce(series, bucket_bins)) for name, series in rows],
+        bin_width * bucket_bins / per_bucket,
+    )
+
+
+# Rows added per candidate by the bootstrap compare, in output order
+BOOTSTRAP_STATS = ("difference", "low", "high")
+# Cap on resampled values held at once per bin (replicates x frames)
+_BOOTSTRAP_CHUNK_VALUES = 1 << 20
+# Bins per worker task
+_BOOTSTRAP_JOB_BINS = 64
+# Per candidate: ({stat: per-bin series}, {stat: whole-run value, "bins": n})
+BootstrapResult = Tuple[Dict[str, List[Optional[float]]], Dict[str, Optional[float]]]
+
+
+def read_frame_bins(
+    file_path: Path,
+    metrics: List[str],
+    trim_start: float = 0.0,
+    trim_end: float = 0.0,
+    bin_width: float = 1.0,
+    cache: Optional[ParseCache] = None,
+) -> Tuple[str, Dict[str, List["np.ndarray"]]]:
+    """
+    Frame values behind every metric, grouped by bin: returns (row_name,
+    {metric: [values of bin 0, bin 1, ...]}). Trimming and binning match
+    compute_per_second_multi, so the bins line up with its series; FPS
+    metrics keep their (positive) frame times in ms. Needs numpy.
+    """
+    row_name: str = log_stem(file_path)
+    empty: Dict[str, List[np.ndarray]] = {m: [] for m in metrics}
+    with open_log_text(file_path) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        first_row = next(reader, None)
+    if header is None or first_row is None:
+        return row_name, empty
+    row_name = pick_row_name(file_path, header, first_row)
+    try:
+        t_idx = header.index("TimeInSeconds")
+    except ValueError as exc:
+        raise ValueError("TimeInSeconds column not found in CSV") from exc
+    columns = list(dict.fromkeys(resolve_metric_column(header, m) for m in metrics))
+
+    cached = None
+    if cache is not None:
+        cached = cache.load(file_path, header, [name for name, _t in columns])
+    if cached is not None:
+        with cached:
+            if cached.time_bounds is None:
+                return row_name, empty
+            effective_start = cached.time_bounds[0] + trim_start
+            effective_end = cached.time_bounds[1] - trim_end
+            if effective_start >= effective_end:
+                return row_name, empty
+            times = np.frombuffer(cached.column("TimeInSeconds"), dtype=np.float64)
+            keep = (times >= effective_start) & (times <= effective_end)
+            rel_times = times[keep] - effective_start
+            values = [
+                np.frombuffer(cached.column(name), dtype=np.float64)[keep]
+                for name, _t in columns
+            ]
+            del times
+    else:
+        col_idxs = [header.index(name) for name, _t in columns]
+        last_time = read_last_timestamp(file_path, t_idx) if trim_end > 0 else None
+        window = _TrimWindow(trim_start, trim_end, last_time=last_time)
+        try:
+            rel_times, values = _window_arrays(window, file_path, t_idx, col_idxs)
+        except _NonMonotonicTime:
+            bounds = _scan_time_bounds(_fast_timed_values(file_path, t_idx, []))
+            if bounds is None:
+                return row_name, empty
+            window = _TrimWindow(trim_start, trim_end, bounds=bounds)
+            rel_times, values = _window_arrays(window, file_path, t_idx, col_idxs)
+        if not window.valid:
+            return row_name, empty
+
+    bin_idx = np.floor(rel_times / bin_width).astype(np.int64)
+    column_bins: List[List[np.ndarray]] = []
+    for (_name, transform), column in zip(columns, values):
+        # NaN marks a missing field; FPS columns skip non-positive frame times
+        keep = column > 0 if transform else column == column
+        col_bins = bin_idx[keep]
+        order = np.argsort(col_bins, kind="stable")
+        col_bins, column = col_bins[order], column[keep][order]
+        n_bins = int(col_bins[-1]) + 1 if len(col_bins) else 0
+        edges = np.searchsorted(col_bins, np.arange(1, n_bins))
+        column_bins.append(np.split(column, edges) if n_bins else [])
+    return row_name, {
+        m: column_bins[columns.index(resolve_metric_column(header, m))]
+        for m in metrics
+    }
+
+
+def _window_arrays(
+    window: _TrimWindow, file_path: Path, t_idx: int, col_idxs: List[int]
+) -> Tuple["np.ndarray", List["np.ndarray"]]:
+    # (relative times, value columns with NaN for missing fields) in the window
+    rel_times = array("d")
+    columns = [array("d") for _ in col_idxs]
+    nan = float("nan")
+    for rel_t, row in window.rows(_fast_timed_values(file_path, t_idx, col_idxs)):
+        rel_times.append(rel_t)
+        for column, value in zip(columns, row):
+            column.append(nan if value is None else value)
+    return (
+        np.frombuffer(rel_times, dtype=np.float64),
+        [np.frombuffer(column, dtype=np.float64) for column in columns],
+    )
+
+
+def _bootstrap_statistic(metric: str) -> Tuple[Optional[float], bool]:
+    # (frame-time quantile, or None for the mean; report 1000 / value as FPS)
+    quantile = metric_quantile(metric)
+    if quantile is not None:
+        return quantile
+    return None, metric in (
+        MetricKind.AVG_FPS,
+        MetricKind.PRESENT_FPS,
+        MetricKind.DISPLAY_FPS,
+    )
+
+
+def _bin_statistic(
+    samples: "np.ndarray", statistic: Tuple[Optional[float], bool]
+) -> "np.ndarray":
+    # Statistic of every row of a replicates x frames array
+    quantile, as_fps = statistic
+    if quantile is None:
+        values = samples.mean(axis=1)
+    else:
+        # Nearest rank, as sketch_quantile
+        k = max(math.ceil(quantile * samples.shape[1]) - 1, 0)
+        values = np.partition(samples, k, axis=1)[:, k]
+    return 1000.0 / values if as_fps else values
+
+
+def _resample_bin(
+    values: "np.ndarray",
+    statistic: Tuple[Optional[float], bool],
+    resamples: int,
+    rng: "np.random.Generator",
+) -> "np.ndarray":
+    # Statistic of ``resamples`` draws of len(values) frames with replacement
+    n = len(values)
+    out = np.empty(resamples)
+    step = max(1, _BOOTSTRAP_CHUNK_VALUES // n)
+    for lo in range(0, resamples, step):
+        hi = min(lo + step, resamples)
+        out[lo:hi] = _bin_statistic(values[rng.integers(0, n, (hi - lo, n))], statistic)
+    return out
+
+
+def _bootstrap_frames_job(
+    job: Tuple[
+        int,
+        List[List["np.ndarray"]],
+        Tuple[Optional[float], bool],
+        int,
+        int,
+        float,
+    ]
+) -> Tuple[List[List[Tuple[float, float, float]]], List[Tuple["np.ndarray", ...]]]:
+    # Top-level so it can be pickled for worker processes. Every (log, bin)
+    # gets its own generator, so results do not depend on how bins are split
+    first_bin, logs, statistic, resamples, seed, confidence = job
+    tail = 100.0 * (1.0 - confidence) / 2.0
+    (base, *candidates) = logs
+    per_bin: List[List[Tuple[float, float, float]]] = [[] for _ in candidates]
+    # Per candidate: replicate and observed sums over the bins both logs have
+    run_sums = [
+        [np.zeros(resamples), np.zeros(resamples), 0.0, 0.0, 0] for _ in candidates
+    ]
+
+    def resampled(
+        log: int, bin_index: int, values: "np.ndarray"
+    ) -> Tuple["np.ndarray", float]:
+        rng = np.random.default_rng([seed, log, bin_index])
+        observed = float(_bin_statistic(values[np.newaxis, :], statistic)[0])
+        return _resample_bin(values, statistic, resamples, rng), observed
+
+    for i, base_values in enumerate(base):
+        base_reps = None
+        for c, (cand_bins, diffs, sums) in enumerate(zip(candidates, per_bin, run_sums)):
+            if not len(base_values) or not len(cand_bins[i]):
+                diffs.append((math.nan, math.nan, math.nan))
+                continue
+            if base_reps is None:
+                base_reps, base_obs = resampled(0, first_bin + i, base_values)
+            if base_obs == 0:
+                diffs.append((math.nan, math.nan, math.nan))
+                continue
+            cand_reps, cand_obs = resampled(c + 1, first_bin + i, cand_bins[i])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                reps = 100.0 * (cand_reps / base_reps - 1.0)
+            low, high = np.percentile(reps, [tail, 100.0 - tail])
+            diffs.append((100.0 * (cand_obs / base_obs - 1.0), low, high))
+            sums[0] += base_reps
+            sums[1] += cand_reps
+            sums[2] += base_obs
+            sums[3] += cand_obs
+            sums[4] += 1
+    return per_bin, [tuple(s) for s in run_sums]
+
+
+def _run_difference(
+    base_sum: "np.ndarray",
+    cand_sum: "np.ndarray",
+    base_obs: float,
+    cand_obs: float,
+    n_bins: int,
+    confidence: float,
+) -> Dict[str, Optional[float]]:
+    # Whole-run difference of the per-bin means over n_bins shared bins
+    if n_bins == 0 or base_obs == 0:
+        return {"difference": None, "low": None, "high": None, "bins": n_bins}
+    tail = 100.0 * (1.0 - confidence) / 2.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reps = 100.0 * (cand_sum / base_sum - 1.0)
+    low, high = np.nanpercentile(reps, [tail, 100.0 - tail])
+    return {
+        "difference": 100.0 * (cand_obs / base_obs - 1.0),
+        "low": float(low),
+        "high": float(high),
+        "bins": n_bins,
+    }
+
+
+def _optional_series(values: Iterable[float]) -> List[Optional[float]]:
+    # NaN -> None, dropping trailing gaps as _finalize_series does
+    series = [None if math.isnan(v) else float(v) for v in values]
+    while series and series[-1] is None:
+        series.pop()
+    return series
+
+
+def bootstrap_frame_differences(
+    logs: Sequence[List["np.ndarray"]],
+    metric: str,
+    resamples: int,
+    seed: int,
+    confidence: float = 0.95,
+    jobs: int = 1,
+) -> List[BootstrapResult]:
+    """
+    Bootstrap the compare difference 100 * (candidate / baseline - 1) by
+    resampling the frames of every bin with replacement. ``logs`` holds the
+    per-bin frame values of read_frame_bins, baseline first.
+
+    Returns one (series, run) pair per candidate: ``series`` maps each of
+    BOOTSTRAP_STATS to a per-bin series (the observed difference and the
+    percentile interval at ``confidence``); ``run`` holds the same three
+    values for the whole run, taken as the mean over the bins both logs
+    have, plus the number of such bins. Bins are split across ``jobs``
+    worker processes (0 = one per CPU); a given seed gives the same result
+    whatever the split. Needs numpy.
+    """
+    statistic = _bootstrap_statistic(metric)
+    n_bins = max((len(bins) for bins in logs), default=0)
+    no_frames = np.empty(0)
+    padded = [list(bins) + [no_frames] * (n_bins - len(bins)) for bins in logs]
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    # Fixed-size chunks: the run sums add up in the same order for any jobs
+    work = [
+        (
+            lo,
+            [bins[lo : lo + _BOOTSTRAP_JOB_BINS] for bins in padded],
+            statistic,
+            resamples,
+            seed,
+            confidence,
+        )
+        for lo in range(0, n_bins, _BOOTSTRAP_JOB_BINS)
+    ]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+            parts = list(pool.map(_bootstrap_frames_job, work))
+    else:
+        parts = [_bootstrap_frames_job(job) for job in work]
+
+    results: List[BootstrapResult] = []
+    for c in range(len(logs) - 1):
+        diffs = [d for per_bin, _sums in parts for d in per_bin[c]]
+        sums = [np.zeros(resamples), np.zeros(resamples), 0.0, 0.0, 0]
+        for _per_bin, run_sums in parts:
+            for k, value in enumerate(run_sums[c]):
+                sums[k] = sums[k] + value
+        series = {
+            stat: _optional_series(d[k] for d in diffs)
+            for k, stat in enumerate(BOOTSTRAP_STATS)
+        }
+        results.append((series, _run_difference(*sums, confidence)))
+    return results
+
+
+def bootstrap_run_differences(
+    groups: Sequence[Sequence[List[Optional[float]]]],
+    resamples: int,
+    seed: int,
+    confidence: float = 0.95,
+) -> List[BootstrapResult]:
+    """
+    Bootstrap the compare difference between groups of repeated runs by
+    resampling whole runs: every replicate draws each group's runs with
+    replacement and compares the per-bin means across the drawn runs.
+    ``groups`` holds the per-bin series of every run, baseline group first.
+    Returns the same (series, run) pairs as bootstrap_frame_differences,
+    where the observed difference is that of the groups' mean series.
+    Needs numpy.
+    """
+    tail = 100.0 * (1.0 - confidence) / 2.0
+    n_bins = max((len(s) for runs in groups for s in runs), default=0)
+    matrices = []
+    weights = []
+    for g, runs in enumerate(groups):
+        values = np.full((len(runs), n_bins), np.nan)
+        for row, series in zip(values, runs):
+            row[: len(series)] = [np.nan if v is None else v for v in series]
+        matrices.append(values)
+        # How often each run is drawn in each replicate
+        rng = np.random.default_rng([seed, g])
+        weights.append(
+            rng.multinomial(len(runs), np.full(len(runs), 1.0 / len(runs)), resamples)
+            .astype(float)
+        )
+
+    def group_means(values: "np.ndarray", w: "np.ndarray") -> "np.ndarray":
+        present = values == values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (w @ np.where(present, values, 0.0)) / (w @ present)
+
+    with warnings.catch_warnings():
+        # All-NaN bins just give NaN
+        warnings.simplefilter("ignore", RuntimeWarning)
+        observed = [np.nanmean(values, axis=0) for values in matrices]
+    base_obs = observed[0]
+    per_bin = [[np.empty(0)] * 3 for _ in groups[1:]]
+    run_sums = [
+        [np.zeros(resamples), np.zeros(resamples), np.zeros(resamples)]
+        for _ in groups[1:]
+    ]
+    step = max(1, _BOOTSTRAP_CHUNK_VALUES // max(1, resamples))
+    for lo in range(0, n_bins, step):
+        hi = min(lo + step, n_bins)
+        base_reps = group_means(matrices[0][:, lo:hi], weights[0])
+        for c, (values, w, obs) in enumerate(
+            zip(matrices[1:], weights[1:], observed[1:])
+        ):
+            shared = (base_obs[lo:hi] == base_obs[lo:hi]) & (obs[lo:hi] == obs[lo:hi])
+            shared &= base_obs[lo:hi] != 0
+            cand_reps = group_means(values[:, lo:hi], w)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                reps = 100.0 * (cand_reps / base_reps - 1.0)
+                diff = 100.0 * (obs[lo:hi] / base_obs[lo:hi] - 1.0)
+            reps[:, ~shared] = np.nan
+            reps[~np.isfinite(reps)] = np.nan
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                low, high = np.nanpercentile(reps, [tail, 100.0 - tail], axis=0)
+            diff[~shared] = np.nan
+            low[~shared] = np.nan
+            high[~shared] = np.nan
+            for k, part in enumerate((diff, low, high)):
+                per_bin[c][k] = np.concatenate([per_bin[c][k], part])
+            # Replicate means over the shared bins that the drawn runs reach
+            usable = shared & (base_reps == base_reps) & (cand_reps == cand_reps)
+            run_sums[c][0] += np.where(usable, base_reps, 0.0).sum(axis=1)
+            run_sums[c][1] += np.where(usable, cand_reps, 0.0).sum(axis=1)
+            run_sums[c][2] += usable.sum(axis=1)
+
+    results: List[BootstrapResult] = []
+    for c, obs in enumerate(observed[1:]):
+        shared = (base_obs == base_obs) & (obs == obs) & (base_obs != 0)
+        base_sum, cand_sum, counts = run_sums[c]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Ratio of means over each replicate's own usable bins
+            run = _run_difference(
+                base_sum / counts,
+                cand_sum / counts,
+                float(base_obs[shared].sum()),
+                float(obs[shared].sum()),
+                int(shared.sum()),
+                confidence,
+            )
+        series = {
+            stat: _optional_series(per_bin[c][k].tolist())
+            for k, stat in enumerate(BOOTSTRAP_STATS)
+        }
+        results.append((series, run))
+    return results
+
+
+def bootstrap_rows(
+    names: Sequence[str], results: Sequence[BootstrapResult]
+) -> List[Tuple[str, List[Optional[float]]]]:
+    """
+    Difference, low and high rows per candidate, labelled like compare_rows:
+    "%", "% low" and "% high" for a single candidate, "<candidate> %" etc.
+    for several. ``names`` are the candidate names.
+    """
+    rows: List[Tuple[str, List[Optional[float]]]] = []
+    for name, (series, _run) in zip(names, results):
+        label = "%" if len(names) == 1 else f"{name} %"
+        rows.append((label, series["difference"]))
+        rows.append((f"{label} low", series["low"]))
+        rows.append((f"{label} high", series["high"]))
+    return rows
+
+
+_COPY_CHUNK_BYTES = 8 * 1024 * 1024
+# Bytes around each edge of a byte-range trim whose lines are all checked
+_TRIM_CHECK_BYTES = 1024 * 1024
+
+
+def _line_time(line: bytes, t_idx: int) -> Optional[float]:
+    """TimeInSeconds of one raw data line, or None when it has none."""
+    if b'"' in line:
+        text = line.decode("utf-8", errors="ignore").rstrip("\r\n")
+        row = next(csv.reader([text]), [])
+        t = parse_float(row[t_idx]) if t_idx < len(row) else None
+    else:
+        fields = line.split(b",", t_idx + 1)
+        t = _bytes_to_float(fields[t_idx]) if t_idx < len(fields) else None
+    # NaN would break the ordering the binary search relies on
+    return None if t is None or t != t else t
+
+
+def _trim_byte_range(
+    data: Union[bytes, mmap.mmap],
+    data_start: int,
+    t_idx: int,
+    trim_start: float,
+    trim_end: float,
+) -> Optional[Tuple[int, int]]:
+    """
+    Byte range [start, end) of a time-ordered log's data lines inside the
+    trim window: from the first line timed at or after first_time +
+    trim_start through the last line timed at or before last_time - trim_end.
+    ``data`` is the whole file (e.g. an mmap) and its data lines begin at
+    ``data_start``. Both ends are found by binary search over byte offsets.
+    Returns None when there are no timed rows or the trim range is empty.
+
+    Time order is checked where it decides the result rather than line by
+    line: the lines the search probes, the first line of every
+    _COPY_CHUNK_BYTES block, and every line within _TRIM_CHECK_BYTES of the
+    range's two edges and of the file's start and end must be in order,
+    between the first and last times, and inside the trim window exactly
+    when they are inside the byte range. Raises _NonMonotonicTime
+    otherwise. The parsed lines are bounded whatever the file size, so a
+    row out of order deep inside a long log goes unnoticed; logs shorter
+    than the checked windows are verified completely.
+    """
+    size = len(data)
+    # Line start -> time of every timed line looked at
+    samples: Dict[int, float] = {}
+
+    def line_end(pos: int) -> int:
+        newline = data.find(b"\n", pos)
+        return size if newline < 0 else newline + 1
+
+    def line_start(end: int) -> int:
+        # Start of the line ending at ``end`` (just after its newline)
+        return max(data.rfind(b"\n", data_start, end - 1) + 1, data_start)
+
+    def timed_at(pos: int) -> Tuple[int, float]:
+        # (start, time) of the first timed line starting at or after pos
+        if pos > data_start and data[pos - 1] != 0x0A:
+            pos = line_end(pos)
+        while pos < size:
+            end = line_end(pos)
+            t = _line_time(data[pos:end], t_idx)
+            if t is not None:
+                samples[pos] = t
+                return pos, t
+            pos = end
+        return size, math.inf
+
+    def sample_lines(lo: int, hi: int) -> None:
+        # Record every timed line starting in [lo, hi)
+        pos = max(lo, data_start)
+        while True:
+            pos, _t = timed_at(pos)
+            if pos >= min(hi, size):
+                return
+            pos = line_end(pos)
+
+    first_pos, first_time = timed_at(data_start)
+    if first_pos >= size:
+        return None
+    last_end = size
+    while True:
+        last_pos = line_start(last_end)
+        last_time = _line_time(data[last_pos:last_end], t_idx)
+        if last_time is not None:
+            break
+        last_end = last_pos
+    if last_time < first_time:
+        raise _NonMonotonicTime
+
+    effective_start = first_time + trim_start
+    effective_end = last_time - trim_end
+    if effective_start >= effective_end:
+        return None
+
+    def lower_bound(accept: Callable[[float], bool]) -> int:
+        # Start of the first timed line whose time is accepted (or size)
+        lo, hi = first_pos, size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if accept(timed_at(mid)[1]):
+                hi = mid
+            else:
+                lo = mid + 1
+        return timed_at(lo)[0]
+
+    start = lower_bound(lambda t: t >= effective_start)
+    stop = lower_bound(lambda t: t > effective_end)
+
+    for pos in range(data_start, size, _COPY_CHUNK_BYTES):
+        timed_at(pos)
+    for edge in (data_start, start, stop, size):
+        sample_lines(edge - _TRIM_CHECK_BYTES, edge + _TRIM_CHECK_BYTES)
+    prev = first_time
+    for pos in sorted(samples):
+        t = samples[pos]
+        kept = effective_start <= t <= effective_end
+        if t < prev or t > last_time or kept != (start <= pos < stop):
+            raise _NonMonotonicTime
+        prev = t
+
+    if stop <= start:
+        return start, start
+    # Leave out rows without a time between the last kept row and stop
+    end = stop
+    while True:
+        pos = line_start(end)
+        if _line_time(data[pos:end], t_idx) is not None:
+            return start, end
+        end = pos
+
+
+def trim_csv_passthrough(
+    input_path: Path,
+    output_path: Path,
+    trim_start: float = 0.0,
+    trim_end: float = 0.0,
+    cache: Optional[ParseCache] = None,
+) -> bool:
+    """
+    Trim a CSV file by time range without converting to Flourish format.
+
+    The log is memory-mapped and the first and last kept rows are found by
+    binary search, with time order checked around them and at a bounded
+    set of other lines (see _trim_byte_range). The header and that byte
+    range are copied unchanged, so the output lines are byte-identical to
+    the source and a trim takes about as long as copying the kept bytes.
+    Rows without a time between two kept rows are kept. Logs found not to
+    be time-ordered, with bare carriage returns or compressed are streamed
+    and rewritten row by row instead (using the ParseCache for the time
+    column when given), keeping the same rows and the source's line
+    endings. The output is only created if the trim is valid.
+    Returns True if successful, False if the log has no TimeInSeconds
+    column or timed rows, or the trim range is empty. I/O errors are
+    raised.
+    """
+    with open_log_text(input_path) as f:
+        header = next(csv.reader(f), [])
+    try:
+        t_idx = header.index("TimeInSeconds")
+    except ValueError:
+        return False
+    if is_packed_log(input_path):
+        # Nothing to map or copy: decompress and rewrite the kept rows
+        return _trim_csv_rewrite(
+            input_path, output_path, header, t_idx, trim_start, trim_end, cache
+        )
+    with input_path.open("rb") as f:
+        header_line = f.readline()
+    if output_path.exists() and os.path.samefile(input_path, output_path):
+        raise ValueError(f"Output would overwrite the input: {output_path}")
+    if b"\r" in header_line.rstrip(b"\r\n"):
+        # Bare carriage returns: only the csv module can split the lines
+        return _trim_csv_rewrite(
+            input_path, output_path, header, t_idx, trim_start, trim_end, cache
+        )
+
+    with input_path.open("rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                span = _trim_byte_range(
+                    data, len(header_line), t_idx, trim_start, trim_end
+                )
+            except _NonMonotonicTime:
+                pass
+            else:
+                if span is None:
+                    return False
+                start, end = span
+                try:
+                    with output_path.open("wb") as out:
+                        out.write(header_line)
+                        for pos in range(start, end, _COPY_CHUNK_BYTES):
+                            out.write(data[pos : min(pos + _COPY_CHUNK_BYTES, end)])
+                except BaseException:
+                    output_path.unlink(missing_ok=True)
+                    raise
+                return True
+    # Not time-ordered after all
+    return _trim_csv_rewrite(
+        input_path, output_path, header, t_idx, trim_start, trim_end, cache
+    )
+
+
+def _line_terminator(file_path: Path) -> str:
+    """Line ending of a log's header line: "\r\n", "\n" or a bare "\r"."""
+    with open_log(file_path) as f:
+        head = f.read(64 * 1024)
+    cr = head.find(b"\r")
+    newline = head.find(b"\n")
+    if cr < 0 or 0 <= newline < cr:
+        return "\n"
+    return "\r\n" if head[cr + 1 : cr + 2] == b"\n" else "\r"
+
+
+def _trim_csv_rewrite(
+    input_path: Path,
+    output_path: Path,
+    header: List[str],
+    t_idx: int,
+    trim_start: float,
+    trim_end: float,
+    cache: Optional[ParseCache],
+) -> bool:
+    """
+    Streaming trim_csv_passthrough for logs the byte-range copy cannot
+    handle: rows are filtered by a _TrimWindow in file order, splitting
+    lines only up to the time column. Rows without a time travel with the
+    next timed row and are written before it unless it is the first kept
+    row, as the byte-range copy keeps them. Unquoted lines are written
+    back as read and quoted ones through csv.writer, both ending in the
+    source's line terminator.
+    """
+    terminator = _line_terminator(input_path)
+
+    def with_untimed(
+        rows: Iterable[Tuple[Optional[float], LogRow]]
+    ) -> Iterator[Tuple[float, Tuple[List[LogRow], LogRow]]]:
+        # (time, (untimed rows just before it, row)) per timed row
+        untimed: List[LogRow] = []
+        for t, row in rows:
+            if t is None or t != t:
+                untimed.append(row)
+            else:
+                yield t, (untimed, row)
+                untimed = []
+
+    def write_window(
+        window: _TrimWindow,
+        timed: Iterable[Tuple[float, Tuple[List[LogRow], LogRow]]],
+    ) -> bool:
+        out_f = None
+
+        def write_row(row: LogRow) -> None:
+            if isinstance(row, str):
+                # Unquoted line: copied as read, minus its line ending
+                out_f.write(row + terminator)
+            else:
+                writer.writerow(row)
+
+        try:
+            for _rel_t, (untimed, row) in window.rows(timed):
+                if out_f is None:
+                    out_f = output_path.open("w", newline="", encoding="utf-8")
+                    writer = csv.writer(out_f, lineterminator=terminator)
+                    writer.writerow(header)
+                else:
+                    for line in untimed:
+                        write_row(line)
+                write_row(row)
+            if out_f is None and window.valid:
+                # Valid range that happens to contain no rows
+                out_f = output_path.open("w", newline="", encoding="utf-8")
+                csv.writer(out_f, lineterminator=terminator).writerow(header)
+        finally:
+            if out_f is not None:
+                out_f.close()
+        return window.valid
+
+    cached = None
+    if cache is not None:
+        cached = cache.load(input_path, header, [])
+    if cached is not None:
+        with cached:
+            if cached.time_bounds is None:
+                return False
+            times = cached.column("TimeInSeconds")
+            return write_window(
+                _TrimWindow(trim_start, trim_end, bounds=cached.time_bounds),
+                with_untimed(zip(times, _fast_data_rows(input_path))),
+            )
+
+    last_time = read_last_timestamp(input_path, t_idx) if trim_end > 0 else None
+    try:
+        return write_window(
+            _TrimWindow(trim_start, trim_end, last_time=last_time),
+            with_untimed(_fast_timed_rows(input_path, t_idx, keep_untimed=True)),
+        )
+    except _NonMonotonicTime:
+        # Out-of-order timestamps: find the real bounds, then rewrite
+        bounds = _scan_time_bounds(_fast_timed_rows(input_path, t_idx))
+        if bounds is None:
+            return False
+        return write_window(
+            _TrimWindow(trim_start, trim_end, bounds=bounds),
+            with_untimed(_fast_timed_rows(input_path, t_idx, keep_untimed=True)),
+        )
+
+
+def trim_output_path(input_path: Path, trim_start: float, trim_end: float) -> Path:
+    """
+    Default name of a trimmed copy, next to the log (as the GUI names it).
+    Trims of compressed logs and zip members are plain files next to the
+    compressed file or archive.
+    """
+    if trim_start > 0 or trim_end > 0:
+        trim_suffix = f"_trim_{trim_start:.1f}s_{trim_end:.1f}s"
+    else:
+        trim_suffix = "_trim"
+    name = input_path.with_suffix("") if _codec_suffix(input_path) else input_path
+    return log_file(input_path).with_name(f"{name.stem}{trim_suffix}{name.suffix}")
+
+
+# One trim: (input, trim_start, trim_end, output)
+TrimEntry = Tuple[Path, float, float, Path]
+
+TRIM_MANIFEST_FIELDS = ("path", "trim_start", "trim_end", "output")
+
+
+def read_trim_manifest(manifest_path: Path) -> List[TrimEntry]:
+    """
+    Read a trim manifest: a JSON list of objects or (for a .csv path) a CSV
+    with a header row, both with the fields of TRIM_MANIFEST_FIELDS. Only
+    path is required; trims default to 0 and output to trim_output_path.
+    Relative paths are taken relative to the manifest's folder.
+    Raises ValueError naming the first bad entry.
+    """
+    if manifest_path.suffix.lower() == ".csv":
+        with manifest_path.open("r", newline="", encoding="utf-8-sig") as f:
+            entries: list = list(csv.DictReader(f))
+    else:
+        with manifest_path.open("r", encoding="utf-8-sig") as f:
+            entries = json.load(f)
+        if not isinstance(entries, list):
+            raise ValueError(f"{manifest_path}: expected a JSON list of entries")
+
+    base = manifest_path.parent
+    result: List[TrimEntry] = []
+    # Output path -> entry number, so two entries cannot overwrite each other
+    outputs: Dict[str, int] = {}
+    for number, entry in enumerate(entries, 1):
+        where = f"{manifest_path} entry {number}"
+        if not isinstance(entry, dict) or not entry.get("path"):
+            raise ValueError(f"{where}: path is missing")
+        try:
+            trim_start = float(entry.get("trim_start") or 0.0)
+            trim_end = float(entry.get("trim_end") or 0.0)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"{where}: invalid trim value") from exc
+        if not (trim_start >= 0 and trim_end >= 0):
+            raise ValueError(f"{where}: trim values must be non-negative")
+        input_path = base / str(entry["path"])
+        if entry.get("output"):
+            output_path = base / str(entry["output"])
+        else:
+            output_path = trim_output_path(input_path, trim_start, trim_end)
+        key = os.path.normcase(os.path.abspath(output_path))
+        if key in outputs:
+            raise ValueError(
+                f"{where}: {output_path} is also written by entry {outputs[key]}"
+            )
+        outputs[key] = number
+        result.append((input_path, trim_start, trim_end, output_path))
+    return result
+
+
+def write_trim_manifest(
+    manifest_path: Path,
+    entries: List[Tuple[Path, float, float, Optional[Path]]],
+):
+    """
+    Writes a manifest for read_trim_manifest, as JSON or (for a .csv path)
+    CSV. Paths are stored relative to the manifest's folder with forward
+    slashes where possible, so a session can be replayed on another
+    machine with the same folder layout. A None output is left out.
+    """
+    base = manifest_path.parent.resolve()
+
+    def portable(path: Path) -> str:
+        try:
+            return Path(os.path.relpath(path.resolve(), base)).as_posix()
+        except ValueError:
+            # On another drive (Windows): keep it absolute
+            return str(path.resolve())
+
+    rows = []
+    for input_path, trim_start, trim_end, output_path in entries:
+        row = {
+            "path": portable(input_path),
+            "trim_start": trim_start,
+            "trim_end": trim_end,
+        }
+        if output_path is not None:
+            row["output"] = portable(output_path)
+        rows.append(row)
+
+    if manifest_path.suffix.lower() == ".csv":
+        with manifest_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=TRIM_MANIFEST_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with manifest_path.open("w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+            f.write("\n")
+
+
+def _trim_job(entry: TrimEntry) -> Optional[str]:
+    # Top-level so it can be pickled; returns None or why the trim failed
+    input_path, trim_start, trim_end, output_path = entry
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if not trim_csv_passthrough(input_path, output_path, trim_start, trim_end):
+            return "no timed rows, no TimeInSeconds column or empty trim range"
+    except Exception as exc:  # noqa: BLE001
+        return str(exc) or type(exc).__name__
+    return None
+
+
+def trim_batch(
+    entries: List[TrimEntry],
+    jobs: int = 0,
+    on_result: Optional[Callable[[int, Optional[str]], None]] = None,
+) -> List[Optional[str]]:
+    """
+    Runs trim_csv_passthrough for every manifest entry, spread over a
+    process pool of ``jobs`` workers (1 runs in-process, 0 uses every CPU).
+    A failing entry does not stop the others. Returns, in input order, None
+    for each trimmed file or the reason it failed; ``on_result`` receives
+    (index, error) as each entry finishes.
+    """
+    errors: List[Optional[str]] = [None] * len(entries)
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(entries))
+    if jobs <= 1:
+        for index, entry in enumerate(entries):
+            errors[index] = _trim_job(entry)
+            if on_result is not None:
+                on_result(index, errors[index])
+        return errors
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(_trim_job, entry): i for i, entry in enumerate(entries)}
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                errors[index] = future.result()
+            except Exception as exc:  # noqa: BLE001
+                # e.g. a worker process that died
+                errors[index] = str(exc) or type(exc).__name__
+            if on_result is not None:
+                on_result(index, errors[index])
+    return errors
+
+
+def trim_main(argv: List[str]) -> int:
+    """The ``trim`` subcommand: trim every log of a manifest, in parallel."""
+    parser = argparse.ArgumentParser(
+        prog="flourish_maker.py trim",
+        description=(
+            "Trim FrameView logs listed in a manifest without converting them. "
+            "The manifest is a JSON list of objects or a CSV with the columns "
+            "path, trim_start, trim_end and output (only path is required; "
+            "relative paths are relative to the manifest)."
+        ),
+    )
+    parser.add_argument("manifest", type=str, help="Manifest (.json or .csv)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Trim in N worker processes (default: 0 = one per CPU)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        entries = read_trim_manifest(Path(args.manifest))
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+
+    def on_result(index: int, error: Optional[str]) -> None:
+        input_path, _trim_start, _trim_end, output_path = entries[index]
+        if error is None:
+            print(f"Trimmed {input_path} -> {output_path}")
+        else:
+            print(f"FAILED {input_path}: {error}")
+
+    errors = trim_batch(entries, args.jobs, on_result)
+    failed = sum(error is not None for error in errors)
+    trimmed = len(entries) - failed
+    print(f"Trimmed {trimmed} of {len(entries)} file(s), {failed} failed.")
+    return 1 if failed else 0
+
+
+# Catalog field -> FrameView column whose first value describes the run
+_CATALOG_RUN_COLUMNS = {
+    "application": "Application",
+    "gpu": "GPU",
+    "cpu": "CPU",
+    "resolution": "Resolution",
+    "runtime": "Runtime",
+    "present_mode": "PresentMode",
+}
+_CATALOG_NUMBER_FIELDS = ("first_time", "last_time", "duration", "rows")
+CATALOG_FIELDS = (
+    ("path",) + tuple(_CATALOG_RUN_COLUMNS) + _CATALOG_NUMBER_FIELDS + ("columns",)
+)
+CATALOG_FILE = ".flourish_catalog.db"
+_CATALOG_FILTER = re.compile(r"^\s*(\w+)\s*(>=|<=|!=|=|>|<)\s*(.*?)\s*$")
+
+# One catalog condition: (field, operator, value)
+CatalogFilter = Tuple[str, str, str]
+
+
+def read_log_info(file_path: Path, count_rows: bool = True) -> Dict[str, object]:
+    """
+    Catalog fields of one log: the run columns (Application, GPU, ...) of
+    its first data row, the time span from its first and last rows, the
+    number of data lines and the header. Missing fields are None, as is
+    ``rows`` without count_rows (counting reads the whole file).
+    """
+    with open_log_text(file_path) as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        first_row = next(reader, [])
+    info: Dict[str, object] = dict.fromkeys(CATALOG_FIELDS)
+    info["path"] = str(file_path.resolve())
+    info["columns"] = header
+    for field, column in _CATALOG_RUN_COLUMNS.items():
+        if column in header:
+            idx = header.index(column)
+            if idx < len(first_row):
+                info[field] = first_row[idx].strip() or None
+
+    span = read_time_span(file_path) if "TimeInSeconds" in header else None
+    if span is not None:
+        info["first_time"], info["last_time"] = span
+        info["duration"] = span[1] - span[0]
+    if not count_rows:
+        return info
+
+    # Count lines without parsing them (bare carriage returns end lines too)
+    newlines = returns = 0
+    last = b""
+    with open_log(file_path) as f:
+        for chunk in iter(lambda: f.read(_FAST_CHUNK_BYTES), b""):
+            newlines += chunk.count(b"\n")
+            returns += chunk.count(b"\r")
+            last = chunk[-1:]
+    lines = newlines or returns
+    if last not in (b"", b"\n", b"\r"):
+        lines += 1
+    info["rows"] = max(lines - 1, 0)
+    return info
+
+
+def _catalog_job(file_path: Path) -> Tuple[Optional[Dict[str, object]], Optional[str]]:
+    # Top-level so it can be pickled; returns (info, None) or (None, error)
+    try:
+        return read_log_info(file_path), None
+    except Exception as exc:  # noqa: BLE001
+        return None, str(exc) or type(exc).__name__
+
+
+def parse_catalog_filter(text: str) -> CatalogFilter:
+    """
+    Parse ``field=value`` (case-insensitive substring match on text fields),
+    ``field!=value``, or a numeric comparison such as ``duration>=60``.
+    ``column=NAME`` matches logs that have the exact column NAME.
+    """
+    match = _CATALOG_FILTER.match(text)
+    if match is None:
+        raise ValueError(f"Not a catalog filter (expected field=value): {text!r}")
+    field, op, value = match.groups()
+    field = field.lower()
+    if field == "column":
+        if op not in ("=", "!="):
+            raise ValueError(f"column filters take = or !=: {text!r}")
+    elif field in _CATALOG_NUMBER_FIELDS:
+        try:
+            float(value)
+        except ValueError:
+            raise ValueError(f"{field} needs a number: {text!r}") from None
+    elif field in CATALOG_FIELDS:
+        if op not in ("=", "!="):
+            raise ValueError(f"{field} filters take = or !=: {text!r}")
+    else:
+        fields = ", ".join(("column",) + CATALOG_FIELDS[:-1])
+        raise ValueError(f"Unknown catalog field {field!r} (use one of: {fields})")
+    return field, op, value
+
+
+class LogCatalog:
+    """
+    SQLite index of the logs below one or more directories, so inputs can be
+    picked by run properties without opening every file.
+
+    Each log is described by read_log_info. update() only reads logs that are
+    new or whose size or mtime changed since they were indexed, and drops
+    the ones that are gone; query() runs against the index alone.
+
+    Args:
+        db_path: SQLite file, created on first use
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self._db = sqlite3.connect(str(db_path))
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS logs")
+        types = {field: "REAL" for field in _CATALOG_NUMBER_FIELDS}
+        types["rows"] = "INTEGER"
+        columns = ", ".join(
+            f"{field} {types.get(field, 'TEXT')}" for field in CATALOG_FIELDS[1:]
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS logs (path TEXT PRIMARY KEY, "
+            f"size INTEGER, mtime_ns INTEGER, {columns})"
+        )
+        self._db.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "LogCatalog":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    @staticmethod
+    def _prefix(directory: Path) -> str:
+        return os.path.join(str(directory.resolve()), "")
+
+    def update(
+        self,
+        directory: Path,
+        include_glob: Optional[str] = None,
+        jobs: int = 1,
+        on_error: Optional[Callable[[Path, str], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Index the logs below directory (recursively, see discover_input_files)
+        in ``jobs`` worker processes (0 uses every CPU). Logs that cannot be
+        read are reported to ``on_error`` and retried on the next update.
+        Returns the counts of added, updated, removed, unchanged and failed
+        logs.
+        """
+        prefix = self._prefix(directory)
+        indexed = {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns in self._db.execute(
+                "SELECT path, size, mtime_ns FROM logs WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+        }
+        counts = dict.fromkeys(("added", "updated", "removed", "unchanged", "failed"), 0)
+        todo: List[Tuple[Path, Tuple[int, int]]] = []
+        present = set()
+        for p in discover_input_files(directory, include_glob, recursive=True):
+            try:
+                stat = log_stat(p)
+            except OSError:
+                continue
+            key = str(p.resolve())
+            present.add(key)
+            version = (stat.st_size, stat.st_mtime_ns)
+            if indexed.get(key) == version:
+                counts["unchanged"] += 1
+            else:
+                todo.append((p, version))
+
+        removed = [path for path in indexed if path not in present]
+        self._db.executemany("DELETE FROM logs WHERE path = ?", [(p,) for p in removed])
+        counts["removed"] = len(removed)
+
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        jobs = max(1, min(jobs, len(todo)))
+        placeholders = ", ".join("?" * (len(CATALOG_FIELDS) + 2))
+        insert = (
+            f"INSERT OR REPLACE INTO logs (size, mtime_ns, {', '.join(CATALOG_FIELDS)}) "
+            f"VALUES ({placeholders})"
+        )
+
+        def store(
+            item: Tuple[Path, Tuple[int, int]],
+            result: Tuple[Optional[Dict[str, object]], Optional[str]],
+        ) -> None:
+            (p, version), (info, error) = item, result
+            if info is None:
+                counts["failed"] += 1
+                if on_error is not None:
+                    on_error(p, error or "")
+                return
+            info["path"] = str(p.resolve())
+            info["columns"] = json.dumps(info["columns"])
+            counts["updated" if info["path"] in indexed else "added"] += 1
+            self._db.execute(insert, version + tuple(info[f] for f in CATALOG_FIELDS))
+
+        try:
+            if jobs <= 1:
+                for item in todo:
+                    store(item, _catalog_job(item[0]))
+            else:
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    results = pool.map(_catalog_job, [p for p, _ in todo], chunksize=8)
+                    for item, result in zip(todo, results):
+                        store(item, result)
+        finally:
+            # Keep what was indexed so far, e.g. when interrupted
+            self._db.commit()
+        return counts
+
+    def query(
+        self, filters: Sequence[CatalogFilter] = (), under: Optional[Path] = None
+    ) -> List[Dict[str, object]]:
+        """
+        Catalog entries matching every filter (see parse_catalog_filter),
+        optionally only those below directory ``under``, sorted by path.
+        ``path`` is returned as a Path and ``columns`` as a list.
+        """
+        where: List[str] = []
+        params: List[object] = []
+        if under is not None:
+            prefix = self._prefix(under)
+            where.append("substr(path, 1, ?) = ?")
+            params += [len(prefix), prefix]
+        for field, op, value in filters:
+            if field in _CATALOG_NUMBER_FIELDS:
+                where.append(f"{field} {op} ?")
+                params.append(float(value))
+                continue
+            if field == "column":
+                clause = "instr(columns, ?) > 0"
+                params.append(json.dumps(value))
+            else:
+                clause = f"instr(lower(coalesce({field}, '')), ?) > 0"
+                params.append(value.lower())
+            where.append(clause if op == "=" else f"NOT ({clause})")
+        sql = f"SELECT {', '.join(CATALOG_FIELDS)} FROM logs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        entries = []
+        for row in self._db.execute(sql + " ORDER BY path", params):
+            entry = dict(zip(CATALOG_FIELDS, row))
+            entry["path"] = Path(entry["path"])  # type: ignore[arg-type]
+            entry["columns"] = json.loads(entry["columns"])  # type: ignore[arg-type]
+            entries.append(entry)
+        return entries
+
+
+def catalog_main(argv: List[str]) -> int:
+    """The ``catalog`` subcommand: index a log tree and list matching logs."""
+    parser = argparse.ArgumentParser(
+        prog="flourish_maker.py catalog",
+        description=(
+            "Index the FrameView logs below a directory into an SQLite catalog "
+            "(only new or changed logs are read) and list the logs matching "
+            "--where filters."
+        ),
+    )
+    parser.add_argument("dir", type=str, help="Root directory of the logs")
+    parser.add_argument(
+        "--db",
+        type=str,
+        default=None,
+        help=f"Catalog file (default: DIR/{CATALOG_FILE})",
+    )
+    parser.add_argument(
+        "--glob",
+        type=str,
+        default=None,
+        help="Glob pattern for the logs, applied in every subdirectory",
+    )
+    parser.add_argument(
+        "--where",
+        type=str,
+        action="append",
+        default=[],
+        help=(
+            "Filter such as application=cyberpunk, gpu=4090, column=GPU0Util(%%) "
+            "or duration>=60 (text matches are case-insensitive substrings); "
+            "repeat to require several"
+        ),
+    )
+    parser.add_argument(
+        "--no-update",
+        action="store_true",
+        help="Query the catalog as it is, without looking for new or changed logs",
+    )
+    parser.add_argument(
+        "--paths",
+        action="store_true",
+        help="Print only the paths of the matching logs, one per line",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Read new logs in N worker processes (default: 0 = one per CPU)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        filters = [parse_catalog_filter(text) for text in args.where]
+    except ValueError as exc:
+        parser.error(str(exc))
+    directory = Path(args.dir)
+    if not directory.is_dir():
+        parser.error(f"Not a directory: {directory}")
+    db_path = Path(args.db) if args.db else directory / CATALOG_FILE
+
+    def on_error(path: Path, error: str) -> None:
+        print(f"FAILED {path}: {error}", file=sys.stderr)
+
+    with LogCatalog(db_path) as catalog:
+        if not args.no_update:
+            counts = catalog.update(directory, args.glob, args.jobs, on_error)
+            print(
+                "Catalog {0}: {added} added, {updated} updated, {removed} removed, "
+                "{unchanged} unchanged, {failed} failed.".format(db_path, **counts),
+                file=sys.stderr,
+            )
+        entries = catalog.query(filters, under=directory)
+
+    for entry in entries:
+        if args.paths:
+            print(entry["path"])
+            continue
+        duration = entry["duration"]
+        print(
+            "\t".join(
+                [
+                    str(entry["path"]),
+                    str(entry["application"] or ""),
+                    str(entry["gpu"] or ""),
+                    str(entry["resolution"] or ""),
+                    "" if duration is None else f"{duration:.1f}s",
+                    f"{entry['rows']} rows",
+                ]
+            )
+        )
+    if not args.paths:
+        print(f"{len(entries)} matching log(s).", file=sys.stderr)
+    return 0
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "trim":
+        raise SystemExit(trim_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "catalog":
+        raise SystemExit(catalog_main(sys.argv[2:]))
     parser = argparse.ArgumentParser(
         description=(
             "Convert NVIDIA FrameView logs to Flourish wide CSV (Bar chart race)."
-        )
+        ),
+        epilog=(
+            "To trim logs listed in a manifest instead, run: "
+            "flourish_maker.py trim MANIFEST (see trim --help). To index a log "
+            "tree for --where, run: flourish_maker.py catalog DIR (see "
+            "catalog --help)"
+        ),
     )
     parser.add_argument(
         "--dir",
@@ -437,22 +4655,124 @@ def main():
             "--dir discovery"
         ),
     )
+    parser.add_argument(
+        "--where",
+        type=str,
+        action="append",
+        default=None,
+        help=(
+            "Pick the inputs below --dir from the log catalog instead of "
+            "scanning, e.g. --where application=cyberpunk --where gpu=4090 "
+            "(filters as in 'flourish_maker.py catalog --help')"
+        ),
+    )
+    parser.add_argument(
+        "--catalog",
+        type=str,
+        default=None,
+        help=f"Catalog file for --where (default: <dir>/{CATALOG_FILE})",
+    )
     parser.add_argument(
         "--output",
         type=str,
-        default="flourish_out.csv",
-        help="Output CSV path (default: flourish_out.csv)",
+        default=None,
+        help=(
+            "Output path (default: flourish_out.csv, or flourish_out.json / "
+            ".fvc for --format json / columnar)"
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        default="wide",
+        choices=list(OUTPUT_WRITERS),
+        help=(
+            "Output layout: 'wide' (Flourish Bar chart race, default), 'long' "
+            "(Label,Time,Value CSV for line charts and dashboards), 'json', or "
+            "'columnar' (compressed binary, one column per row)"
+        ),
     )
     parser.add_argument(
         "--metric",
         type=str,
-        default=MetricKind.AVG_FPS,
+        action="append",
+        default=None,
         help=(
-            "Metric to compute per second. Options: "
+            "Metric to compute per second; repeat to compute several metrics "
+            "in one pass over each file. Options: "
             f"'{MetricKind.AVG_FPS}' (default, uses displayed frame time), "
-            f"'{MetricKind.PRESENT_FPS}', '{MetricKind.DISPLAY_FPS}', or "
+            f"'{MetricKind.PRESENT_FPS}', '{MetricKind.DISPLAY_FPS}', "
+            f"'{MetricKind.P1_LOW_FPS}' / '{MetricKind.P01_LOW_FPS}' (1%% / "
+            f"0.1%% low FPS), {MetricKind.FRAMETIME_PREFIX}<pct> (frame time "
+            "percentile in ms, e.g. frametime_p99), or "
             f"{MetricKind.COLUMN_PREFIX}<ExactHeader> (e.g., "
-            "column:GPU0Util(%) to average that column)."
+            "column:GPU0Util(%%) to average that column)."
+        ),
+    )
+    parser.add_argument(
+        "--metrics",
+        type=str,
+        default=None,
+        help=(
+            "Comma-separated list of metrics, same options as --metric "
+            "(e.g. 'avg_fps,present_fps,column:GPU0Util(%%)')"
+        ),
+    )
+    parser.add_argument(
+        "--combine-metrics",
+        action="store_true",
+        help=(
+            "With several metrics, write one CSV with a row per file and "
+            "metric instead of one CSV per metric (<output>_<metric>.csv)"
+        ),
+    )
+    parser.add_argument(
+        "--downsample",
+        type=int,
+        default=None,
+        metavar="POINTS",
+        help=(
+            "Reduce every row (compare and bound rows included) to about POINTS "
+            "timeline steps that keep its spikes, e.g. 300 for long captures; "
+            "see --downsample-method"
+        ),
+    )
+    parser.add_argument(
+        "--downsample-method",
+        type=str,
+        default="lttb",
+        choices=list(DOWNSAMPLE_METHODS),
+        help=(
+            "'lttb' (Largest-Triangle-Three-Buckets: one shape-preserving value "
+            "per step, default) or 'minmax' (each pair of steps holds the "
+            "minimum and maximum of its time span)"
+        ),
+    )
+    parser.add_argument(
+        "--segment-seconds",
+        type=float,
+        default=None,
+        help=(
+            "Split long timelines into files of this many seconds "
+            "(<output>_part001.csv, ...) plus an index, <output>_segments.csv, "
+            "listing each file's time range (e.g. 600)"
+        ),
+    )
+    parser.add_argument(
+        "--max-columns",
+        type=int,
+        default=None,
+        help=(
+            "Split the timeline as --segment-seconds does so that no file has "
+            "more than this many bin columns"
+        ),
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help=(
+            "Also write <output>_summary.csv with one whole-run value per "
+            "file and metric (e.g. overall 1%% low FPS)"
         ),
     )
     parser.add_argument(
@@ -477,78 +4797,749 @@ def main():
         default=0.0,
         help="Seconds to trim from the end of each log (default: 0.0)",
     )
+    parser.add_argument(
+        "--bin-width",
+        type=float,
+        default=1.0,
+        help=(
+            "Bin size in seconds, e.g. 0.25 for smoother animations or 60 for "
+            "long soak tests (default: 1.0)"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "Parse input files in N worker processes (default: 1, "
+            "0 = one per CPU)"
+        ),
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default="auto",
+        choices=list(ENGINES),
+        help=(
+            "Binning engine: 'numpy' (vectorized), 'python', or 'auto' "
+            "(default: numpy when installed)"
+        ),
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Keep parsed columns in an on-disk cache so later runs over the "
+            "same logs skip CSV parsing (off by default; see --cache-dir)"
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use the parsed-column cache, even with --cache or --cache-dir",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Delete the parsed-column cache before processing",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help=(
+            "Directory for the parsed-column cache; turns the cache on "
+            f"(default with --cache: {ParseCache.DIR_NAME} next to each input)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-size-mb",
+        type=float,
+        default=1024.0,
+        help="Evict least recently used cache entries above this size (default: 1024)",
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help=(
+            "Keep reading the inputs while FrameView is still writing them and "
+            "rewrite the output every --interval seconds with the completed "
+            "bins (stop with Ctrl+C)"
+        ),
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Keep watching --dir/--glob for new or changed logs and rewrite "
+            "the output whenever one settles; only those logs are parsed "
+            "(stop with Ctrl+C)"
+        ),
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Seconds between polls in --follow/--watch mode (default: 1.0)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="json",
+        default=None,
+        choices=["json", "csv"],
+        help=(
+            "Time each stage (read, tokenize, parse, finalize, write; binning "
+            "as the remainder) and count rows, skipped rows and bytes read per "
+            "file; writes "
+            "<output>_profile.json (or .csv with --profile csv)"
+        ),
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help=(
+            "Also record each file's peak traced memory in the --profile "
+            "report (tracemalloc makes the run several times slower)"
+        ),
+    )
     parser.add_argument(
         "--compare",
         type=str,
-        nargs=2,
+        nargs="+",
         default=None,
+        metavar="LOG",
         help=(
-            "Compare two logs and add a third row with percentage difference "
-            "relative to the first"
+            "Compare a baseline log (the first) against one or more candidate "
+            "logs, adding a percentage difference row per candidate"
         ),
     )
     parser.add_argument(
         "--difference-only",
         action="store_true",
-        help="When using --compare, output only the difference row",
+        help="When using --compare, output only the difference rows",
+    )
+    parser.add_argument(
+        "--aggregate",
+        action="store_true",
+        help=(
+            "Treat logs as repeated runs: group them (see --group-by) and write "
+            "mean, median, min, max and 95%% confidence bound rows per group "
+            "instead of one row per log"
+        ),
+    )
+    parser.add_argument(
+        "--group-by",
+        type=str,
+        default="name",
+        help=(
+            "Grouping for --aggregate: 'name' (row name without a run marker "
+            "such as _run1, pass2, _r3 or (4), default), 'number' (also without "
+            "a bare trailing number, e.g. Scene_1), 're:PATTERN' (first regex "
+            "group of the row name) or a log field: application, gpu, cpu, "
+            "resolution, runtime, present_mode"
+        ),
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "With --compare, add lower/upper confidence bound rows to every "
+            "difference row from N bootstrap resamples (e.g. 2000) and write "
+            "the whole-run difference with its bounds to <output>_bootstrap.json; "
+            "spread over --jobs worker processes (needs NumPy)"
+        ),
+    )
+    parser.add_argument(
+        "--bootstrap-level",
+        type=str,
+        default="auto",
+        choices=["auto", "frames", "runs"],
+        help=(
+            "Resample the frames within every bin, or whole runs when the "
+            "compare logs are repeats (grouped as in --group-by, the baseline's "
+            "group first); 'auto' resamples runs when every group has at least "
+            "two (default: auto)"
+        ),
+    )
+    parser.add_argument(
+        "--confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level of the --bootstrap bounds (default: 0.95)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help=(
+            "Random seed for --bootstrap; the seed used is always reported, so "
+            "passing it again reproduces the bounds (default: random)"
+        ),
     )
 
     args = parser.parse_args()
+    if args.output is None:
+        args.output = "flourish_out" + OUTPUT_WRITERS[args.format][0]
+    if not args.bin_width > 0 or math.isinf(args.bin_width):
+        parser.error("--bin-width must be a positive number of seconds")
+    if args.segment_seconds is not None and not (
+        args.segment_seconds > 0 and math.isfinite(args.segment_seconds)
+    ):
+        parser.error("--segment-seconds must be a positive number of seconds")
+    if args.max_columns is not None and args.max_columns < 1:
+        parser.error("--max-columns must be at least 1")
+    if args.downsample is not None and args.downsample < 2:
+        parser.error("--downsample needs at least 2 points")
+    if (args.follow or args.watch) and not args.interval > 0:
+        parser.error("--interval must be a positive number of seconds")
+    if args.watch and (args.follow or args.compare or args.inputs):
+        parser.error("--watch cannot be combined with --follow, --compare or --inputs")
+    if args.profile_memory and not args.profile:
+        args.profile = "json"
+    if args.profile and (args.follow or args.watch):
+        parser.error("--profile cannot be combined with --follow or --watch")
+    if args.compare is not None and len(args.compare) < 2:
+        parser.error("--compare needs a baseline and at least one candidate log")
+    if args.aggregate and (args.compare or args.follow or args.watch):
+        parser.error("--aggregate cannot be combined with --compare, --follow or --watch")
+    if args.bootstrap is not None:
+        if not args.compare or args.follow:
+            parser.error("--bootstrap needs --compare and cannot be combined with --follow")
+        if args.bootstrap < 1:
+            parser.error("--bootstrap needs at least one resample")
+        if np is None:
+            parser.error("--bootstrap needs NumPy (pip install numpy)")
+        if not 0 < args.confidence < 1:
+            parser.error("--confidence must be between 0 and 1")
+        if args.seed is None:
+            args.seed = secrets.randbits(32)
+    try:
+        group_runs([], [], args.group_by)
+    except (ValueError, re.error) as exc:
+        parser.error(f"--group-by: {exc}")
+    if args.where and (args.inputs or args.watch or args.compare):
+        parser.error("--where cannot be combined with --inputs, --watch or --compare")
+    try:
+        catalog_filters = [parse_catalog_filter(text) for text in args.where or []]
+    except ValueError as exc:
+        parser.error(str(exc))
 
     directory = Path(args.dir)
     if args.inputs:
         files = [Path(p) for p in args.inputs]
+    elif args.where:
+        catalog_path = Path(args.catalog) if args.catalog else directory / CATALOG_FILE
+        if not catalog_path.is_file():
+            raise SystemExit(
+                f"No catalog at {catalog_path}; build it with: "
+                f"flourish_maker.py catalog {directory}"
+            )
+        with LogCatalog(catalog_path) as catalog:
+            files = [e["path"] for e in catalog.query(catalog_filters, directory)]
+        if not files:
+            raise SystemExit("No catalogued logs match --where.")
     else:
         files = discover_input_files(directory, args.glob)
 
-    rows: List[Tuple[str, List[Optional[float]]]] = []
+    cache: Optional[ParseCache] = None
+    use_cache = (args.cache or args.cache_dir is not None) and not args.no_cache
+    if use_cache or args.clear_cache:
+        cache = ParseCache(
+            Path(args.cache_dir) if args.cache_dir else None,
+            max_bytes=int(args.cache_size_mb * 1024 * 1024),
+        )
+        if args.clear_cache:
+            cache.clear(files + [Path(p) for p in args.compare or []])
+        if not use_cache:
+            cache = None
 
-    if args.compare:
-        # Compare mode: override inputs with the two specified files
-        comp_files = [Path(p) for p in args.compare]
-        series_data: List[Tuple[str, List[Optional[float]]]] = []
-        for p in comp_files:
-            if not p.exists():
-                raise FileNotFoundError(f"Input not found: {p}")
-            name, series = compute_per_second_series(
-                p, 
-                args.metric, 
-                fps_mode=args.fps_mode,
-                trim_start=args.trim_start,
-                trim_end=args.trim_end,
-            )
-            series_data.append((name, series))
-        # Compute difference
-        (name_a, series_a), (name_b, series_b) = series_data
-        diff_series = compute_difference_series(series_a, series_b)
-        if args.difference_only:
-            rows = [("%", diff_series)]
+    metrics: List[str] = list(args.metric or [])
+    if args.metrics:
+        metrics.extend(m.strip() for m in args.metrics.split(",") if m.strip())
+    if not metrics:
+        metrics = [MetricKind.AVG_FPS]
+    # Keep order, drop repeats
+    metrics = list(dict.fromkeys(metrics))
+
+    def load(
+        paths: List[Path],
+        summaries: List[Dict[str, Optional[float]]],
+        profiles: Optional[List[FileProfile]] = None,
+    ) -> List[Tuple[str, Dict[str, List[Optional[float]]]]]:
+        for p in paths:
+            try:
+                log_stat(p)
+            except OSError:
+                raise FileNotFoundError(f"Input not found: {p}") from None
+        return compute_series_batch(
+            paths,
+            metrics,
+            fps_mode=args.fps_mode,
+            trims=[(args.trim_start, args.trim_end)] * len(paths),
+            jobs=args.jobs,
+            cache=cache,
+            engine=args.engine,
+            summaries=summaries,
+            bin_width=args.bin_width,
+            profiles=profiles,
+            profile_memory=args.profile_memory,
+        )
+
+    # (path, seconds) of every output file written, for --profile
+    write_times: List[Tuple[Path, float]] = []
+    # --aggregate group of every loaded log
+    group_keys: List[str] = []
+    # --bootstrap compare rows per metric
+    bootstrapped: Dict[str, List[Tuple[str, List[Optional[float]]]]] = {}
+
+    # Segments --follow has written in full
+    finished_segments: Set[Path] = set()
+    # (unsplit output, its segments) written by the current write_outputs
+    segments: List[Tuple[Path, List[SegmentEntry]]] = []
+
+    def write_rows(
+        path: Path, rows: List[Tuple[str, List[Optional[float]]]], bin_width: float
+    ) -> str:
+        start = time.perf_counter()
+        # Bins per output file with --segment-seconds / --max-columns
+        segment_bins = 0
+        if args.segment_seconds:
+            segment_bins = max(1, int(round(args.segment_seconds / bin_width)))
+        if args.max_columns:
+            segment_bins = min(segment_bins or args.max_columns, args.max_columns)
+        if not segment_bins:
+            write_series(path, rows, bin_width, args.format)
+            write_times.append((path, time.perf_counter() - start))
+            return f"Wrote {path} with {len(rows)} row(s)."
+        entries: List[SegmentEntry] = []
+        # Downsampled buckets move as the capture grows, so nothing is final
+        finished = finished_segments if args.follow and not args.downsample else None
+        for entry in write_segments(
+            path, rows, segment_bins, bin_width, args.format, finished
+        ):
+            now = time.perf_counter()
+            write_times.append((entry[0], now - start))
+            start = now
+            entries.append(entry)
+        segments.append((path, entries))
+        return (
+            f"Wrote {path.stem}_part*{path.suffix} as {len(entries)} segment(s) "
+            f"with {len(rows)} row(s)."
+        )
+
+    def write_outputs(
+        loaded: List[Tuple[str, Dict[str, List[Optional[float]]]]],
+        summaries: List[Dict[str, Optional[float]]],
+    ) -> List[str]:
+        """Write every output file; returns one progress line per file."""
+        del write_times[:], segments[:]
+        rows_by_metric: Dict[str, List[Tuple[str, List[Optional[float]]]]] = {}
+        if bootstrapped:
+            rows_by_metric.update(bootstrapped)
+        elif args.compare:
+            for metric in metrics:
+                rows_by_metric[metric] = compare_rows(
+                    [(name, results[metric]) for name, results in loaded],
+                    args.difference_only,
+                    args.engine,
+                )
         else:
+            for metric in metrics:
+                rows_by_metric[metric] = [
+                    (name, results[metric]) for name, results in loaded
+                ]
+                if args.aggregate:
+                    rows_by_metric[metric] = aggregate_rows(
+                        rows_by_metric[metric], group_keys, args.engine
+                    )
+
+        bin_width = args.bin_width
+        if args.downsample:
+            # Same buckets for every metric, so combined tables line up
+            n_bins = max(
+                (len(series) for rows in rows_by_metric.values() for _, series in rows),
+                default=0,
+            )
+            for metric in metrics:
+                rows_by_metric[metric], bin_width = downsample_rows(
+                    rows_by_metric[metric],
+                    args.downsample,
+                    args.downsample_method,
+                    args.bin_width,
+                    n_bins,
+                )
+
+        written: List[str] = []
+        output_path = Path(args.output)
+        if len(metrics) == 1:
+            written.append(
+                write_rows(output_path, rows_by_metric[metrics[0]], bin_width)
+            )
+        elif args.combine_metrics:
             rows = [
-                (name_a, series_a),
-                (name_b, series_b),
-                ("%", diff_series),
+                (f"{name}_{metric_slug(metric)}", series)
+                for metric in metrics
+                for name, series in rows_by_metric[metric]
             ]
-    else:
-        if not files:
-            raise SystemExit(
-                "No input files found. Use --inputs or adjust --dir/--glob."
-            )
+            written.append(write_rows(output_path, rows, bin_width))
+        else:
+            for metric in metrics:
+                metric_path = metric_output_path(output_path, metric)
+                written.append(
+                    write_rows(metric_path, rows_by_metric[metric], bin_width)
+                )
+        if segments:
+            index_path = segment_index_path(output_path)
+            start = time.perf_counter()
+            write_segment_index(index_path, segments, bin_width)
+            write_times.append((index_path, time.perf_counter() - start))
+            n_segments = sum(len(entries) for _path, entries in segments)
+            written.append(f"Wrote {index_path} listing {n_segments} segment(s).")
+
+        if args.summary:
+            summary_path = summary_output_path(output_path, args.format)
+            summary_rows = [
+                (name, summary)
+                for (name, _results), summary in zip(loaded, summaries)
+            ]
+            start = time.perf_counter()
+            write_run_summary_csv(summary_path, metrics, summary_rows)
+            write_times.append((summary_path, time.perf_counter() - start))
+            written.append(f"Wrote {summary_path} with {len(summary_rows)} row(s).")
+        return written
+
+    if args.watch:
+        watch_directory(directory, args.glob, metrics, args, cache, write_outputs)
+        return
+
+    if args.compare:
+        # Compare mode: override inputs with the baseline and candidates
+        files = [Path(p) for p in args.compare]
+    elif not files:
+        raise SystemExit(
+            "No input files found. Use --inputs or adjust --dir/--glob."
+        )
+
+    if args.follow:
         for p in files:
-            if not p.exists():
-                raise FileNotFoundError(f"Input not found: {p}")
-            name, series = compute_per_second_series(
-                p, 
-                args.metric, 
-                fps_mode=args.fps_mode,
-                trim_start=args.trim_start,
-                trim_end=args.trim_end,
+            if is_packed_log(p):
+                raise SystemExit(f"--follow needs uncompressed logs: {p}")
+        follow_logs(files, metrics, args, write_outputs)
+        return
+
+    summaries: List[Dict[str, Optional[float]]] = []
+    profiles: Optional[List[FileProfile]] = [] if args.profile else None
+    start = time.perf_counter()
+    # Parse a log given several times (e.g. baseline also listed as a
+    # candidate) only once
+    position = {p: i for i, p in enumerate(dict.fromkeys(files))}
+    loaded = load(list(position), summaries, profiles)
+    if len(position) < len(files):
+        loaded = [loaded[position[p]] for p in files]
+        summaries = [summaries[position[p]] for p in files]
+    if args.aggregate:
+        group_keys[:] = group_runs(files, [name for name, _ in loaded], args.group_by)
+    if args.bootstrap:
+        rows_by_metric, report = bootstrap_compare(files, loaded, metrics, args, cache)
+        bootstrapped.update(rows_by_metric)
+    for line in write_outputs(loaded, summaries):
+        print(line)
+    if args.bootstrap:
+        output_path = Path(args.output)
+        report_path = output_path.with_name(f"{output_path.stem}_bootstrap.json")
+        with report_path.open("w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        for metric, entries in report["metrics"].items():
+            prefix = f"{metric}: " if len(metrics) > 1 else ""
+            for entry in entries:
+                if entry["difference"] is None:
+                    print(f"{prefix}{entry['candidate']}: no bins shared with the baseline")
+                    continue
+                print(
+                    f"{prefix}{entry['candidate']} vs {report['baseline']}: "
+                    f"{entry['difference']:+.2f}% "
+                    f"[{entry['low']:+.2f}%, {entry['high']:+.2f}%] "
+                    f"over {entry['bins']} bin(s)"
+                )
+        print(
+            f"Wrote {report_path} ({args.bootstrap} {report['level']} resamples, "
+            f"{args.confidence:.0%} confidence, seed {args.seed}; pass "
+            f"--seed {args.seed} to reproduce)."
+        )
+    if profiles is not None:
+        output_path = Path(args.output)
+        report_path = output_path.with_name(
+            f"{output_path.stem}_profile.{args.profile}"
+        )
+        write_profile_report(
+            report_path, profiles, write_times, time.perf_counter() - start
+        )
+        print(f"Wrote {report_path} for {len(profiles)} file(s).")
+
+
+def bootstrap_compare(
+    files: List[Path],
+    loaded: List[Tuple[str, Dict[str, List[Optional[float]]]]],
+    metrics: List[str],
+    args: argparse.Namespace,
+    cache: Optional[ParseCache],
+) -> Tuple[Dict[str, List[Tuple[str, List[Optional[float]]]]], Dict[str, object]]:
+    """
+    --bootstrap: the compare rows of every metric with their confidence
+    bound rows, and the report written to <output>_bootstrap.json.
+    """
+    names = [name for name, _results in loaded]
+    keys = group_runs(files, names, args.group_by)
+    groups = list(dict.fromkeys(keys))
+    repeated = len(groups) > 1 and all(keys.count(k) >= 2 for k in groups)
+    level = args.bootstrap_level
+    if level == "auto":
+        level = "runs" if repeated else "frames"
+    if level == "runs" and not repeated:
+        raise SystemExit(
+            "--bootstrap-level runs needs two or more groups of at least two "
+            "runs each (see --group-by)"
+        )
+    if level == "frames" and args.fps_mode == "count":
+        raise SystemExit(
+            "Resampling frames leaves frame counts unchanged; use --fps-mode "
+            "per-frame-mean or --bootstrap-level runs"
+        )
+
+    rows_by_metric: Dict[str, List[Tuple[str, List[Optional[float]]]]] = {}
+    report: Dict[str, object] = {
+        "level": level,
+        "resamples": args.bootstrap,
+        "confidence": args.confidence,
+        "seed": args.seed,
+        "baseline": groups[0] if level == "runs" else names[0],
+        "metrics": {},
+    }
+    if level == "runs":
+        candidates = groups[1:]
+        for metric in metrics:
+            runs: Dict[str, List[List[Optional[float]]]] = {k: [] for k in groups}
+            for key, (_name, series) in zip(keys, loaded):
+                runs[key].append(series[metric])
+            differences = bootstrap_run_differences(
+                [runs[k] for k in groups], args.bootstrap, args.seed, args.confidence
+            )
+            rows = [] if args.difference_only else [
+                (k, aggregate_runs(runs[k], args.engine)["mean"]) for k in groups
+            ]
+            rows_by_metric[metric] = rows + bootstrap_rows(candidates, differences)
+            report["metrics"][metric] = [
+                dict(candidate=name, **run) for name, (_s, run) in zip(candidates, differences)
+            ]
+        return rows_by_metric, report
+
+    # Read the frames of a log given several times only once
+    position = {p: i for i, p in enumerate(dict.fromkeys(files))}
+    frames: List[Dict[str, List["np.ndarray"]]] = []
+    for p in position:
+        try:
+            frames.append(
+                read_frame_bins(
+                    p, metrics, args.trim_start, args.trim_end, args.bin_width, cache
+                )[1]
             )
-            rows.append((name, series))
+        except Exception as exc:  # noqa: BLE001
+            raise ValueError(f"Failed to process {p}: {exc}") from exc
+    frames = [frames[position[p]] for p in files]
+    candidates = names[1:]
+    for metric in metrics:
+        differences = bootstrap_frame_differences(
+            [f[metric] for f in frames],
+            metric,
+            args.bootstrap,
+            args.seed,
+            args.confidence,
+            args.jobs,
+        )
+        rows = [] if args.difference_only else [
+            (name, series[metric]) for name, series in loaded
+        ]
+        rows_by_metric[metric] = rows + bootstrap_rows(candidates, differences)
+        report["metrics"][metric] = [
+            dict(candidate=name, **run) for name, (_s, run) in zip(candidates, differences)
+        ]
+    return rows_by_metric, report
+
+
+def output_paths(output_path: Path, metrics: List[str], args: argparse.Namespace) -> List[Path]:
+    """Every file main() writes for these arguments."""
+    paths = [output_path]
+    if len(metrics) > 1 and not args.combine_metrics:
+        paths = [metric_output_path(output_path, m) for m in metrics]
+    if args.segment_seconds or args.max_columns:
+        # The segments themselves are <path>_partNNN (see _SEGMENT_STEM)
+        paths.append(segment_index_path(output_path))
+    if args.summary:
+        paths.append(summary_output_path(output_path, args.format))
+    return paths
+
+
+def watch_directory(
+    directory: Path,
+    include_glob: Optional[str],
+    metrics: List[str],
+    args: argparse.Namespace,
+    cache: Optional[ParseCache],
+    write_outputs: Callable[
+        [
+            List[Tuple[str, Dict[str, List[Optional[float]]]]],
+            List[Dict[str, Optional[float]]],
+        ],
+        List[str],
+    ],
+) -> None:
+    """
+    --watch loop: poll discover_input_files every --interval seconds and
+    compare each log's (size, mtime). A new or changed log is parsed once
+    its size and mtime stayed the same for one poll (so files still being
+    written are not parsed half-way); unchanged logs keep their series and
+    are never read again. The outputs are rewritten after every change.
+    """
+    skip = {p.resolve() for p in output_paths(Path(args.output), metrics, args)}
+    # path -> (size, mtime_ns) of the version in ``results``
+    parsed: Dict[Path, Tuple[int, int]] = {}
+    results: Dict[
+        Path, Tuple[str, Dict[str, List[Optional[float]]], Dict[str, Optional[float]]]
+    ] = {}
+    # path -> (size, mtime_ns) seen on the previous poll, not parsed yet
+    seen: Dict[Path, Tuple[int, int]] = {}
+
+    def parse(paths: List[Path]) -> None:
+        summaries: List[Dict[str, Optional[float]]] = []
+        loaded = compute_series_batch(
+            paths,
+            metrics,
+            fps_mode=args.fps_mode,
+            trims=[(args.trim_start, args.trim_end)] * len(paths),
+            jobs=args.jobs,
+            cache=cache,
+            engine=args.engine,
+            summaries=summaries,
+            bin_width=args.bin_width,
+        )
+        for p, (name, series), summary in zip(paths, loaded, summaries):
+            results[p] = (name, series, summary)
+
+    print(f"Watching {directory}; press Ctrl+C to stop.", flush=True)
+    try:
+        while True:
+            current: Dict[Path, Tuple[int, int]] = {}
+            for p in discover_input_files(directory, include_glob):
+                if p.resolve() in skip:
+                    continue
+                part = _SEGMENT_STEM.fullmatch(p.stem)
+                if part and p.with_name(part.group(1) + p.suffix).resolve() in skip:
+                    continue
+                try:
+                    stat = log_stat(p)
+                except OSError:
+                    continue
+                current[p] = (stat.st_size, stat.st_mtime_ns)
+
+            removed = [p for p in parsed if p not in current]
+            for p in removed:
+                del parsed[p]
+                results.pop(p, None)
+            # Changed since it was parsed, and settled since the last poll
+            ready = [
+                p
+                for p, key in current.items()
+                if parsed.get(p) != key and seen.get(p) == key
+            ]
+            seen = {p: key for p, key in current.items() if parsed.get(p) != key}
+
+            try:
+                if ready:
+                    parse(ready)
+            except ValueError:
+                # Parse one by one so a broken log does not hold up the others;
+                # it is retried once it changes again
+                for p in ready:
+                    try:
+                        parse([p])
+                    except ValueError as exc:
+                        print(exc, file=sys.stderr, flush=True)
+                        results.pop(p, None)
+            for p in ready:
+                parsed[p] = current[p]
+
+            if ready or removed:
+                order = sorted(results)
+                for line in write_outputs(
+                    [(results[p][0], results[p][1]) for p in order],
+                    [results[p][2] for p in order],
+                ):
+                    print(line, flush=True)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
 
-    output_path = Path(args.output)
-    write_flourish_wide_csv(output_path, rows)
-    print(f"Wrote {output_path} with {len(rows)} row(s).")
+
+def follow_logs(
+    files: List[Path],
+    metrics: List[str],
+    args: argparse.Namespace,
+    write_outputs: Callable[
+        [
+            List[Tuple[str, Dict[str, List[Optional[float]]]]],
+            List[Dict[str, Optional[float]]],
+        ],
+        List[str],
+    ],
+) -> None:
+    """
+    --follow loop: poll every log each --interval seconds and rewrite the
+    outputs whenever one grew. Only appended lines are parsed on each poll;
+    the outputs hold completed bins until Ctrl+C, when the held-back rows
+    are binned and the final outputs written.
+    """
+    followers = [
+        LogFollower(
+            p,
+            metrics,
+            fps_mode=args.fps_mode,
+            trim_start=args.trim_start,
+            trim_end=args.trim_end,
+            bin_width=args.bin_width,
+        )
+        for p in files
+    ]
+
+    def snapshot(include_open: bool) -> int:
+        loaded = [f.series(include_open) for f in followers]
+        summaries = [f.summary(include_open) for f in followers]
+        write_outputs(loaded, summaries)
+        return max(
+            (len(series) for _name, results in loaded for series in results.values()),
+            default=0,
+        )
+
+    print(f"Following {len(followers)} log(s); press Ctrl+C to stop.")
+    try:
+        while True:
+            grew = False
+            for follower in followers:
+                grew = follower.poll() or grew
+            if grew:
+                n_bins = snapshot(include_open=False)
+                print(f"Updated outputs: {n_bins} bin(s).", flush=True)
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    for follower in followers:
+        follower.poll()
+        follower.finish()
+    n_bins = snapshot(include_open=True)
+    print(f"Stopped following; final outputs have {n_bins} bin(s).")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+"""Shared fixtures and helpers for the flourish_maker tests."""
+
+import csv
+import math
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import flourish_bench  # noqa: E402
+import flourish_maker as fm  # noqa: E402
+
+EXAMPLE_LOG = ROOT / "example_input.csv"
+HEADER = [
+    "Application",
+    "TimeInSeconds",
+    "MsBetweenPresents",
+    "MsBetweenDisplayChange",
+    "GPU0Util(%)",
+]
+FPS_METRICS = (
+    fm.MetricKind.AVG_FPS,
+    fm.MetricKind.PRESENT_FPS,
+    fm.MetricKind.DISPLAY_FPS,
+)
+
+
+def write_log(
+    path: Path,
+    rows: Sequence[Sequence[object]],
+    header: Sequence[str] = HEADER,
+    newline: str = "\n",
+) -> Path:
+    """Write a small log with ``newline`` after every line (header included)."""
+    lines = [",".join(str(v) for v in line) for line in [header, *rows]]
+    path.write_bytes((newline.join(lines) + newline).encode("utf-8"))
+    return path
+
+
+def frame_rows(
+    n: int, fps: float = 100.0, start: float = 0.5, app: str = "Game.exe"
+) -> List[List[object]]:
+    """Rows of a steady log: frame i presented at start + i / fps."""
+    ms = 1000.0 / fps
+    return [
+        [
+            app,
+            f"{start + i / fps:.6f}",
+            f"{ms:.3f}",
+            f"{ms * (1.0 + (i % 7) / 10.0):.3f}",
+            i % 100,
+        ]
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def synthetic_log(tmp_path: Path) -> Path:
+    """A 20k-frame FrameView log with stutters from the benchmark generator."""
+    path = tmp_path / "FrameView_Synthetic.csv"
+    flourish_bench.generate_log(path, 20_000, seed=3, dist="stutter")
+    return path
+
+
+def reference_series(
+    path: Path,
+    metric: str,
+    fps_mode: str = "per-frame-mean",
+    trim_start: float = 0.0,
+    trim_end: float = 0.0,
+    bin_width: float = 1.0,
+) -> List[Optional[float]]:
+    """
+    The original two-pass algorithm: hold every row, find the time bounds,
+    then bin by whole seconds (or ``bin_width``). The streaming engines must
+    match it exactly.
+    """
+    with path.open("r", newline="", encoding="utf-8", errors="ignore") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+        rows = list(reader)
+    if not rows:
+        return []
+    t_idx = header.index("TimeInSeconds")
+    column, _to_fps = fm.resolve_metric_column(header, metric)
+    m_idx = header.index(column)
+    times = [
+        fm.parse_float(row[t_idx]) for row in rows if t_idx < len(row)
+    ]
+    times = [t for t in times if t is not None]
+    if not times:
+        return []
+    start = min(times) + trim_start
+    end = max(times) - trim_end
+    if start >= end:
+        return []
+    sums: List[float] = []
+    counts: List[int] = []
+    for row in rows:
+        if t_idx >= len(row) or m_idx >= len(row):
+            continue
+        t = fm.parse_float(row[t_idx])
+        if t is None or t < start or t > end:
+            continue
+        value = fm.parse_float(row[m_idx])
+        if value is None or (_to_fps and value <= 0):
+            continue
+        index = int(math.floor(max(t - start, 0.0) / bin_width))
+        if index >= len(sums):
+            sums.extend([0.0] * (index + 1 - len(sums)))
+            counts.extend([0] * (index + 1 - len(counts)))
+        sums[index] += value
+        counts[index] += 1
+    series: List[Optional[float]] = []
+    for s, c in zip(sums, counts):
+        if fps_mode == "count":
+            series.append(c / bin_width)
+        elif c <= 0 or (metric in FPS_METRICS and s <= 0):
+            series.append(None)
+        elif metric in FPS_METRICS:
+            series.append(1000.0 * c / s)
+        else:
+            series.append(s / c)
+    while series and series[-1] is None:
+        series.pop()
+    return series
@@ -0,0 +1,91 @@
+"""Repeated-run grouping and aggregation."""
+
+import csv
+import sys
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+NAMES = [
+    "Scene_run1",
+    "Scene run 2",
+    "ScenePass3",
+    "Scene-take 4",
+    "Scene_r5",
+    "Scene (6)",
+    "Game_60",
+    "Game_120",
+    "Scene_1",
+    "Overrun2",
+]
+
+
+def test_name_grouping_strips_only_run_markers():
+    assert fm.group_runs([], NAMES) == ["Scene"] * 6 + [
+        "Game_60",
+        "Game_120",
+        "Scene_1",
+        "Overrun2",
+    ]
+
+
+def test_number_grouping_strips_trailing_numbers():
+    assert fm.group_runs([], NAMES, "number") == ["Scene"] * 6 + [
+        "Game",
+        "Game",
+        "Scene",
+        "Overrun2",
+    ]
+
+
+def test_regex_and_unknown_grouping():
+    assert fm.group_runs([], ["a_x1", "b_x2", "c"], r"re:_(x)\d") == ["x", "x", "c"]
+    with pytest.raises(ValueError, match="number"):
+        fm.group_runs([], NAMES, "scene")
+
+
+@pytest.mark.parametrize("engine", ("python", "numpy"))
+def test_aggregate_rows(engine):
+    rows = [("a_run1", [60.0, 50.0, None]), ("a_run2", [62.0, None]), ("b", [1.0])]
+    out = dict(fm.aggregate_rows(rows, fm.group_runs([], [n for n, _ in rows]), engine))
+    assert list(out) == [f"{key}_{s}" for key in ("a", "b") for s in fm.AGGREGATE_STATS]
+    assert out["a_mean"] == [61.0, 50.0, None]
+    assert out["a_min"] == [60.0, 50.0, None]
+    assert out["a_ci95_low"][0] == pytest.approx(61.0 - 12.706)
+    assert out["a_ci95_high"][1] is None
+    assert out["b_median"] == [1.0]
+
+
+@pytest.mark.parametrize(
+    "stems, group_by, groups",
+    (
+        (("144_run1", "144_run2", "165_run1"), "name", ["Game_144", "Game_165"]),
+        (("144_1", "144_2"), "name", ["Game_144_1", "Game_144_2"]),
+        (("144_1", "144_2"), "number", ["Game_144"]),
+    ),
+)
+def test_aggregate_cli(tmp_path, monkeypatch, stems, group_by, groups):
+    for i, stem in enumerate(stems):
+        rows = frame_rows(600, fps=140.0 + i)
+        write_log(tmp_path / f"FrameView_Game_{stem}.csv", rows)
+    out = tmp_path / "out.csv"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "flourish_maker.py",
+            "--dir",
+            str(tmp_path),
+            "--output",
+            str(out),
+            "--aggregate",
+            "--group-by",
+            group_by,
+        ],
+    )
+    fm.main()
+    with out.open(newline="", encoding="utf-8") as f:
+        names = [row[0] for row in list(csv.reader(f))[1:]]
+    assert names == [f"{g}_{s}" for g in groups for s in fm.AGGREGATE_STATS]
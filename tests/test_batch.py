@@ -0,0 +1,55 @@
+"""Process-pool ingestion across input files."""
+
+import pytest
+
+import flourish_maker as fm
+from conftest import EXAMPLE_LOG, frame_rows, write_log
+
+METRICS = ["avg_fps", "column:GPU0Util(%)"]
+
+
+def test_pool_matches_in_process(synthetic_log, tmp_path):
+    small = write_log(tmp_path / "small.csv", frame_rows(900))
+    files = [synthetic_log, EXAMPLE_LOG, small]
+    trims = [(1.0, 0.0), (0.0, 2.0), (0.5, 0.5)]
+    serial_summaries = []
+    pooled_summaries = []
+    serial = fm.compute_series_batch(
+        files, METRICS, trims=trims, jobs=1, summaries=serial_summaries
+    )
+    pooled = fm.compute_series_batch(
+        files, METRICS, trims=trims, jobs=2, summaries=pooled_summaries
+    )
+    assert pooled == serial
+    assert pooled_summaries == serial_summaries
+    for path, trim, (_name, series) in zip(files, trims, serial):
+        _name, single = fm.compute_per_second_multi(
+            path, METRICS, trim_start=trim[0], trim_end=trim[1]
+        )
+        assert series == single
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_failure_names_the_file(tmp_path, jobs):
+    good = write_log(tmp_path / "good.csv", frame_rows(200))
+    bad = write_log(
+        tmp_path / "bad.csv", [["Game.exe", 16.6]], header=["Application", "Ms"]
+    )
+    states = []
+    with pytest.raises(ValueError, match="bad.csv"):
+        fm.compute_series_batch(
+            [good, bad],
+            METRICS,
+            jobs=jobs,
+            file_status=lambda index, state: states.append((index, state)),
+        )
+    assert (1, "failed") in states
+
+
+def test_cancel_before_start(tmp_path):
+    cancel = fm.CancelToken()
+    cancel.cancel()
+    with pytest.raises(fm.OperationCancelled):
+        fm.compute_series_batch(
+            [write_log(tmp_path / "a.csv", frame_rows(100))], METRICS, cancel=cancel
+        )
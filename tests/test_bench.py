@@ -0,0 +1,47 @@
+"""Benchmark suite and its synthetic FrameView log generator."""
+
+import csv
+
+import pytest
+
+import flourish_bench
+import flourish_maker as fm
+
+
+@pytest.mark.parametrize("dist", flourish_bench.DISTRIBUTIONS)
+def test_generated_log_is_a_valid_frameview_log(tmp_path, dist):
+    path = tmp_path / "FrameView_gen.csv"
+    size = flourish_bench.generate_log(path, 3_000, seed=5, dist=dist, fps=120.0)
+    assert size == path.stat().st_size
+    with path.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == flourish_bench.FRAMEVIEW_HEADER
+    assert len(rows) == 3_001
+    t_idx = rows[0].index("TimeInSeconds")
+    times = [float(row[t_idx]) for row in rows[1:]]
+    assert times == sorted(times)
+    _name, series = fm.compute_per_second_series(path, "present_fps")
+    assert series and all(v is None or v > 0 for v in series)
+
+
+def test_generator_is_deterministic(tmp_path):
+    paths = [tmp_path / "a.csv", tmp_path / "b.csv"]
+    for path in paths:
+        flourish_bench.generate_log(path, 500, seed=9, decimal_comma=True)
+    assert paths[0].read_bytes() == paths[1].read_bytes()
+
+
+def test_compare_stage_runs_the_shipped_compare_path(tmp_path, monkeypatch):
+    calls = []
+    compare_rows = flourish_bench.compare_rows
+
+    def recording_compare_rows(rows, *args, **kwargs):
+        calls.append([name for name, _series in rows])
+        return compare_rows(rows, *args, **kwargs)
+
+    monkeypatch.setattr(flourish_bench, "compare_rows", recording_compare_rows)
+    report = flourish_bench.run_benchmarks([2_000], tmp_path, memory=False)
+    stages = [r["stage"] for r in report["results"]]
+    assert stages == ["series", "trim", "write", "compare"]
+    assert calls and all(len(names) == 2 for names in calls)
+    assert all(r["seconds"] > 0 for r in report["results"])
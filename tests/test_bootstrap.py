@@ -0,0 +1,101 @@
+"""Bootstrap confidence bounds for compare differences."""
+
+import json
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import flourish_maker as fm  # noqa: E402
+from conftest import frame_rows, write_log  # noqa: E402
+
+
+def _frame_bins(seed, n_bins=150, ms=10.0, frames=60):
+    rng = np.random.default_rng(seed)
+    return [rng.gamma(20.0, ms / 20.0, frames) for _ in range(n_bins)]
+
+
+def _logs():
+    base = _frame_bins(1)
+    faster = [values / 1.25 for values in _frame_bins(2)]
+    slower = _frame_bins(3, ms=12.5)
+    return [base, faster, slower]
+
+
+def test_frame_bootstrap_is_seeded():
+    logs = _logs()
+    first = fm.bootstrap_frame_differences(logs, "avg_fps", 200, seed=7)
+    again = fm.bootstrap_frame_differences(logs, "avg_fps", 200, seed=7)
+    other = fm.bootstrap_frame_differences(logs, "avg_fps", 200, seed=8)
+    assert first == again
+    assert first[0][0]["difference"] == other[0][0]["difference"]
+    assert first[0][0]["low"] != other[0][0]["low"]
+
+
+def test_frame_bootstrap_does_not_depend_on_jobs():
+    # More bins than one job takes, so the work is really split
+    logs = _logs()
+    assert len(logs[0]) > fm._BOOTSTRAP_JOB_BINS
+    single = fm.bootstrap_frame_differences(logs, "p1_low_fps", 100, seed=3, jobs=1)
+    pooled = fm.bootstrap_frame_differences(logs, "p1_low_fps", 100, seed=3, jobs=2)
+    assert single == pooled
+
+
+def test_frame_bounds_contain_the_difference():
+    results = fm.bootstrap_frame_differences(_logs(), "avg_fps", 400, seed=11)
+    (faster, faster_run), (slower, slower_run) = results
+    for series in (faster, slower):
+        assert all(
+            lo <= d <= hi
+            for d, lo, hi in zip(series["difference"], series["low"], series["high"])
+        )
+    assert faster_run["low"] < 25.0 < faster_run["high"]
+    assert slower_run["low"] < -20.0 < slower_run["high"]
+    assert faster_run["bins"] == 150
+
+
+def test_run_bootstrap():
+    rng = np.random.default_rng(5)
+    base = [list(60.0 + rng.normal(0.0, 1.0, 40)) for _ in range(5)]
+    cand = [list(66.0 + rng.normal(0.0, 1.0, 30)) for _ in range(4)]
+    cand[0][3] = None
+    first = fm.bootstrap_run_differences([base, cand], 500, seed=2)
+    assert first == fm.bootstrap_run_differences([base, cand], 500, seed=2)
+    ((series, run),) = first
+    assert len(series["difference"]) == 30
+    assert run["bins"] == 30
+    assert run["low"] < run["difference"] < run["high"]
+    assert 5.0 < run["low"] and run["high"] < 15.0
+
+
+def test_bootstrap_rows_labels():
+    series = {stat: [1.0] for stat in fm.BOOTSTRAP_STATS}
+    rows = fm.bootstrap_rows(["a"], [(series, {})])
+    assert [name for name, _ in rows] == ["%", "% low", "% high"]
+    rows = fm.bootstrap_rows(["a", "b"], [(series, {}), (series, {})])
+    assert [name for name, _ in rows][3:] == ["b %", "b % low", "b % high"]
+
+
+def test_bootstrap_cli_reports_and_reuses_the_seed(tmp_path, monkeypatch, capsys):
+    logs = [
+        write_log(tmp_path / f"FrameView_{name}.csv", frame_rows(500, fps=fps))
+        for name, fps in (("base", 100.0), ("fast", 120.0))
+    ]
+    out = tmp_path / "out.csv"
+    argv = ["flourish_maker.py", "--compare", *map(str, logs), "--output", str(out)]
+    argv += ["--bootstrap", "200", "--jobs", "1"]
+    monkeypatch.setattr(sys, "argv", argv)
+    fm.main()
+    report_path = tmp_path / "out_bootstrap.json"
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["level"] == "frames"
+    assert str(report["seed"]) in capsys.readouterr().out
+    (entry,) = report["metrics"]["avg_fps"]
+    assert entry["candidate"] == "fast"
+    first = out.read_bytes()
+
+    monkeypatch.setattr(sys, "argv", argv + ["--seed", str(report["seed"])])
+    fm.main()
+    assert out.read_bytes() == first
+    assert json.loads(report_path.read_text(encoding="utf-8")) == report
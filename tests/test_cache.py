@@ -0,0 +1,107 @@
+"""On-disk parsed-column cache: hits, invalidation and unwritable folders."""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+METRICS = ["avg_fps", "column:GPU0Util(%)", "frametime_p99"]
+
+
+def _entries(cache_dir):
+    return sorted(p for p in cache_dir.iterdir() if p.is_dir())
+
+
+def test_cached_series_match_uncached(synthetic_log, tmp_path):
+    cache = fm.ParseCache(tmp_path / "cache")
+    for engine in ("python", "numpy"):
+        uncached = fm.compute_per_second_multi(
+            synthetic_log, METRICS, trim_start=1.0, trim_end=0.5, engine=engine
+        )
+        # First call fills the cache, the second reads it
+        for _ in range(2):
+            cached = fm.compute_per_second_multi(
+                synthetic_log,
+                METRICS,
+                trim_start=1.0,
+                trim_end=0.5,
+                cache=cache,
+                engine=engine,
+            )
+            assert cached == uncached
+
+
+def test_hit_skips_parsing(tmp_path, monkeypatch):
+    log = write_log(tmp_path / "run.csv", frame_rows(500))
+    cache = fm.ParseCache(tmp_path / "cache")
+    expected = fm.compute_per_second_multi(log, METRICS, cache=cache)
+
+    def no_parse(*_args, **_kwargs):
+        raise AssertionError("cache hit parsed the CSV")
+
+    monkeypatch.setattr(fm.ParseCache, "_extract", no_parse)
+    assert fm.compute_per_second_multi(log, METRICS, cache=cache) == expected
+
+
+def test_changed_log_invalidates_entry(tmp_path):
+    log = write_log(tmp_path / "run.csv", frame_rows(500))
+    cache = fm.ParseCache(tmp_path / "cache")
+    fm.compute_per_second_multi(log, METRICS, cache=cache)
+    write_log(log, frame_rows(900, fps=60.0))
+    stat = log.stat()
+    # Make sure the mtime moves even on coarse filesystem clocks
+    os.utime(log, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert fm.compute_per_second_multi(log, METRICS, cache=cache) == (
+        fm.compute_per_second_multi(log, METRICS)
+    )
+    assert len(_entries(tmp_path / "cache")) == 1
+
+
+def test_lru_eviction_keeps_newest_entry(tmp_path):
+    cache = fm.ParseCache(tmp_path / "cache", max_bytes=1)
+    logs = [write_log(tmp_path / f"run{i}.csv", frame_rows(300)) for i in range(3)]
+    for log in logs:
+        fm.compute_per_second_multi(log, METRICS, cache=cache)
+    assert _entries(tmp_path / "cache") == [cache._entry_dir(logs[-1])]
+
+
+def test_unwritable_cache_falls_back_to_parsing(tmp_path):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    log = write_log(log_dir / "run.csv", frame_rows(500))
+    # A file where the cache folder should go
+    (log_dir / fm.ParseCache.DIR_NAME).write_text("not a folder")
+    expected = fm.compute_per_second_multi(log, METRICS)
+    with pytest.warns(RuntimeWarning, match="Parse cache not writable"):
+        result = fm.compute_per_second_multi(log, METRICS, cache=fm.ParseCache())
+    assert result == expected
+    with pytest.warns(RuntimeWarning):
+        loaded = fm.compute_series_batch([log], METRICS, cache=fm.ParseCache())
+    assert loaded == [expected]
+
+
+def test_cli_cache_is_opt_in(tmp_path, monkeypatch):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    write_log(log_dir / "FrameView_run.csv", frame_rows(500))
+    out = tmp_path / "out.csv"
+    argv = ["flourish_maker.py", "--dir", str(log_dir), "--output", str(out)]
+    monkeypatch.setattr(sys, "argv", argv)
+    fm.main()
+    assert out.is_file()
+    assert not (log_dir / fm.ParseCache.DIR_NAME).exists()
+
+    monkeypatch.setattr(sys, "argv", argv + ["--cache"])
+    fm.main()
+    assert len(_entries(log_dir / fm.ParseCache.DIR_NAME)) == 1
+    shutil.rmtree(log_dir / fm.ParseCache.DIR_NAME)
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(sys, "argv", argv + ["--cache-dir", str(cache_dir)])
+    fm.main()
+    assert len(_entries(cache_dir)) == 1
+    assert not (log_dir / fm.ParseCache.DIR_NAME).exists()
@@ -0,0 +1,117 @@
+"""The SQLite log catalog and ``--where`` input selection."""
+
+import csv
+import os
+import sys
+
+import pytest
+
+import flourish_maker as fm
+from conftest import HEADER, frame_rows, write_log
+
+GPU_HEADER = HEADER + ["GPU"]
+
+
+def _log(path, n, app="Game.exe", gpu="RTX 4090"):
+    rows = [row + [gpu] for row in frame_rows(n, app=app)]
+    return write_log(path, rows, header=GPU_HEADER)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    (
+        ("application=cyberpunk", ("application", "=", "cyberpunk")),
+        (" GPU != 4090 ", ("gpu", "!=", "4090")),
+        ("duration>=60", ("duration", ">=", "60")),
+        ("rows<1e4", ("rows", "<", "1e4")),
+        ("column=GPU0Util(%)", ("column", "=", "GPU0Util(%)")),
+    ),
+)
+def test_parse_filter(text, expected):
+    assert fm.parse_catalog_filter(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    (
+        ("application", "expected field=value"),
+        ("colour=red", "Unknown catalog field"),
+        ("duration>=long", "needs a number"),
+        ("gpu>4090", "take = or !="),
+        ("column<x", "take = or !="),
+    ),
+)
+def test_parse_filter_errors(text, message):
+    with pytest.raises(ValueError, match=message):
+        fm.parse_catalog_filter(text)
+
+
+def test_update_reads_only_changed_logs(tmp_path):
+    logs = tmp_path / "logs"
+    (logs / "sub").mkdir(parents=True)
+    log_a = _log(logs / "FrameView_a.csv", 1000)
+    log_b = _log(logs / "sub" / "FrameView_b.csv", 200, app="Other.exe", gpu="RX 7900")
+    with fm.LogCatalog(tmp_path / "catalog.db") as catalog:
+        assert catalog.update(logs)["added"] == 2
+        assert catalog.update(logs)["unchanged"] == 2
+
+        _log(log_a, 500)
+        stat = log_a.stat()
+        os.utime(log_a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        log_b.unlink()
+        counts = catalog.update(logs)
+        assert (counts["updated"], counts["removed"]) == (1, 1)
+
+        (entry,) = catalog.query()
+        assert entry["path"] == log_a.resolve()
+        assert entry["rows"] == 500
+        assert entry["gpu"] == "RTX 4090"
+        assert entry["duration"] == pytest.approx(4.99)
+        assert entry["columns"] == GPU_HEADER
+
+
+def test_query_filters(tmp_path):
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    _log(logs / "FrameView_a.csv", 1000, app="Cyberpunk2077.exe")
+    _log(logs / "FrameView_b.csv", 200, gpu="RX 7900")
+    write_log(logs / "FrameView_c.csv", frame_rows(3000))
+    with fm.LogCatalog(tmp_path / "catalog.db") as catalog:
+        catalog.update(logs)
+
+        def names(*texts):
+            filters = [fm.parse_catalog_filter(text) for text in texts]
+            return [entry["path"].name for entry in catalog.query(filters)]
+
+        assert names("application=CYBERPUNK") == ["FrameView_a.csv"]
+        assert names("gpu!=4090") == ["FrameView_b.csv", "FrameView_c.csv"]
+        assert names("column=GPU", "duration>5") == ["FrameView_a.csv"]
+        assert names("column!=GPU") == ["FrameView_c.csv"]
+        assert names("rows<=200") == ["FrameView_b.csv"]
+        assert catalog.query(under=tmp_path / "elsewhere") == []
+
+
+def test_where_selects_inputs(tmp_path, monkeypatch):
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    _log(logs / "FrameView_a.csv", 1000, gpu="RTX 4090")
+    _log(logs / "FrameView_b.csv", 1000, gpu="RX 7900")
+    assert fm.catalog_main([str(logs), "--jobs", "1"]) == 0
+    out = tmp_path / "out.csv"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "flourish_maker.py",
+            "--dir",
+            str(logs),
+            "--where",
+            "gpu=7900",
+            "--output",
+            str(out),
+        ],
+    )
+    fm.main()
+    with out.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert len(rows) == 2 and rows[1][0] == "b"
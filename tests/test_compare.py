@@ -0,0 +1,64 @@
+"""Compare mode: percentage difference rows against a baseline."""
+
+import csv
+import random
+import sys
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+
+def _series(rng, n):
+    # Mostly values, with gaps and zero baselines that give no difference
+    return [rng.choice((None, 0.0, rng.uniform(1.0, 200.0), 60.0)) for _ in range(n)]
+
+
+def test_engines_agree():
+    rng = random.Random(11)
+    base = _series(rng, 300)
+    others = [_series(rng, n) for n in (300, 120, 450, 0)]
+    python = fm.compute_difference_matrix(base, others, engine="python")
+    assert fm.compute_difference_matrix(base, others, engine="numpy") == python
+    assert [len(row) for row in python] == [300, 120, 300, 0]
+    assert python == [fm.compute_difference_series(base, other) for other in others]
+
+
+@pytest.mark.parametrize("engine", ("python", "numpy"))
+def test_difference_values(engine):
+    (diff,) = fm.compute_difference_matrix(
+        [100.0, None, 0.0, 50.0], [[110.0, 5.0, 5.0, None, 9.0]], engine=engine
+    )
+    assert diff[0] == pytest.approx(10.0)
+    assert diff[1:] == [None, None, None]
+
+
+@pytest.mark.parametrize("engine", ("python", "numpy"))
+def test_row_labels(engine):
+    rows = [("base", [100.0, 100.0]), ("a", [90.0, 110.0]), ("b", [100.0, 50.0])]
+    single = fm.compare_rows(rows[:2], engine=engine)
+    assert [name for name, _ in single] == ["base", "a", "%"]
+    several = fm.compare_rows(rows, difference_only=True, engine=engine)
+    assert [name for name, _ in several] == ["a %", "b %"]
+    assert several[1][1] == [0.0, -50.0]
+
+
+def test_compare_cli(tmp_path, monkeypatch):
+    logs = [
+        write_log(tmp_path / f"FrameView_{name}.csv", frame_rows(600, fps=fps))
+        for name, fps in (("base", 100.0), ("fast", 125.0), ("slow", 80.0))
+    ]
+    out = tmp_path / "out.csv"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["flourish_maker.py", "--compare", *map(str, logs), "--output", str(out)],
+    )
+    fm.main()
+    with out.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))[1:]
+    assert [row[0] for row in rows] == ["base", "fast", "slow", "fast %", "slow %"]
+    base, fast, slow = ([float(v) for v in row[1:] if v] for row in rows[:3])
+    assert float(rows[3][1]) == pytest.approx(100.0 * (fast[0] / base[0] - 1), 1e-3)
+    assert float(rows[4][2]) == pytest.approx(100.0 * (slow[1] / base[1] - 1), 1e-3)
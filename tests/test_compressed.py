@@ -0,0 +1,72 @@
+"""Compressed logs and zip members are read like the plain CSV."""
+
+import bz2
+import gzip
+import lzma
+import zipfile
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+METRICS = ["avg_fps", "present_fps", "column:GPU0Util(%)"]
+
+COMPRESSORS = {".gz": gzip.compress, ".bz2": bz2.compress, ".xz": lzma.compress}
+
+
+def _packed_copies(tmp_path, log):
+    """The log as .gz, .bz2 and .xz files and as a member of a zip archive."""
+    data = log.read_bytes()
+    paths = []
+    for suffix, compress in COMPRESSORS.items():
+        path = tmp_path / (log.name + suffix)
+        path.write_bytes(compress(data))
+        paths.append(path)
+    archive = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("run1/" + log.name, data)
+    paths.append(archive / "run1" / log.name)
+    return paths
+
+
+@pytest.mark.parametrize("engine", ("python", "numpy"))
+def test_series_match_the_plain_log(tmp_path, engine):
+    # Large enough to span several decompressed chunks
+    rows = frame_rows(12_000, fps=144.0)
+    for i in range(0, 12_000, 997):
+        rows[i][2] = "NA"
+    log = write_log(tmp_path / "FrameView_a.csv", rows)
+    packed = _packed_copies(tmp_path, log)
+    results = fm.compute_series_batch(
+        [log, *packed], METRICS, trims=[(1.0, 2.0)] * 5, engine=engine
+    )
+    assert results[0][1]["avg_fps"]
+    assert all(result == results[0] for result in results[1:])
+
+
+def test_discovery_lists_packed_logs(tmp_path):
+    log = write_log(tmp_path / "FrameView_a.csv", frame_rows(100))
+    packed = _packed_copies(tmp_path, log)
+    write_log(tmp_path / "notes.csv.gz", frame_rows(10))
+    assert fm.discover_input_files(tmp_path, None) == sorted([log, *packed])
+    assert fm.discover_input_files(tmp_path, "run1/*.csv") == [packed[-1]]
+
+
+def test_packed_trim_is_written_next_to_the_file(tmp_path):
+    log = write_log(tmp_path / "FrameView_a.csv", frame_rows(500))
+    for path in _packed_copies(tmp_path, log):
+        out = fm.trim_output_path(path, 1.0, 0.0)
+        assert out == tmp_path / "FrameView_a_trim_1.0s_0.0s.csv"
+        assert fm.trim_csv_passthrough(path, out, 1.0, 0.0)
+        expected = tmp_path / "expected.csv"
+        assert fm.trim_csv_passthrough(log, expected, 1.0, 0.0)
+        assert out.read_bytes() == expected.read_bytes()
+        out.unlink()
+
+
+def test_missing_zip_member(tmp_path):
+    log = write_log(tmp_path / "FrameView_a.csv", frame_rows(100))
+    archive = _packed_copies(tmp_path, log)[-1].parent.parent
+    with pytest.raises(FileNotFoundError, match="Input not found"):
+        fm.open_log(archive / "run2" / log.name)
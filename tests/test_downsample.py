@@ -0,0 +1,72 @@
+"""Shape-preserving downsampling of long series."""
+
+import csv
+import sys
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+
+def _spiky(n=1000):
+    series = [10.0 + (i % 3) * 0.1 for i in range(n)]
+    series[0], series[-1] = 1.0, 3.0
+    series[437] = 200.0
+    series[438] = 0.5
+    return series
+
+
+@pytest.mark.parametrize("method", fm.DOWNSAMPLE_METHODS)
+def test_endpoints_and_spikes_survive(method):
+    rows, bin_width = fm.downsample_rows([("a", _spiky())], 100, method, 0.5)
+    ((_name, series),) = rows
+    assert len(series) == 100
+    assert bin_width == 5.0
+    assert series[0] == 1.0 and series[-1] == 3.0
+    assert 200.0 in series
+    if method == "minmax":
+        # Spike and dip share a bucket and keep their order
+        assert series.index(200.0) + 1 == series.index(0.5)
+
+
+def test_gaps_and_shared_buckets():
+    base = _spiky(500)
+    gappy = base[:]
+    gappy[100:150] = [None] * 50
+    rows, bin_width = fm.downsample_rows(
+        [("a", base), ("b", gappy), ("%", base[:200])], 50, n_bins=500
+    )
+    assert bin_width == 10.0
+    assert [len(series) for _name, series in rows] == [50, 50, 20]
+    assert rows[1][1][10:15] == [None] * 5
+    assert rows[2][1][:5] == rows[0][1][:5]
+
+
+def test_short_rows_are_unchanged():
+    rows = [("a", [1.0, 2.0, 3.0])]
+    assert fm.downsample_rows(rows, 3, "minmax", 0.25) == (rows, 0.25)
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="lttb, minmax"):
+        fm.downsample_rows([("a", _spiky())], 100, "mean")
+    with pytest.raises(ValueError, match="at least 2 points"):
+        fm.downsample_rows([("a", _spiky())], 1)
+
+
+def test_cli_downsample(tmp_path, monkeypatch):
+    rows = frame_rows(10_000)
+    for i in range(5_000, 5_010):
+        rows[i][2] = rows[i][3] = "100.0"
+    write_log(tmp_path / "FrameView_a.csv", rows)
+    out = tmp_path / "out.csv"
+    argv = ["flourish_maker.py", "--dir", str(tmp_path), "--output", str(out)]
+    monkeypatch.setattr(sys, "argv", argv + ["--downsample", "20"])
+    fm.main()
+    with out.open(newline="", encoding="utf-8") as f:
+        header, row = list(csv.reader(f))
+    assert header[1:3] == ["5", "10"]
+    assert len(row) - 1 == 20
+    # The one-second stutter at 50 s stays visible
+    assert min(float(v) for v in row[1:]) < 60.0
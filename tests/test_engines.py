@@ -0,0 +1,73 @@
+"""The NumPy binning engine against the pure-Python one."""
+
+import pytest
+
+import flourish_maker as fm
+from conftest import EXAMPLE_LOG, frame_rows, write_log
+
+pytest.importorskip("numpy")
+
+METRICS = [
+    "avg_fps",
+    "present_fps",
+    "display_fps",
+    "column:GPU0Util(%)",
+    "p1_low_fps",
+    "frametime_p50",
+]
+
+
+def _both_engines(path, metrics=METRICS, **kwargs):
+    python = fm.compute_per_second_multi(path, metrics, engine="python", **kwargs)
+    numpy = fm.compute_per_second_multi(path, metrics, engine="numpy", **kwargs)
+    return python, numpy
+
+
+@pytest.mark.parametrize("trim", ((0.0, 0.0), (1.5, 0.0), (0.0, 2.25), (0.3, 50.0)))
+@pytest.mark.parametrize("fps_mode", ("per-frame-mean", "count"))
+def test_engines_agree_on_example_log(trim, fps_mode):
+    python, numpy = _both_engines(
+        EXAMPLE_LOG,
+        METRICS[:4],
+        fps_mode=fps_mode,
+        trim_start=trim[0],
+        trim_end=trim[1],
+    )
+    assert numpy == python
+
+
+@pytest.mark.parametrize("bin_width", (0.25, 1.0, 7.0))
+def test_engines_agree_with_carry_between_chunks(
+    synthetic_log, monkeypatch, bin_width
+):
+    value_chunks = fm._value_chunks
+    # Small odd-sized chunks so bins straddle chunk boundaries
+    monkeypatch.setattr(
+        fm, "_value_chunks", lambda timed, n: value_chunks(timed, n, chunk_rows=997)
+    )
+    python, numpy = _both_engines(
+        synthetic_log, trim_start=0.7, trim_end=1.3, bin_width=bin_width
+    )
+    assert numpy == python
+    summaries = [
+        fm.compute_run_summary(synthetic_log, METRICS, engine=engine)[1]
+        for engine in ("python", "numpy")
+    ]
+    assert summaries[0] == summaries[1]
+
+
+def test_engines_agree_on_unordered_log(tmp_path):
+    rows = frame_rows(800)
+    rows[700][1] = "0.100000"
+    rows[100][1] = "NA"
+    path = write_log(tmp_path / "unordered.csv", rows)
+    for trim in ((0.0, 0.0), (1.0, 1.0)):
+        python, numpy = _both_engines(path, trim_start=trim[0], trim_end=trim[1])
+        assert numpy == python
+
+
+def test_unknown_engine_is_rejected(tmp_path):
+    path = write_log(tmp_path / "run.csv", frame_rows(100))
+    with pytest.raises(ValueError, match="Unsupported engine"):
+        fm.compute_per_second_multi(path, ["avg_fps"], engine="fortran")
+    assert fm.resolve_engine("auto") == "numpy"
@@ -0,0 +1,80 @@
+"""Follow mode for logs that are still being written."""
+
+import random
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+METRICS = ["avg_fps", "column:GPU0Util(%)", "p1_low_fps"]
+
+
+def _grow(source, target, seed=0):
+    """Yield after appending each random-sized piece of source to target."""
+    data = source.read_bytes()
+    rng = random.Random(seed)
+    target.write_bytes(b"")
+    pos = 0
+    while pos < len(data):
+        step = rng.randint(1, 40_000)
+        with target.open("ab") as f:
+            f.write(data[pos : pos + step])
+        pos += step
+        yield
+
+
+@pytest.mark.parametrize("trim", ((0.0, 0.0), (1.0, 2.5)))
+@pytest.mark.parametrize("bin_width", (1.0, 0.5))
+def test_followed_series_match_finished_log(
+    tmp_path, synthetic_log, trim, bin_width
+):
+    live = tmp_path / "FrameView_Synthetic.csv"
+    follower = fm.LogFollower(live, METRICS, "per-frame-mean", *trim, bin_width)
+    closed = {m: [] for m in METRICS}
+    for _ in _grow(synthetic_log, live):
+        follower.poll()
+        _name, partial = follower.series()
+        for metric in METRICS:
+            # Closed bins never change once reported
+            assert partial[metric][: len(closed[metric])] == closed[metric]
+            closed[metric] = partial[metric]
+    follower.finish()
+    expected = fm.compute_per_second_multi(
+        live, METRICS, trim_start=trim[0], trim_end=trim[1], bin_width=bin_width
+    )
+    assert follower.series(include_open=True) == expected
+    assert follower.summary(include_open=True) == fm.compute_run_summary(
+        live, METRICS, trim_start=trim[0], trim_end=trim[1], bin_width=bin_width
+    )[1]
+
+
+def test_partial_line_waits_for_newline(tmp_path):
+    live = write_log(tmp_path / "live.csv", frame_rows(150))
+    follower = fm.LogFollower(live, METRICS)
+    follower.poll()
+    offset = follower.offset
+    with live.open("ab") as f:
+        f.write(b"Game.exe,9.9")
+    assert not follower.poll()
+    assert follower.offset == offset
+
+
+def test_rewritten_log_is_followed_from_the_start(tmp_path):
+    live = write_log(tmp_path / "live.csv", frame_rows(600))
+    follower = fm.LogFollower(live, METRICS)
+    follower.poll()
+    write_log(live, frame_rows(250, fps=50.0))
+    follower.poll()
+    follower.finish()
+    assert follower.series(include_open=True) == fm.compute_per_second_multi(
+        live, METRICS
+    )
+
+
+def test_time_going_backwards_is_rejected(tmp_path):
+    rows = frame_rows(100)
+    rows[50][1] = "0.100000"
+    live = write_log(tmp_path / "live.csv", rows)
+    with pytest.raises(ValueError, match="time-ordered"):
+        fm.LogFollower(live, METRICS).poll()
@@ -0,0 +1,128 @@
+"""GUI logic that runs without a display: the background generation worker."""
+
+import gzip
+import queue
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+import flourish_gui as gui  # noqa: E402
+import flourish_maker as fm  # noqa: E402
+from conftest import frame_rows, write_log  # noqa: E402
+
+
+def _worker_app():
+    # No Tk root: only the attributes the worker thread uses
+    app = gui.App.__new__(gui.App)
+    app._events = queue.Queue()
+    return app
+
+
+def _events(app):
+    events = []
+    while not app._events.empty():
+        events.append(app._events.get_nowait())
+    return events
+
+
+def _run_worker(app, out_path, files, cancel, **options):
+    settings = dict(
+        metric="avg_fps",
+        fps_mode="per-frame-mean",
+        compare=False,
+        diff_only=False,
+        selected=files,
+        trims=[(0.0, 0.0)] * len(files),
+        jobs=1,
+        bin_width=1.0,
+        downsample=0,
+        downsample_method="lttb",
+        profile=False,
+        lbls={},
+        cancel=cancel,
+    )
+    settings.update(options)
+    app._generate_worker(out_path, **settings)
+    return _events(app)
+
+
+def test_worker_reports_progress_files_and_done(tmp_path):
+    files = [
+        write_log(tmp_path / "FrameView_a.csv", frame_rows(400)),
+        write_log(tmp_path / "FrameView_b.csv", frame_rows(300, fps=60.0)),
+    ]
+    out_path = tmp_path / "out.csv"
+    events = _run_worker(_worker_app(), out_path, files, fm.CancelToken())
+    kinds = [event[0] for event in events]
+    assert kinds[-1] == "done" and events[-1][1] == out_path
+    assert "progress" in kinds
+    assert [e[1:] for e in events if e[0] == "file"] == [
+        (0, "running"),
+        (0, "done"),
+        (1, "running"),
+        (1, "done"),
+    ]
+    loaded = fm.compute_series_batch(files, ["avg_fps"])
+    rows = [(name, results["avg_fps"]) for name, results in loaded]
+    expected = tmp_path / "expected.csv"
+    fm.write_flourish_wide_csv(expected, rows)
+    assert out_path.read_bytes() == expected.read_bytes()
+
+
+def test_worker_stops_when_cancelled(tmp_path):
+    files = [write_log(tmp_path / "FrameView_a.csv", frame_rows(400))]
+    cancel = fm.CancelToken()
+    cancel.cancel()
+    events = _run_worker(_worker_app(), tmp_path / "out.csv", files, cancel)
+    assert events[-1] == ("cancelled",)
+    assert not (tmp_path / "out.csv").exists()
+
+
+def test_worker_reports_errors(tmp_path):
+    bad = write_log(
+        tmp_path / "FrameView_bad.csv", [["Game.exe", 1.0]], header=["App", "Ms"]
+    )
+    events = _run_worker(_worker_app(), tmp_path / "out.csv", [bad], fm.CancelToken())
+    assert events[-1][0] == "error"
+    assert "FrameView_bad.csv" in events[-1][1]
+
+
+class _Entry:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def _trim_messages(monkeypatch, file_path, start, end):
+    messages = []
+    for kind in ("showerror", "showinfo"):
+        monkeypatch.setattr(
+            gui.messagebox, kind, lambda title, text: messages.append((title, text))
+        )
+    dialog = gui.TrimConfigDialog.__new__(gui.TrimConfigDialog)
+    dialog._trim_file_passthrough(file_path, _Entry(start), _Entry(end))
+    return messages
+
+
+def test_trim_file_reports_why_it_failed(tmp_path, monkeypatch):
+    log = write_log(tmp_path / "FrameView_a.csv", frame_rows(400))
+    assert _trim_messages(monkeypatch, log, "x", "0") == [
+        ("Error", "Invalid trim values entered")
+    ]
+    ((title, text),) = _trim_messages(monkeypatch, log, "0.5", "0")
+    assert title == "Success"
+
+    # zlib.error and EOFError, neither of them an OSError
+    damaged = tmp_path / "FrameView_b.csv.gz"
+    truncated = gzip.compress(log.read_bytes())[:-99]
+    for data in (b"\x1f\x8b\x08\x00" + b"\x00" * 20, truncated):
+        damaged.write_bytes(data)
+        ((title, text),) = _trim_messages(monkeypatch, damaged, "0.5", "0")
+        assert title == "Error" and text.startswith("Failed to trim file: ")
+
+    monkeypatch.setattr(gui, "trim_output_path", lambda path, start, end: path)
+    ((title, text),) = _trim_messages(monkeypatch, log, "0.5", "0")
+    assert text == f"Failed to trim file: Output would overwrite the input: {log}"
@@ -0,0 +1,174 @@
+"""GUI file list: background scans, chunked inserts, filter and lazy metadata."""
+
+import queue
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+import flourish_gui as gui  # noqa: E402
+from conftest import HEADER, frame_rows, write_log  # noqa: E402
+
+
+class FakeListbox:
+    """The parts of tk.Listbox the file list uses; shows rows 0-9."""
+
+    def __init__(self):
+        self.rows = []
+        self.selected = set()
+        self.colors = {}
+
+    def insert(self, index, *items):
+        index = len(self.rows) if index == gui.tk.END else index
+        self.rows[index:index] = items
+        self.selected = {i + len(items) if i >= index else i for i in self.selected}
+
+    def delete(self, first, last=None):
+        if last == gui.tk.END:
+            self.rows, self.selected = [], set()
+            return
+        del self.rows[first]
+        self.selected = {i - (i > first) for i in self.selected if i != first}
+
+    def selection_set(self, index):
+        self.selected.add(index)
+
+    def selection_includes(self, index):
+        return index in self.selected
+
+    def curselection(self):
+        return tuple(sorted(self.selected))
+
+    def itemconfig(self, index, foreground):
+        self.colors[index] = foreground
+
+    def cget(self, _option):
+        return "white"
+
+    def nearest(self, y):
+        return min(y // 10, len(self.rows) - 1)
+
+    def winfo_height(self):
+        return 90
+
+
+class FakeVar:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def _list_app():
+    # No Tk root: the file list model, with after() callbacks run by _run
+    app = gui.App.__new__(gui.App)
+    app.t = gui.LANG_TEXTS["en"]
+    app.files_list = FakeListbox()
+    app.filter_var = FakeVar()
+    app.status_var = FakeVar()
+    app._all_files, app._shown, app._row_of = [], [], {}
+    app._file_states, app._file_meta, app._meta_pending = {}, {}, set()
+    app._meta_requests = queue.LifoQueue()
+    app._meta_results = queue.Queue()
+    app._scan_id = 0
+    app._filter_after = app._meta_after = None
+    app.pending = []
+    app.after = lambda _ms, func, *args: app.pending.append((func, args)) or "id"
+    return app
+
+
+def _run(app, limit=1000):
+    """Run queued after() callbacks until none are left; returns statuses."""
+    statuses = []
+    while app.pending and limit:
+        func, args = app.pending.pop(0)
+        func(*args)
+        # Give the scan thread time, as the real 50 ms poll does
+        time.sleep(0.002)
+        statuses.append(app.status_var.get())
+        limit -= 1
+    return statuses
+
+
+def test_scan_is_listed_in_chunks(tmp_path):
+    app = _list_app()
+    files = [tmp_path / f"FrameView_{i:04d}.csv" for i in range(1200)]
+    done = threading.Event()
+
+    def find():
+        done.wait(5)
+        return files
+
+    app._load_files(find, "status_found", "err_scan")
+    assert app.status_var.get() == app.t["status_scanning"]
+    done.set()
+    statuses = _run(app)
+    listing = [s for s in statuses if s.startswith(app.t["status_listing"][:5])]
+    assert len(listing) == 2
+    assert statuses[-1] == app.t["status_found"].format(n=1200)
+    assert app._shown == files and app.files_list.rows == [str(p) for p in files]
+
+
+def test_newer_scan_supersedes_one_in_flight(tmp_path):
+    app = _list_app()
+    old = threading.Event()
+    app._load_files(
+        lambda: old.wait(5) and [tmp_path / "old.csv"], "status_found", "err_scan"
+    )
+    app._load_files(lambda: [tmp_path / "new.csv"], "status_found", "err_scan")
+    old.set()
+    _run(app)
+    assert app._all_files == [tmp_path / "new.csv"]
+
+
+def test_filter_narrows_rows_and_keeps_selection(tmp_path):
+    app = _list_app()
+    names = ("FrameView_a.csv", "FrameView_b.csv", "b2.csv")
+    files = [tmp_path / name for name in names]
+    app._load_files(lambda: files, "status_found", "err_scan")
+    _run(app)
+    app.files_list.selection_set(2)
+    app._file_states = {str(files[1]): "done"}
+    app.filter_var.set("B")
+    app._render_file_list()
+    assert app._shown == files[1:]
+    assert app._read_selected_files() == [files[2]]
+    app._color_rows([0])
+    assert app.files_list.colors[0] == "#89d185"
+    app.filter_var.set("")
+    app._render_file_list()
+    assert app._read_selected_files() == [files[2]]
+
+
+def test_metadata_loads_for_visible_rows_only(tmp_path):
+    app = _list_app()
+    header = HEADER + ["GPU"]
+    files = [
+        write_log(
+            tmp_path / f"FrameView_{i:02d}.csv",
+            [row + ["RTX 4090"] for row in frame_rows(200)],
+            header=header,
+        ).resolve()
+        for i in range(25)
+    ]
+    app._load_files(lambda: files, "status_found", "err_scan")
+    _run(app)
+    app.files_list.selection_set(3)
+    app._request_visible_meta()
+    assert app._meta_pending == set(files[:10])
+
+    threading.Thread(target=app._meta_worker, daemon=True).start()
+    for _ in range(10):
+        path, meta = app._meta_results.get(timeout=5)
+        app._meta_results.put((path, meta))
+        app._poll_meta()
+    assert set(app._file_meta) == set(files[:10])
+    assert app.files_list.rows[3] == f"{files[3]}    (2.0s · Game.exe · RTX 4090)"
+    assert app.files_list.rows[10] == str(files[10])
+    assert app._read_selected_files() == [files[3]]
@@ -0,0 +1,84 @@
+"""Trim manifests and the batch ``trim`` subcommand."""
+
+import json
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+
+@pytest.mark.parametrize("suffix", (".json", ".csv"))
+def test_manifest_round_trip(tmp_path, suffix):
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    log_a = write_log(logs / "FrameView_a.csv", frame_rows(100))
+    log_b = write_log(logs / "FrameView_b.csv", frame_rows(100))
+    manifest = tmp_path / f"session{suffix}"
+    fm.write_trim_manifest(
+        manifest,
+        [(log_a, 1.0, 2.5, tmp_path / "out" / "a.csv"), (log_b, 0.0, 0.5, None)],
+    )
+    entries = [
+        (path.resolve(), start, end, out.resolve())
+        for path, start, end, out in fm.read_trim_manifest(manifest)
+    ]
+    assert entries == [
+        (log_a, 1.0, 2.5, tmp_path / "out" / "a.csv"),
+        (log_b, 0.0, 0.5, fm.trim_output_path(log_b, 0.0, 0.5)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "entries, message",
+    (
+        ({"path": "a.csv"}, "JSON list"),
+        ([{"trim_start": 1}], "entry 1: path is missing"),
+        ([{"path": "a.csv", "trim_end": "soon"}], "invalid trim value"),
+        ([{"path": "a.csv", "trim_start": -1}], "non-negative"),
+        ([{"path": "a.csv"}, {"path": "b.csv", "output": "a_trim.csv"}], "entry 1"),
+    ),
+)
+def test_bad_manifest_entries(tmp_path, entries, message):
+    manifest = tmp_path / "m.json"
+    manifest.write_text(json.dumps(entries), encoding="utf-8")
+    with pytest.raises(ValueError, match=message):
+        fm.read_trim_manifest(manifest)
+
+
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_batch_trims_every_entry_and_reports_failures(tmp_path, jobs):
+    good = write_log(tmp_path / "FrameView_a.csv", frame_rows(500))
+    short = write_log(tmp_path / "FrameView_b.csv", frame_rows(50))
+    entries = [
+        (good, 1.0, 1.0, tmp_path / "out" / "a.csv"),
+        (tmp_path / "missing.csv", 0.0, 0.0, tmp_path / "out" / "m.csv"),
+        (short, 5.0, 5.0, tmp_path / "out" / "b.csv"),
+    ]
+    seen = []
+    errors = fm.trim_batch(entries, jobs, lambda i, e: seen.append(i))
+    assert errors[0] is None
+    assert errors[1] and errors[2] == (
+        "no timed rows, no TimeInSeconds column or empty trim range"
+    )
+    assert sorted(seen) == [0, 1, 2]
+    expected = tmp_path / "expected.csv"
+    assert fm.trim_csv_passthrough(good, expected, 1.0, 1.0)
+    assert (tmp_path / "out" / "a.csv").read_bytes() == expected.read_bytes()
+    assert not (tmp_path / "out" / "b.csv").exists()
+
+
+def test_trim_subcommand(tmp_path, capsys):
+    log = write_log(tmp_path / "FrameView_a.csv", frame_rows(500))
+    manifest = tmp_path / "m.csv"
+    manifest.write_text(
+        "path,trim_start,trim_end,output\n"
+        "FrameView_a.csv,1,0,\n"
+        "FrameView_gone.csv,,,gone.csv\n",
+        encoding="utf-8",
+    )
+    assert fm.trim_main([str(manifest), "--jobs", "1"]) == 1
+    out = capsys.readouterr().out
+    assert "Trimmed 1 of 2 file(s), 1 failed." in out
+    assert "FAILED" in out and "FrameView_gone.csv" in out
+    assert fm.trim_output_path(log, 1.0, 0.0).exists()
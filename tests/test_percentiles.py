@@ -0,0 +1,87 @@
+"""Streaming percentile sketch against exact nearest-rank percentiles."""
+
+import csv
+import math
+
+import pytest
+
+import flourish_maker as fm
+from conftest import EXAMPLE_LOG
+
+# Allow for the rounding of the bound itself
+BOUND = fm.SKETCH_RELATIVE_ACCURACY + 1e-12
+METRICS = ("p1_low_fps", "p01_low_fps", "frametime_p99", "frametime_p50")
+
+
+def _nearest_rank(values, q):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def _frame_times(path):
+    """Positive frame times per whole second, plus all of them."""
+    with path.open("r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        t_idx = header.index("TimeInSeconds")
+        column, _to_fps = fm.resolve_metric_column(header, "avg_fps")
+        m_idx = header.index(column)
+        timed = []
+        for row in reader:
+            t = fm.parse_float(row[t_idx]) if t_idx < len(row) else None
+            if t is not None:
+                timed.append((t, fm.parse_float(row[m_idx])))
+    start = min(t for t, _ms in timed)
+    bins = {}
+    for t, ms in timed:
+        if ms is not None and ms > 0:
+            bins.setdefault(int(t - start), []).append(ms)
+    return bins, [ms for values in bins.values() for ms in values]
+
+
+def _exact(values, metric):
+    q, as_fps = fm.metric_quantile(metric)
+    ms = _nearest_rank(values, q)
+    return 1000.0 / ms if as_fps else ms
+
+
+def _assert_close(approx, exact):
+    assert abs(approx - exact) <= BOUND * exact
+
+
+@pytest.mark.parametrize("engine", ("python", "numpy"))
+@pytest.mark.parametrize("log", ("example", "synthetic"))
+def test_bins_within_bound(engine, log, synthetic_log):
+    path = EXAMPLE_LOG if log == "example" else synthetic_log
+    bins, _all = _frame_times(path)
+    _name, results = fm.compute_per_second_multi(path, list(METRICS), engine=engine)
+    for metric in METRICS:
+        series = results[metric]
+        assert len(series) == max(bins) + 1
+        for index, value in enumerate(series):
+            if index not in bins:
+                assert value is None
+                continue
+            _assert_close(value, _exact(bins[index], metric))
+
+
+@pytest.mark.parametrize("engine", ("python", "numpy"))
+def test_run_summary_within_bound(engine, synthetic_log):
+    _bins, frames = _frame_times(synthetic_log)
+    _name, summary = fm.compute_run_summary(synthetic_log, list(METRICS), engine=engine)
+    for metric in METRICS:
+        _assert_close(summary[metric], _exact(frames, metric))
+
+
+def test_worst_case_values_stay_within_bound():
+    # Values at both ends of every bucket are the worst case
+    for bound in fm._SKETCH_BOUNDS[1000:1400]:
+        for value in (bound, bound / fm._SKETCH_GAMMA * (1 + 1e-12)):
+            sketch = {fm._sketch_bucket(value): 1}
+            ms = fm.sketch_quantile(sketch, 0.99)
+            _assert_close(ms, value)
+            _assert_close(1000.0 / ms, 1000.0 / value)
+
+
+def test_empty_sketch():
+    assert fm.sketch_quantile({}, 0.99) is None
@@ -0,0 +1,81 @@
+"""Per-stage profiling counters and the profile report."""
+
+import csv
+import json
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+
+def _profiled_log(tmp_path):
+    rows = frame_rows(1000)
+    for i in (300, 301, 302):
+        rows[i][1] = "NA"
+    for i in range(200, 205):
+        rows[i][3] = "NA"
+    return write_log(tmp_path / "FrameView_prof.csv", rows)
+
+
+@pytest.mark.parametrize("engine", ("python", "numpy"))
+@pytest.mark.parametrize("jobs", (1, 2))
+def test_profile_counts_rows(tmp_path, engine, jobs):
+    path = _profiled_log(tmp_path)
+    profiles = []
+    fm.compute_series_batch(
+        [path, path],
+        ["avg_fps", "present_fps"],
+        trims=[(1.0, 0.0), (1.0, 0.0)],
+        jobs=jobs,
+        engine=engine,
+        profiles=profiles,
+    )
+    assert len(profiles) == 2
+    info = profiles[0].as_dict()
+    assert info["engine"] == engine
+    assert info["rows"] == 1000
+    assert info["rows_skipped_no_time"] == 3
+    # Frames before 1.5 s fall to trim_start
+    assert info["rows_skipped_trim"] == 100
+    assert info["values_skipped_na"] == {"avg_fps": 5, "present_fps": 0}
+    # The header line is read before the data blocks are counted
+    header_bytes = len(path.read_bytes().split(b"\n", 1)[0]) + 1
+    assert info["bytes_read"] == path.stat().st_size - header_bytes
+    assert info["total_seconds"] >= sum(info["seconds"].values()) - 1e-9
+    # Binning is not timed on its own, and the report says so
+    assert list(info["seconds"]) == [
+        "read",
+        "tokenize",
+        "parse",
+        "finalize",
+        "other/bin (remainder)",
+    ]
+
+
+def test_profile_report_formats(tmp_path):
+    path = _profiled_log(tmp_path)
+    profiles = []
+    fm.compute_series_batch([path], ["avg_fps"], profiles=profiles)
+    out = write_log(tmp_path / "out.csv", [])
+    fm.write_profile_report(tmp_path / "report.json", profiles, [(out, 0.25)], 1.5)
+    report = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    assert report["wall_seconds"] == 1.5
+    assert report["files"][0]["rows"] == 1000
+    assert report["outputs"] == [
+        {"path": str(out), "seconds": 0.25, "bytes": out.stat().st_size}
+    ]
+
+    fm.write_profile_report(tmp_path / "report.csv", profiles, [(out, 0.25)])
+    with (tmp_path / "report.csv").open(newline="", encoding="utf-8") as f:
+        table = list(csv.DictReader(f))
+    assert [row["path"] for row in table] == [str(path), str(out)]
+    assert table[0]["values_skipped_na:avg_fps"] == "5"
+    assert table[1]["write_seconds"] == "0.25"
+    assert float(table[0]["other/bin (remainder)_seconds"]) >= 0.0
+
+
+def test_profiling_does_not_change_results(tmp_path):
+    path = _profiled_log(tmp_path)
+    plain = fm.compute_series_batch([path], ["avg_fps"])
+    assert fm.compute_series_batch([path], ["avg_fps"], profiles=[]) == plain
@@ -0,0 +1,98 @@
+"""Timelines split into segment files with an index."""
+
+import csv
+import sys
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+ROWS = [("a", [float(i) for i in range(25)]), ("b", [None] + [1.5] * 27)]
+
+
+def _read(path):
+    with path.open(newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_wide_segments_join_to_the_unsplit_file(tmp_path):
+    out = tmp_path / "out.csv"
+    entries = list(fm.write_segments(out, ROWS, 10, bin_width=0.5))
+    assert entries == [
+        (tmp_path / "out_part001.csv", 0, 10),
+        (tmp_path / "out_part002.csv", 10, 10),
+        (tmp_path / "out_part003.csv", 20, 5),
+    ]
+    fm.write_series(out, ROWS, 0.5)
+    joined = _read(entries[0][0])
+    for path, _first_bin, _bins in entries[1:]:
+        for line, part in zip(joined, _read(path)):
+            line.extend(part[1:])
+    assert joined == _read(out)
+
+
+def test_long_segments_keep_every_bin(tmp_path):
+    out = tmp_path / "out.csv"
+    entries = list(fm.write_segments(out, ROWS, 10, output_format="long"))
+    assert [bins for _path, _first_bin, bins in entries] == [10, 10, 8]
+    last = _read(entries[-1][0])
+    assert last[1] == ["a", "21", "20"]
+    assert last[-1] == ["b", "28", "1.5"]
+
+
+def test_finished_segments_are_not_rewritten(tmp_path, monkeypatch):
+    out = tmp_path / "out.csv"
+    finished = set()
+    list(fm.write_segments(out, ROWS, 10, finished=finished))
+    assert finished == {tmp_path / "out_part001.csv", tmp_path / "out_part002.csv"}
+    written = []
+    write_series = fm.write_series
+
+    def recording(path, *args):
+        written.append(path.name)
+        write_series(path, *args)
+
+    monkeypatch.setattr(fm, "write_series", recording)
+    longer = [(name, series + [2.0] * 10) for name, series in ROWS]
+    list(fm.write_segments(out, longer, 10, finished=finished))
+    assert written == ["out_part003.csv", "out_part004.csv"]
+
+
+def test_segment_errors_and_empty_rows(tmp_path):
+    with pytest.raises(ValueError, match="at least one bin"):
+        list(fm.write_segments(tmp_path / "out.csv", ROWS, 0))
+    entries = list(fm.write_segments(tmp_path / "out.csv", [], 10))
+    assert entries == [(tmp_path / "out_part001.csv", 0, 0)]
+    assert _read(entries[0][0]) == [["Label"]]
+
+
+def test_index(tmp_path):
+    entries = list(fm.write_segments(tmp_path / "out.csv", ROWS, 10, 0.5))
+    index = tmp_path / "out_segments.csv"
+    assert fm.segment_index_path(tmp_path / "out.csv") == index
+    fm.write_segment_index(index, [(tmp_path / "out.csv", entries)], 0.5)
+    assert _read(index) == [
+        list(fm.SEGMENT_INDEX_FIELDS),
+        ["out.csv", "1", "out_part001.csv", "0", "5", "10"],
+        ["out.csv", "2", "out_part002.csv", "5", "10", "10"],
+        ["out.csv", "3", "out_part003.csv", "10", "12.5", "5"],
+    ]
+
+
+@pytest.mark.parametrize(
+    "options, parts", ((["--segment-seconds", "4"], 3), (["--max-columns", "5"], 2))
+)
+def test_cli_segments(tmp_path, monkeypatch, options, parts):
+    log = write_log(tmp_path / "FrameView_a.csv", frame_rows(1000))
+    out = tmp_path / "out.csv"
+    argv = ["flourish_maker.py", "--dir", str(tmp_path), "--output", str(out)]
+    monkeypatch.setattr(sys, "argv", argv + options)
+    fm.main()
+    assert not out.exists()
+    index = _read(tmp_path / "out_segments.csv")
+    assert [row[2] for row in index[1:]] == [
+        f"out_part{i:03d}.csv" for i in range(1, parts + 1)
+    ]
+    _name, series = fm.compute_per_second_series(log, "avg_fps")
+    assert sum(int(row[5]) for row in index[1:]) == len(series)
@@ -0,0 +1,137 @@
+"""Single-pass per-second series against the original two-pass algorithm."""
+
+import pytest
+
+import flourish_maker as fm
+from conftest import EXAMPLE_LOG, frame_rows, reference_series, write_log
+
+METRICS = (
+    fm.MetricKind.AVG_FPS,
+    fm.MetricKind.PRESENT_FPS,
+    fm.MetricKind.DISPLAY_FPS,
+    "column:GPU0Util(%)",
+)
+TRIMS = ((0.0, 0.0), (1.5, 0.0), (0.0, 2.25), (1.0, 1.0), (0.3, 50.0))
+
+
+@pytest.mark.parametrize("metric", METRICS)
+@pytest.mark.parametrize("fps_mode", ("per-frame-mean", "count"))
+@pytest.mark.parametrize("trim", TRIMS)
+def test_example_log_matches_reference(metric, fps_mode, trim):
+    _name, series = fm.compute_per_second_series(
+        EXAMPLE_LOG,
+        metric,
+        fps_mode=fps_mode,
+        trim_start=trim[0],
+        trim_end=trim[1],
+        engine="python",
+    )
+    assert series == reference_series(EXAMPLE_LOG, metric, fps_mode, *trim)
+
+
+@pytest.mark.parametrize("trim", TRIMS)
+def test_synthetic_log_matches_reference(synthetic_log, trim):
+    _name, series = fm.compute_per_second_series(
+        synthetic_log, "avg_fps", trim_start=trim[0], trim_end=trim[1], engine="python"
+    )
+    assert series == reference_series(synthetic_log, "avg_fps", "per-frame-mean", *trim)
+
+
+def test_time_going_backwards_matches_reference(tmp_path):
+    rows = frame_rows(600)
+    # An out-of-order row late in the log holds the true minimum time
+    rows[450][1] = "0.010000"
+    path = write_log(tmp_path / "nonmono.csv", rows)
+    for trim in TRIMS:
+        _name, series = fm.compute_per_second_series(
+            path, "avg_fps", trim_start=trim[0], trim_end=trim[1], engine="python"
+        )
+        assert series == reference_series(path, "avg_fps", "per-frame-mean", *trim)
+
+
+def test_rows_without_time_or_value_are_skipped(tmp_path):
+    rows = frame_rows(300)
+    rows[10][1] = "NA"
+    rows[20][2] = ""
+    rows[30] = rows[30][:1]
+    path = write_log(tmp_path / "gaps.csv", rows)
+    _name, series = fm.compute_per_second_series(path, "present_fps", engine="python")
+    assert series == reference_series(path, "present_fps")
+
+
+def test_unterminated_last_row_is_read(tmp_path):
+    path = write_log(tmp_path / "nonl.csv", frame_rows(250))
+    path.write_bytes(path.read_bytes().rstrip(b"\n"))
+    _name, series = fm.compute_per_second_series(path, "avg_fps", engine="python")
+    assert series == reference_series(path, "avg_fps")
+
+
+def test_empty_inputs_give_empty_series(tmp_path):
+    header_only = write_log(tmp_path / "header.csv", [])
+    empty = tmp_path / "empty.csv"
+    empty.write_bytes(b"")
+    for path in (header_only, empty):
+        assert fm.compute_per_second_series(path, "avg_fps")[1] == []
+    # A trim longer than the log leaves nothing
+    path = write_log(tmp_path / "short.csv", frame_rows(100))
+    assert fm.compute_per_second_series(path, "avg_fps", trim_start=5.0)[1] == []
+
+
+def test_missing_time_column_raises(tmp_path):
+    path = write_log(
+        tmp_path / "notime.csv",
+        [["Game.exe", 16.6]],
+        header=["Application", "MsBetweenPresents"],
+    )
+    with pytest.raises(ValueError, match="TimeInSeconds"):
+        fm.compute_per_second_series(path, "present_fps")
+
+
+def test_multi_metric_scan_matches_single_metric_runs(synthetic_log):
+    metrics = [
+        "avg_fps",
+        "display_fps",
+        "present_fps",
+        "column:GPU0Util(%)",
+        "frametime_p99",
+    ]
+    _name, results = fm.compute_per_second_multi(
+        synthetic_log, metrics, trim_start=1.0, trim_end=0.5
+    )
+    assert list(results) == metrics
+    for metric in metrics:
+        _name, single = fm.compute_per_second_series(
+            synthetic_log, metric, trim_start=1.0, trim_end=0.5
+        )
+        assert results[metric] == single
+
+
+@pytest.mark.parametrize("bin_width", (0.25, 2.5, 60.0))
+@pytest.mark.parametrize("engine", ("python", "numpy"))
+@pytest.mark.parametrize("fps_mode", ("per-frame-mean", "count"))
+def test_bin_width_matches_reference(synthetic_log, bin_width, engine, fps_mode):
+    for metric in ("avg_fps", "column:GPU0Util(%)"):
+        _name, series = fm.compute_per_second_series(
+            synthetic_log,
+            metric,
+            fps_mode=fps_mode,
+            trim_start=0.4,
+            engine=engine,
+            bin_width=bin_width,
+        )
+        assert series == reference_series(
+            synthetic_log, metric, fps_mode, 0.4, 0.0, bin_width
+        )
+
+
+@pytest.mark.parametrize("bin_width", (0.0, -1.0, float("inf"), float("nan")))
+def test_invalid_bin_width_raises(tmp_path, bin_width):
+    path = write_log(tmp_path / "run.csv", frame_rows(100))
+    with pytest.raises(ValueError, match="Bin width"):
+        fm.compute_per_second_series(path, "avg_fps", bin_width=bin_width)
+
+
+def test_bin_labels_are_bin_end_times():
+    assert fm.bin_labels(5, 0.25) == ["0.25", "0.5", "0.75", "1", "1.25"]
+    assert fm.bin_labels(3, 60.0) == ["60", "120", "180"]
+    assert fm.bin_labels(3) == ["1", "2", "3"]
@@ -0,0 +1,51 @@
+"""Tail-seek lookup of the last timestamp used for trim_end."""
+
+import flourish_maker as fm
+from conftest import EXAMPLE_LOG, frame_rows, write_log
+
+T_IDX = 1
+
+
+def test_last_timestamp_of_example_log():
+    header = EXAMPLE_LOG.read_text(encoding="utf-8").splitlines()[0].split(",")
+    t_idx = header.index("TimeInSeconds")
+    last_line = EXAMPLE_LOG.read_text(encoding="utf-8").splitlines()[-1]
+    expected = float(last_line.split(",")[t_idx])
+    assert fm.read_last_timestamp(EXAMPLE_LOG, t_idx) == expected
+
+
+def test_partial_last_row_is_ignored(tmp_path):
+    path = write_log(tmp_path / "live.csv", frame_rows(50))
+    with path.open("ab") as f:
+        f.write(b"Game.exe,99.1")
+    assert fm.read_last_timestamp(path, T_IDX) == float(frame_rows(50)[-1][1])
+
+
+def test_trailing_rows_without_time_are_skipped(tmp_path):
+    rows = frame_rows(50)
+    rows[-1][1] = "NA"
+    rows[-2][1] = ""
+    path = write_log(tmp_path / "na.csv", rows, newline="\r\n")
+    assert fm.read_last_timestamp(path, T_IDX) == float(rows[-3][1])
+
+
+def test_row_longer_than_the_read_chunk(tmp_path):
+    rows = frame_rows(20)
+    rows[-1][0] = "x" * 5000
+    path = write_log(tmp_path / "wide.csv", rows)
+    assert fm.read_last_timestamp(path, T_IDX, chunk_size=64) == float(rows[-1][1])
+
+
+def test_no_timed_rows(tmp_path):
+    rows = frame_rows(5)
+    for row in rows:
+        row[1] = "NA"
+    path = write_log(tmp_path / "untimed.csv", rows)
+    assert fm.read_last_timestamp(path, T_IDX, chunk_size=32) is None
+    assert fm.read_time_span(path) is None
+
+
+def test_time_span(tmp_path):
+    rows = frame_rows(300, start=2.0)
+    path = write_log(tmp_path / "span.csv", rows)
+    assert fm.read_time_span(path) == (float(rows[0][1]), float(rows[-1][1]))
@@ -0,0 +1,67 @@
+"""Column-projected fast tokenizer against the csv module."""
+
+import csv
+
+import pytest
+
+import flourish_bench
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+COLUMNS = [1, 2, 4]
+
+
+def _reference_values(path, col_idxs):
+    with path.open("r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return [
+            tuple(fm.parse_float(row[i]) if i < len(row) else None for i in col_idxs)
+            for row in reader
+        ]
+
+
+def _ragged_rows():
+    rows = frame_rows(400)
+    rows[3][2] = "NA"
+    rows[5][4] = ""
+    rows[7] = rows[7][:2]
+    rows[9][2] = " 16.5 "
+    return rows
+
+
+@pytest.mark.parametrize("newline", ("\n", "\r\n", "\r"))
+@pytest.mark.parametrize("chunk_bytes", (37, fm._FAST_CHUNK_BYTES))
+def test_values_match_csv_module(tmp_path, monkeypatch, newline, chunk_bytes):
+    # Tiny chunks make lines straddle read boundaries
+    monkeypatch.setattr(fm, "_FAST_CHUNK_BYTES", chunk_bytes)
+    path = write_log(tmp_path / "log.csv", _ragged_rows(), newline=newline)
+    values = list(fm._fast_row_values(path, COLUMNS))
+    assert values == _reference_values(path, COLUMNS)
+
+
+def test_quoted_comma_decimals(tmp_path, monkeypatch):
+    monkeypatch.setattr(fm, "_FAST_CHUNK_BYTES", 4096)
+    path = tmp_path / "comma.csv"
+    flourish_bench.generate_log(path, 2_000, seed=1, decimal_comma=True)
+    header = path.open(encoding="utf-8").readline().rstrip("\n").split(",")
+    col_idxs = [header.index(n) for n in ("TimeInSeconds", "MsBetweenPresents")]
+    values = list(fm._fast_row_values(path, col_idxs))
+    assert values == _reference_values(path, col_idxs)
+    assert all(v[0] is not None for v in values)
+
+
+def test_unterminated_last_line(tmp_path):
+    path = write_log(tmp_path / "nonl.csv", _ragged_rows())
+    path.write_bytes(path.read_bytes()[:-1])
+    assert list(fm._fast_row_values(path, COLUMNS)) == _reference_values(
+        path, COLUMNS
+    )
+
+
+def test_data_rows_drop_line_endings(tmp_path):
+    rows = frame_rows(5)
+    path = write_log(tmp_path / "crlf.csv", rows, newline="\r\n")
+    assert list(fm._fast_data_rows(path)) == [
+        ",".join(str(v) for v in row) for row in rows
+    ]
@@ -0,0 +1,109 @@
+"""Trimmed copies of a log: byte-range copy and the row-by-row rewrite."""
+
+import gzip
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+
+def _expected(path, trim_start, trim_end):
+    """Header plus every line timed inside the trim range, as in the source."""
+    lines = path.read_bytes().splitlines(keepends=True)
+    # TimeInSeconds is the fourth field from the end, after any quoted name
+    times = [float(line.rsplit(b",", 4)[1]) for line in lines[1:]]
+    start = min(times) + trim_start
+    end = max(times) - trim_end
+    kept = [line for t, line in zip(times, lines[1:]) if start <= t <= end]
+    return lines[0] + b"".join(kept)
+
+
+@pytest.mark.parametrize("newline", ("\n", "\r\n"))
+@pytest.mark.parametrize("trim", ((0.0, 0.0), (1.0, 2.5), (0.123, 0.0)))
+def test_copy_is_byte_identical(tmp_path, newline, trim):
+    rows = frame_rows(1000)
+    # Quoted fields are copied as written too
+    rows[400][0] = '"Game, the sequel.exe"'
+    log = write_log(tmp_path / "FrameView_a.csv", rows, newline=newline)
+    out = tmp_path / "out.csv"
+    assert fm.trim_csv_passthrough(log, out, *trim)
+    assert out.read_bytes() == _expected(log, *trim)
+
+
+@pytest.mark.parametrize("newline", ("\n", "\r\n"))
+@pytest.mark.parametrize("index, t", ((500, "100.000000"), (700, "0.000000")))
+def test_single_out_of_order_row(tmp_path, newline, index, t):
+    # One row beyond the real bounds moves the trim range even though no
+    # binary search probe lands on it
+    rows = frame_rows(1000)
+    rows[index][1] = t
+    log = write_log(tmp_path / "FrameView_a.csv", rows, newline=newline)
+    out = tmp_path / "out.csv"
+    assert fm.trim_csv_passthrough(log, out, 1.0, 1.0)
+    assert out.read_bytes() == _expected(log, 1.0, 1.0)
+
+
+def test_timeless_rows_inside_the_range_are_kept(tmp_path):
+    rows = frame_rows(1000)
+    for i in (3, 500, 501, 998):
+        rows[i][1] = "NA"
+    log = write_log(tmp_path / "FrameView_a.csv", rows)
+    out = tmp_path / "out.csv"
+    assert fm.trim_csv_passthrough(log, out, 0.5, 0.5)
+    lines = out.read_bytes().splitlines(keepends=True)
+    source = log.read_bytes().splitlines(keepends=True)
+    # Frames 50..949 are in range; the NA rows at 500 and 501 come along
+    assert lines == source[:1] + source[51:951]
+    assert sum(b",NA," in line for line in lines) == 2
+
+
+def test_empty_range_writes_nothing(tmp_path):
+    log = write_log(tmp_path / "FrameView_a.csv", frame_rows(1000))
+    out = tmp_path / "out.csv"
+    assert not fm.trim_csv_passthrough(log, out, 6.0, 6.0)
+    assert not out.exists()
+    untimed = write_log(
+        tmp_path / "FrameView_b.csv", [["Game.exe", "NA", 1.0, 1.0, 0]] * 3
+    )
+    assert not fm.trim_csv_passthrough(untimed, out)
+    assert not out.exists()
+
+
+@pytest.mark.parametrize("index", (120, 199_000))
+def test_out_of_order_rows_near_the_range_edges_of_long_logs(tmp_path, index):
+    # Far longer than the checked windows; the row sits just inside the kept
+    # range but is timed before it
+    rows = frame_rows(200_000)
+    rows[index][1] = "0.700000"
+    log = write_log(tmp_path / "FrameView_a.csv", rows)
+    assert log.stat().st_size > 4 * fm._TRIM_CHECK_BYTES
+    out = tmp_path / "out.csv"
+    assert fm.trim_csv_passthrough(log, out, 1.0, 1.0)
+    assert out.read_bytes() == _expected(log, 1.0, 1.0)
+
+
+@pytest.mark.parametrize("newline", ("\n", "\r\n"))
+@pytest.mark.parametrize("cached", (False, True))
+def test_compressed_log_matches_plain_trim(tmp_path, newline, cached):
+    rows = frame_rows(1000)
+    rows[400][0] = '"Game, the sequel.exe"'
+    # Rows without a time are kept between kept rows either way
+    for i in (3, 500, 501, 998):
+        rows[i][1] = "NA"
+    log = write_log(tmp_path / "FrameView_a.csv", rows, newline=newline)
+    packed = tmp_path / "FrameView_a.csv.gz"
+    packed.write_bytes(gzip.compress(log.read_bytes()))
+    cache = fm.ParseCache(tmp_path / "cache") if cached else None
+
+    assert fm.trim_csv_passthrough(log, tmp_path / "plain.csv", 1.0, 2.5)
+    assert fm.trim_csv_passthrough(
+        packed, tmp_path / "packed.csv", 1.0, 2.5, cache=cache
+    )
+    assert (tmp_path / "packed.csv").read_bytes() == (
+        tmp_path / "plain.csv"
+    ).read_bytes()
+    lines = (tmp_path / "packed.csv").read_bytes().splitlines()
+    # Frames 100..749 are in range, two of them without a time
+    assert len(lines) == 1 + 650
+    assert sum(b",NA," in line for line in lines) == 2
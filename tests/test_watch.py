@@ -0,0 +1,70 @@
+"""Directory watch daemon: only new or changed logs are parsed again."""
+
+import csv
+import os
+import sys
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+
+def _row_names(path):
+    with path.open(newline="", encoding="utf-8") as f:
+        return [row[0] for row in list(csv.reader(f))[1:]]
+
+
+def test_watch_parses_only_settled_changes(tmp_path, monkeypatch):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    out = log_dir / "FrameView_out.csv"
+    log_a = write_log(log_dir / "FrameView_A.csv", frame_rows(300))
+    log_b = log_dir / "FrameView_B.csv"
+
+    parsed = []
+    compute = fm.compute_series_batch
+
+    def recording_batch(paths, *args, **kwargs):
+        parsed.append(sorted(p.name for p in paths))
+        return compute(paths, *args, **kwargs)
+
+    def touch(path, rows):
+        write_log(path, rows)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    outputs = []
+    # One action after each poll; the last one stops the daemon
+    actions = [
+        lambda: None,
+        lambda: outputs.append(_row_names(out)),
+        lambda: write_log(log_b, frame_rows(200, app="Other.exe")),
+        lambda: None,
+        lambda: outputs.append(_row_names(out)),
+        lambda: touch(log_a, frame_rows(500)),
+        lambda: None,
+        lambda: log_b.unlink(),
+        lambda: outputs.append(_row_names(out)),
+    ]
+
+    def sleep(_seconds):
+        if not actions:
+            raise KeyboardInterrupt
+        actions.pop(0)()
+
+    monkeypatch.setattr(fm, "compute_series_batch", recording_batch)
+    monkeypatch.setattr(fm.time, "sleep", sleep)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["flourish_maker.py", "--dir", str(log_dir), "--output", str(out), "--watch"],
+    )
+    fm.main()
+
+    # A log is parsed once it stayed unchanged for a poll; the output
+    # itself is never picked up as an input
+    assert parsed == [
+        ["FrameView_A.csv"],
+        ["FrameView_B.csv"],
+        ["FrameView_A.csv"],
+    ]
+    assert [len(names) for names in outputs] == [1, 2, 1]
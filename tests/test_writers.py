@@ -0,0 +1,101 @@
+"""Output layouts: wide, long, JSON and columnar."""
+
+import csv
+import json
+import math
+import random
+import sys
+
+import pytest
+
+import flourish_maker as fm
+from conftest import frame_rows, write_log
+
+ROWS = [("a", [60.0, None, 59.1256]), ("a", [1.0, 2.0, 3.0, 4.0])]
+
+
+def test_wide_layout(tmp_path):
+    out = tmp_path / "out.csv"
+    fm.write_series(out, ROWS, 0.5, "wide", first_bin=2)
+    assert out.read_bytes() == b"Label,1.5,2,2.5\r\na,60,0,59.126\r\na_2,1,2,3\r\n"
+    fm.write_flourish_wide_csv(out, [])
+    assert out.read_bytes() == b"Label\r\n"
+
+
+def test_long_layout_streams_rows(tmp_path):
+    out = tmp_path / "out.csv"
+    fm.write_series(out, iter(ROWS), 0.5, "long", first_bin=2)
+    assert out.read_text(encoding="utf-8").splitlines() == [
+        "Label,Time,Value",
+        "a,1.5,60",
+        "a,2,",
+        "a,2.5,59.126",
+        "a_2,1.5,1",
+        "a_2,2,2",
+        "a_2,2.5,3",
+        "a_2,3,4",
+    ]
+
+
+def test_json_layout(tmp_path):
+    out = tmp_path / "out.json"
+    fm.write_series(out, iter(ROWS), 0.5, "json", first_bin=2)
+    assert json.loads(out.read_text(encoding="utf-8")) == {
+        "bin_width": 0.5,
+        "first_bin": 2,
+        "series": [
+            {"label": "a", "values": [60, None, 59.126]},
+            {"label": "a_2", "values": [1, 2, 3, 4]},
+        ],
+    }
+
+
+def test_columnar_round_trip(tmp_path):
+    rng = random.Random(4)
+    rows = [
+        (
+            f"run {i}",
+            [
+                rng.choice((None, rng.uniform(-1e6, 1e6), rng.random() * 1e-300))
+                for _ in range(rng.randint(0, 5000))
+            ],
+        )
+        for i in range(6)
+    ]
+    rows.append(("run 0", [math.inf, -math.inf, 0.1]))
+    out = tmp_path / "out.fvc"
+    fm.write_series(out, iter(rows), 0.25, "columnar", first_bin=7)
+    read_rows, bin_width, first_bin = fm.read_columnar(out)
+    assert read_rows == rows[:-1] + [("run 0_2", rows[-1][1])]
+    assert (bin_width, first_bin) == (0.25, 7)
+
+
+def test_columnar_rejects_other_files(tmp_path):
+    out = tmp_path / "out.csv"
+    fm.write_series(out, ROWS, 1.0, "wide")
+    with pytest.raises(ValueError, match="Not a columnar output file"):
+        fm.read_columnar(out)
+    (tmp_path / "empty.fvc").write_bytes(b"")
+    with pytest.raises(ValueError, match="Not a columnar output file"):
+        fm.read_columnar(tmp_path / "empty.fvc")
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="wide, long, json, columnar"):
+        fm.write_series(tmp_path / "out.xml", ROWS, 1.0, "xml")
+
+
+def test_cli_formats_hold_the_same_series(tmp_path, monkeypatch):
+    write_log(tmp_path / "FrameView_a.csv", frame_rows(800))
+    write_log(tmp_path / "FrameView_b.csv", frame_rows(600, fps=60.0))
+    outputs = {}
+    for layout, suffix in (("wide", ".csv"), ("columnar", ".fvc")):
+        outputs[layout] = tmp_path / f"out{suffix}"
+        argv = ["flourish_maker.py", "--dir", str(tmp_path), "--format", layout]
+        monkeypatch.setattr(sys, "argv", argv + ["--output", str(outputs[layout])])
+        fm.main()
+    rows, _bin_width, _first_bin = fm.read_columnar(outputs["columnar"])
+    with outputs["wide"].open(newline="", encoding="utf-8") as f:
+        wide = list(csv.reader(f))[1:]
+    n = len(wide[0]) - 1
+    assert [[name] + fm.format_values(series[:n]) for name, series in rows] == wide